@@ -0,0 +1,77 @@
+"""
+Cell strings of the real schedule document in `tests/test_schedule.xlsx` for the formatter benchmarks.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from openpyxl import load_workbook
+
+from rtu_schedule_parser.constants import RE_GROUP_NAME
+
+__all__ = [
+    "TEST_SCHEDULE_PATH",
+    "Corpus",
+    "load_corpus",
+]
+
+TEST_SCHEDULE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "test_schedule.xlsx"
+)
+
+# Number of rows in the semester table: 7 lessons of both weeks for each of 6 weekdays
+_SEMESTER_ROWS = 6 * 7 * 2
+
+
+@dataclass
+class Corpus:
+    """Cell strings of the real schedule."""
+
+    # Cells of each group column: rows of (subject, type, teacher, room)
+    groups: list[list[tuple[str, str, str, str]]]
+
+    def get_cells(self, column: int) -> list[str]:
+        """Get all non-empty cells of the column (0 - subject, 1 - type, 2 - teacher, 3 - room)."""
+        return [row[column] for group in self.groups for row in group if row[column]]
+
+
+def load_corpus(path: str = TEST_SCHEDULE_PATH) -> Corpus:
+    """Read the cells of all groups from the real schedule document."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+
+    groups = []
+    for worksheet in workbook.worksheets:
+        rows = list(worksheet.iter_rows(values_only=True))
+        group_row = next(
+            (
+                i
+                for i, row in enumerate(rows[:20])
+                if any(
+                    isinstance(value, str)
+                    and RE_GROUP_NAME.match(value.replace(" ", ""))
+                    for value in row
+                )
+            ),
+            None,
+        )
+        if group_row is None:
+            continue
+
+        data_rows = rows[group_row + 2 : group_row + 2 + _SEMESTER_ROWS]
+        for column, value in enumerate(rows[group_row]):
+            if isinstance(value, str) and RE_GROUP_NAME.match(value.replace(" ", "")):
+                groups.append(
+                    [
+                        tuple(
+                            str(row[column + i] or "") if column + i < len(row) else ""
+                            for i in range(4)
+                        )
+                        for row in data_rows
+                    ]
+                )
+
+    workbook.close()
+
+    return Corpus(groups)
@@ -0,0 +1,379 @@
+"""
+Benchmarks of the parsing, formatting and export hot paths.
+
+Each benchmark is run several times and the best time is compared with the baseline stored in `baselines.json`.
+If any benchmark is slower than its baseline by more than the threshold, the script exits with code 1.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --filter parse.semester --sizes 10,100
+    python benchmarks/run.py --update-baselines
+
+Baselines depend on the machine, so they should be updated (with ``--update-baselines``) on the machine where the
+benchmarks are run for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from corpus import Corpus, load_corpus  # noqa: E402
+
+from rtu_schedule_parser import ExcelScheduleParser  # noqa: E402
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType  # noqa: E402
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser  # noqa: E402
+from rtu_schedule_parser.excel_formatter import ExcelFormatter  # noqa: E402
+from rtu_schedule_parser.schedule_data import ScheduleData  # noqa: E402
+from rtu_schedule_parser.serialization import to_json  # noqa: E402
+from rtu_schedule_parser.utils import Period  # noqa: E402
+from rtu_schedule_parser.utils.academic_calendar import MAX_WEEKS  # noqa: E402
+from rtu_schedule_parser.utils.workbook_generator import (  # noqa: E402
+    generate_exam_workbook,
+    generate_semester_workbook,
+)
+
+BASELINES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines.json"
+)
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 3
+
+_GROUPS_PER_SHEET = 50
+
+# Exams and days of the long exam session workbooks: 93 rows of the table for each group
+_SESSION_EXAMS = 15
+_SESSION_DAYS = 31
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Prepares the data and returns the measured function. Preparation is not measured.
+    setup: Callable[[], Callable[[], object]]
+    # Number of calls of the measured function in one run
+    number: int = 1
+
+
+class _Context:
+    """Workbooks and parsed schedules shared by the benchmarks. Everything is created on first use."""
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+
+    @functools.cached_property
+    def corpus(self) -> Corpus:
+        return load_corpus()
+
+    @functools.lru_cache(maxsize=None)
+    def get_workbook(self, schedule_type: ScheduleType, groups: int) -> str:
+        path = os.path.join(
+            self._directory, f"{schedule_type.name.lower()}_{groups}.xlsx"
+        )
+
+        if schedule_type == ScheduleType.EXAM_SESSION:
+            generate_exam_workbook(path, groups, _GROUPS_PER_SHEET)
+        else:
+            generate_semester_workbook(path, groups, _GROUPS_PER_SHEET)
+
+        return path
+
+    @functools.lru_cache(maxsize=None)
+    def get_session_workbook(self, groups: int) -> str:
+        path = os.path.join(self._directory, f"session_{groups}.xlsx")
+        generate_exam_workbook(
+            path,
+            groups,
+            _GROUPS_PER_SHEET,
+            exams=_SESSION_EXAMS,
+            days=_SESSION_DAYS,
+        )
+
+        return path
+
+    def parse(self, schedule_type: ScheduleType, groups: int) -> ScheduleData:
+        path = self.get_workbook(schedule_type, groups)
+
+        if schedule_type == ScheduleType.EXAM_SESSION:
+            parser = ExcelExamScheduleParser(
+                path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+            )
+        else:
+            parser = ExcelScheduleParser(
+                path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+            )
+
+        return parser.parse(force=True)
+
+    @functools.lru_cache(maxsize=None)
+    def get_schedule_data(
+        self, schedule_type: ScheduleType, groups: int
+    ) -> ScheduleData:
+        return self.parse(schedule_type, groups)
+
+
+def _get_benchmarks(context: _Context, sizes: tuple[int, ...]) -> list[Benchmark]:
+    benchmarks = []
+
+    schedule_types = {
+        "semester": ScheduleType.SEMESTER,
+        "exam": ScheduleType.EXAM_SESSION,
+    }
+
+    for type_name, schedule_type in schedule_types.items():
+        for size in sizes:
+
+            def parse(schedule_type=schedule_type, size=size):
+                context.get_workbook(schedule_type, size)
+                return lambda: context.parse(schedule_type, size)
+
+            benchmarks.append(Benchmark(f"parse.{type_name}[{size}]", parse))
+
+    for size in sizes:
+
+        def parse_session(size=size):
+            path = context.get_session_workbook(size)
+            return lambda: ExcelExamScheduleParser(
+                path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+            ).parse(force=True)
+
+        benchmarks.append(Benchmark(f"parse.exam_session[{size}]", parse_session))
+
+    # Formatter methods are measured on all cells of the real schedule
+    formatter = ExcelFormatter()
+
+    def subjects():
+        cells = context.corpus.get_cells(0)
+        return lambda: [formatter.get_lessons(cell) for cell in cells]
+
+    def weeks():
+        # Odd rows of the table are the rows of the even weeks
+        cells = [
+            (row[0], i % 2 == 1)
+            for group in context.corpus.groups
+            for i, row in enumerate(group)
+            if row[0]
+        ]
+        return lambda: [
+            formatter.get_weeks(cell, is_even, MAX_WEEKS) for cell, is_even in cells
+        ]
+
+    def formatter_method(method: Callable[[str], object], column: int):
+        def setup():
+            cells = context.corpus.get_cells(column)
+            return lambda: [method(cell) for cell in cells]
+
+        return setup
+
+    def teachers():
+        cells = context.corpus.get_cells(2)
+
+        # Parsed teachers are cached by the formatter, so each run starts with a new one like each parsed document
+        def run():
+            teachers_formatter = ExcelFormatter()
+            return [teachers_formatter.get_teachers(cell) for cell in cells]
+
+        return run
+
+    def subject_cells():
+        cells = [
+            (row[0], i % 2 == 1)
+            for group in context.corpus.groups
+            for i, row in enumerate(group)
+            if row[0]
+        ]
+        return lambda: [
+            formatter.parse_subject_cell(cell, is_even, MAX_WEEKS)
+            for cell, is_even in cells
+        ]
+
+    benchmarks += [
+        Benchmark("formatter.get_lessons", subjects, number=5),
+        Benchmark("formatter.get_weeks", weeks, number=5),
+        Benchmark("formatter.parse_subject_cell", subject_cells, number=5),
+        Benchmark(
+            "formatter.get_types", formatter_method(formatter.get_types, 1), number=5
+        ),
+        Benchmark("formatter.get_teachers", teachers, number=5),
+        Benchmark(
+            "formatter.get_rooms", formatter_method(formatter.get_rooms, 3), number=5
+        ),
+    ]
+
+    for size in sizes:
+
+        def generate_dataframe(size=size):
+            data = context.get_schedule_data(ScheduleType.SEMESTER, size)
+
+            def func():
+                # Dataframes of the schedules are cached, so they are dropped to be generated on each call
+                for schedule in data.get_schedule():
+                    schedule._dataframe = None
+                data.generate_dataframe()
+
+            return func
+
+        def get_rooms(size=size):
+            return context.get_schedule_data(ScheduleType.SEMESTER, size).get_rooms
+
+        def get_groups(size=size):
+            return context.get_schedule_data(ScheduleType.SEMESTER, size).get_groups
+
+        def get_teachers(size=size):
+            return context.get_schedule_data(ScheduleType.SEMESTER, size).get_teachers
+
+        def find_conflicts(size=size):
+            return context.get_schedule_data(ScheduleType.SEMESTER, size).find_conflicts
+
+        def get_unique_lessons(size=size):
+            data = context.get_schedule_data(ScheduleType.SEMESTER, size)
+            return data.get_unique_lessons
+
+        def export_json(size=size):
+            schedule = context.get_schedule_data(
+                ScheduleType.SEMESTER, size
+            ).get_schedule()
+            return lambda: [to_json(item) for item in schedule]
+
+        benchmarks += [
+            Benchmark(f"data.generate_dataframe[{size}]", generate_dataframe),
+            Benchmark(f"data.get_rooms[{size}]", get_rooms),
+            Benchmark(f"data.get_groups[{size}]", get_groups, number=10),
+            Benchmark(f"data.get_teachers[{size}]", get_teachers),
+            Benchmark(f"data.find_conflicts[{size}]", find_conflicts),
+            Benchmark(f"data.get_unique_lessons[{size}]", get_unique_lessons),
+            Benchmark(f"export.json[{size}]", export_json),
+        ]
+
+    return benchmarks
+
+
+def _measure(benchmark: Benchmark, repeat: int) -> float:
+    """Returns the best time of one call of the measured function in seconds."""
+    func = benchmark.setup()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(benchmark.number):
+            func()
+        best = min(best, (time.perf_counter() - start) / benchmark.number)
+
+    return best
+
+
+def _load_baselines() -> dict[str, float]:
+    if not os.path.exists(BASELINES_PATH):
+        return {}
+
+    with open(BASELINES_PATH, "r") as f:
+        return json.load(f)
+
+
+def _save_baselines(baselines: dict[str, float]) -> None:
+    with open(BASELINES_PATH, "w") as f:
+        json.dump(dict(sorted(baselines.items())), f, indent=2)
+        f.write("\n")
+
+
+def _format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument(
+        "--filter", help="Run only benchmarks whose names contain the substring"
+    )
+    arg_parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="Comma-separated numbers of groups in the workbooks",
+    )
+    arg_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="Number of runs of each benchmark",
+    )
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown relative to the baseline (0.25 - 25%%)",
+    )
+    arg_parser.add_argument(
+        "--update-baselines",
+        action="store_true",
+        help="Store the results as the new baselines",
+    )
+    args = arg_parser.parse_args(argv)
+
+    # The parsers log every parsed group
+    logging.disable(logging.CRITICAL)
+
+    sizes = tuple(int(size) for size in args.sizes.split(","))
+    baselines = _load_baselines()
+    results = {}
+    regressions = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        context = _Context(directory)
+
+        for benchmark in _get_benchmarks(context, sizes):
+            if args.filter and args.filter not in benchmark.name:
+                continue
+
+            seconds = _measure(benchmark, args.repeat)
+            results[benchmark.name] = seconds
+
+            baseline = baselines.get(benchmark.name)
+            if baseline is None:
+                status = "new"
+            else:
+                ratio = seconds / baseline
+                status = f"{ratio:.2f}x"
+                if ratio > 1 + args.threshold:
+                    status += " REGRESSION"
+                    regressions.append(benchmark.name)
+
+            print(
+                f"{benchmark.name:<36} {_format_time(seconds):>10}  {status}",
+                flush=True,
+            )
+
+    if args.update_baselines:
+        baselines.update(results)
+        _save_baselines(baselines)
+        print(f"Baselines saved to {BASELINES_PATH}")
+        return 0
+
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) are slower than the baseline by more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+from rtu_schedule_parser import ExcelScheduleParser
+from rtu_schedule_parser.constants import Campus, RoomType, ScheduleType
+from rtu_schedule_parser.downloader import ScheduleDownloader
+from rtu_schedule_parser.occupancy import RoomOccupancyIndex
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+
+if __name__ == "__main__":
+    # Initialize downloader with default directory to save files
+    downloader = ScheduleDownloader()
+
+    # Get semester schedule documents of all institutes
+    all_docs = downloader.get_documents(specific_schedule_types={ScheduleType.SEMESTER})
+
+    # Download only if they are not downloaded yet.
+    downloaded = downloader.download_all(all_docs)
+    print(f"Downloaded {len(downloaded)} files")
+
+    # Create schedule with downloaded files
+    schedules = None  # type: ScheduleData | None
+    for doc, doc_path, is_downloaded in downloaded:
+        parser = ExcelScheduleParser(doc_path, doc.period, doc.institute, doc.degree)
+        if schedules is None:
+            schedules = parser.parse(force=True)
+        else:
+            schedules.extend(parser.parse(force=True).get_schedule())
+
+    index = RoomOccupancyIndex(schedules)
+
+    # Which computer classes on campus В-78 are free on Tuesday, pair 3 of week 7?
+    free_rooms = index.get_free_rooms(
+        Weekday.TUESDAY, 3, 7, campus=Campus.V_78, room_type=RoomType.COMPUTERS
+    )
+    print(f"Free rooms: {', '.join(room.name for room in free_rooms)}")
+
+    # Number of occupied rooms on campus В-78 for each lesson slot of week 7
+    for (weekday, num), occupied in index.get_heatmap(
+        week=7, campus=Campus.V_78
+    ).items():
+        print(f"{weekday.value[1]}, {num} пара: {occupied}")
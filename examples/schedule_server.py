@@ -0,0 +1,32 @@
+import threading
+
+import uvicorn
+
+from rtu_schedule_parser.constants import ScheduleType
+from rtu_schedule_parser.downloader import ScheduleWatcher
+from rtu_schedule_parser.server import ScheduleServer
+
+# Interval between checks for new schedule documents, in seconds
+UPDATE_INTERVAL = 15 * 60
+
+if __name__ == "__main__":
+    watcher = ScheduleWatcher(
+        interval=UPDATE_INTERVAL, schedule_types={ScheduleType.SEMESTER}
+    )
+    # Download and parse all documents
+    watcher.poll_once()
+
+    server = ScheduleServer(watcher.get_schedule_data(ScheduleType.SEMESTER))
+
+    def on_change(change):
+        # Only changed documents are parsed again. The new snapshot is swapped while requests are served.
+        print(
+            f"Updated: {change.updated}, added: {change.added}, removed: {change.removed}"
+        )
+        server.update(watcher.get_schedule_data(ScheduleType.SEMESTER))
+
+    watcher.add_listener(on_change)
+    threading.Thread(target=watcher.run, daemon=True).start()
+
+    # Try: curl http://127.0.0.1:8000/groups/ИКБО-01-20
+    uvicorn.run(server, host="127.0.0.1", port=8000)
@@ -0,0 +1,5 @@
+import sys
+
+from rtu_schedule_parser.cli import main
+
+sys.exit(main())
@@ -0,0 +1,344 @@
+"""
+Apache Arrow and Parquet support for schedule data.
+
+Tables are built directly from the `Lesson` and `Exam` objects, without an intermediate pandas dataframe. Repeated
+strings (groups, lesson names, teachers, rooms, etc.) are stored as dictionary-encoded columns, and lesson weeks are
+stored as `list<int8>`. Empty lessons and exams are not exported.
+
+This module requires `pyarrow` to be installed (``pip install rtu-schedule-parser[arrow]``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from rtu_schedule_parser.constants import (
+    Campus,
+    Degree,
+    ExamType,
+    Institute,
+    RoomType,
+    ScheduleType,
+    get_lesson_type_by_value,
+)
+from rtu_schedule_parser.schedule import (
+    Exam,
+    ExamEmpty,
+    ExamsSchedule,
+    Lesson,
+    LessonEmpty,
+    LessonsSchedule,
+    Room,
+)
+from rtu_schedule_parser.utils.academic_calendar import Month, Period, Weekday
+
+if TYPE_CHECKING:
+    from rtu_schedule_parser.schedule_data import ScheduleData
+
+__all__ = ["to_arrow", "from_arrow", "to_parquet", "from_parquet"]
+
+# Schema metadata key used to restore the schedule type on import
+_SCHEDULE_TYPE_KEY = b"rtu_schedule_parser.schedule_type"
+
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+_ROOM_TYPE = pa.struct(
+    [
+        pa.field("name", pa.string()),
+        pa.field("campus", pa.string()),
+        pa.field("room_type", pa.string()),
+    ]
+)
+
+# Columns describing the group schedule. They are shared by lessons and exams tables.
+_SCHEDULE_FIELDS = [
+    pa.field("group", _DICT_STRING),
+    pa.field("year_start", pa.int16()),
+    pa.field("year_end", pa.int16()),
+    pa.field("semester", pa.int8()),
+    pa.field("institute", _DICT_STRING),
+    pa.field("degree", pa.int8()),
+    pa.field("document_url", _DICT_STRING),
+]
+
+LESSONS_SCHEMA = pa.schema(
+    _SCHEDULE_FIELDS
+    + [
+        pa.field("num", pa.int8()),
+        pa.field("name", _DICT_STRING),
+        pa.field("weeks", pa.list_(pa.int8())),
+        pa.field("weekday", pa.int8()),
+        pa.field("teachers", pa.list_(_DICT_STRING)),
+        pa.field("time_start", pa.time32("ms")),
+        pa.field("time_end", pa.time32("ms")),
+        pa.field("type", _DICT_STRING),
+        pa.field("room", _DICT_STRING),
+        pa.field("campus", _DICT_STRING),
+        pa.field("room_type", _DICT_STRING),
+        pa.field("subgroup", pa.int8()),
+    ]
+)
+
+EXAMS_SCHEMA = pa.schema(
+    _SCHEDULE_FIELDS
+    + [
+        pa.field("month", pa.int8()),
+        pa.field("day", pa.int8()),
+        pa.field("name", _DICT_STRING),
+        pa.field("time_start", pa.time32("ms")),
+        pa.field("teachers", pa.list_(_DICT_STRING)),
+        # Subgroups of the teachers, if the teachers cell has subgroups. Null for the plain teacher names.
+        pa.field("teacher_subgroups", pa.list_(pa.int8())),
+        pa.field("rooms", pa.list_(_ROOM_TYPE)),
+        pa.field("exam_type", pa.int8()),
+    ]
+)
+
+
+def _list_array(values: list[list], value_type: pa.DataType) -> pa.ListArray:
+    """Build a list array from a list of python lists. Dictionary-encodes the values if required."""
+    offsets = [0]
+    flat = []
+    for items in values:
+        flat.extend(items)
+        offsets.append(len(flat))
+
+    if pa.types.is_dictionary(value_type):
+        flat_array = pa.array(flat, pa.string()).dictionary_encode()
+    else:
+        flat_array = pa.array(flat, value_type)
+
+    return pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), flat_array)
+
+
+def _array(values: list, data_type: pa.DataType) -> pa.Array:
+    if pa.types.is_dictionary(data_type):
+        return pa.array(values, pa.string()).dictionary_encode()
+    if pa.types.is_list(data_type):
+        return _list_array(values, data_type.value_type)
+    return pa.array(values, data_type)
+
+
+def _split_teachers(
+    teachers: list[str] | list[tuple[str, int | None]],
+) -> tuple[list[str], list[int | None] | None]:
+    """Split exam teachers with subgroups (`(name, subgroup)` tuples) into the names and the subgroups."""
+    if teachers and isinstance(teachers[0], tuple):
+        return [name for name, _ in teachers], [subgroup for _, subgroup in teachers]
+
+    return teachers, None
+
+
+def _join_teachers(
+    names: list[str], subgroups: list[int | None] | None
+) -> list[str] | list[tuple[str, int | None]]:
+    if subgroups is None:
+        return names
+
+    return list(zip(names, subgroups))
+
+
+def _room_to_row(room: Room) -> dict:
+    return {
+        "name": room.name,
+        "campus": room.campus.short_name if room.campus is not None else None,
+        "room_type": room.room_type.value if room.room_type is not None else None,
+    }
+
+
+def _room_from_row(row: dict) -> Room:
+    return Room(
+        row["name"],
+        Campus.get_by_short_name(row["campus"]) if row["campus"] else None,
+        RoomType(row["room_type"]) if row["room_type"] else None,
+    )
+
+
+def to_arrow(schedule_data: ScheduleData) -> pa.Table:
+    """
+    Convert schedule data to an Arrow table. Semester and test session schedules are converted to a table with the
+    `LESSONS_SCHEMA` schema, exam session schedules are converted to a table with the `EXAMS_SCHEMA` schema.
+    """
+    is_exams = schedule_data.schedule_type == ScheduleType.EXAM_SESSION
+    schema = EXAMS_SCHEMA if is_exams else LESSONS_SCHEMA
+    columns = {name: [] for name in schema.names}
+
+    for schedule in schedule_data.get_schedule():
+        items = schedule.exams if is_exams else schedule.lessons
+        items = [
+            item
+            for item in items
+            if type(item) is not LessonEmpty and type(item) is not ExamEmpty
+        ]
+        count = len(items)
+
+        columns["group"] += [schedule.group] * count
+        columns["year_start"] += [schedule.period.year_start] * count
+        columns["year_end"] += [schedule.period.year_end] * count
+        columns["semester"] += [schedule.period.semester] * count
+        columns["institute"] += [schedule.institute.short_name] * count
+        columns["degree"] += [schedule.degree.value] * count
+        columns["document_url"] += [schedule.document_url] * count
+
+        if is_exams:
+            for exam in items:  # type: Exam
+                columns["month"].append(exam.month.value)
+                columns["day"].append(exam.day)
+                columns["name"].append(exam.name)
+                columns["time_start"].append(exam.time_start)
+                teachers, teacher_subgroups = _split_teachers(exam.teachers)
+                columns["teachers"].append(teachers)
+                columns["teacher_subgroups"].append(teacher_subgroups)
+                columns["rooms"].append([_room_to_row(room) for room in exam.rooms])
+                columns["exam_type"].append(exam.exam_type.value)
+        else:
+            for lesson in items:  # type: Lesson
+                room = lesson.room
+                columns["num"].append(lesson.num)
+                columns["name"].append(lesson.name)
+                columns["weeks"].append(lesson.weeks)
+                columns["weekday"].append(lesson.weekday.value[0])
+                columns["teachers"].append(lesson.teachers)
+                columns["time_start"].append(lesson.time_start)
+                columns["time_end"].append(lesson.time_end)
+                columns["type"].append(
+                    lesson.type.value if lesson.type is not None else None
+                )
+                columns["room"].append(room.name if room is not None else None)
+                columns["campus"].append(
+                    room.campus.short_name
+                    if room is not None and room.campus is not None
+                    else None
+                )
+                columns["room_type"].append(
+                    room.room_type.value
+                    if room is not None and room.room_type is not None
+                    else None
+                )
+                columns["subgroup"].append(lesson.subgroup)
+
+    if is_exams:
+        columns["teacher_subgroups"] = pa.array(
+            columns["teacher_subgroups"], pa.list_(pa.int8())
+        )
+        columns["rooms"] = pa.array(columns["rooms"], pa.list_(_ROOM_TYPE))
+
+    arrays = [
+        (
+            columns[field.name]
+            if isinstance(columns[field.name], pa.Array)
+            else _array(columns[field.name], field.type)
+        )
+        for field in schema
+    ]
+
+    return pa.Table.from_arrays(
+        arrays,
+        schema=schema.with_metadata(
+            {_SCHEDULE_TYPE_KEY: str(schedule_data.schedule_type.value).encode()}
+        ),
+    )
+
+
+def from_arrow(table: pa.Table) -> ScheduleData:
+    """
+    Convert an Arrow table created by `to_arrow` back to schedule data. Rows of the same group are expected to be
+    stored together, as `to_arrow` writes them.
+    """
+    from rtu_schedule_parser.schedule_data import ScheduleData
+
+    metadata = table.schema.metadata or {}
+    if _SCHEDULE_TYPE_KEY not in metadata:
+        raise ValueError(
+            "Table was not created by `to_arrow`: schedule type is unknown"
+        )
+
+    schedule_type = ScheduleType(int(metadata[_SCHEDULE_TYPE_KEY]))
+    is_exams = schedule_type == ScheduleType.EXAM_SESSION
+
+    columns = {name: table.column(name).to_pylist() for name in table.column_names}
+
+    schedules = {}  # type: dict[str, LessonsSchedule | ExamsSchedule]
+
+    for i in range(table.num_rows):
+        group = columns["group"][i]
+        schedule = schedules.get(group)
+
+        if schedule is None:
+            schedule_class = ExamsSchedule if is_exams else LessonsSchedule
+            schedule = schedule_class(
+                group=group,
+                period=Period(
+                    columns["year_start"][i],
+                    columns["year_end"][i],
+                    columns["semester"][i],
+                ),
+                institute=Institute.get_by_short_name(columns["institute"][i]),
+                degree=Degree(columns["degree"][i]),
+                document_url=columns["document_url"][i],
+            )
+            schedules[group] = schedule
+
+        if is_exams:
+            schedule.exams.append(
+                Exam(
+                    month=Month(columns["month"][i]),
+                    day=columns["day"][i],
+                    name=columns["name"][i],
+                    time_start=columns["time_start"][i],
+                    teachers=_join_teachers(
+                        columns["teachers"][i], columns["teacher_subgroups"][i]
+                    ),
+                    rooms=[_room_from_row(room) for room in columns["rooms"][i]],
+                    exam_type=ExamType(columns["exam_type"][i]),
+                )
+            )
+        else:
+            room = None
+            if columns["room"][i] is not None:
+                room = _room_from_row(
+                    {
+                        "name": columns["room"][i],
+                        "campus": columns["campus"][i],
+                        "room_type": columns["room_type"][i],
+                    }
+                )
+
+            schedule.lessons.append(
+                Lesson(
+                    num=columns["num"][i],
+                    name=columns["name"][i],
+                    weeks=columns["weeks"][i],
+                    weekday=Weekday.get_weekday_by_number(columns["weekday"][i]),
+                    teachers=columns["teachers"][i],
+                    time_start=columns["time_start"][i],
+                    time_end=columns["time_end"][i],
+                    type=(
+                        get_lesson_type_by_value(columns["type"][i])
+                        if columns["type"][i] is not None
+                        else None
+                    ),
+                    room=room,
+                    subgroup=columns["subgroup"][i],
+                )
+            )
+
+    return ScheduleData(list(schedules.values()), schedule_type=schedule_type)
+
+
+def to_parquet(schedule_data: ScheduleData, path: str, **kwargs) -> None:
+    """
+    Write schedule data to a Parquet file. Additional keyword arguments are passed to `pyarrow.parquet.write_table`.
+    """
+    pq.write_table(to_arrow(schedule_data), path, **kwargs)
+
+
+def from_parquet(path: str) -> ScheduleData:
+    """
+    Read schedule data from a Parquet file written by `to_parquet`. The file is memory-mapped, so the column buffers
+    are not copied while reading.
+    """
+    return from_arrow(pq.read_table(path, memory_map=True))
@@ -0,0 +1,507 @@
+"""
+Command line interface for batch processing of schedule documents.
+
+Subcommands:
+
+- ``discover`` — list schedule documents from the site.
+- ``download`` — download documents concurrently.
+- ``parse`` — parse local documents on a process pool and optionally export them.
+- ``export`` — discover, download, parse and export documents in one run (e.g. for a nightly pipeline).
+
+Outputs (``--format``) are written to the ``--output`` directory, one file per schedule type: ``<type>.parquet``,
+``<type>.sqlite``, ``<type>.json`` (list of group schedules) or ``<type>/<group>.ics``. Throughput statistics are
+printed to stderr, parser metrics can be written to a file in the Prometheus text format (``--metrics``).
+
+Examples:
+    rtu-schedule discover --type semester --institute ИИТ
+    rtu-schedule export --type semester --format parquet --output out --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
+from rtu_schedule_parser.metrics import ParserMetrics
+from rtu_schedule_parser.schedule_data import ScheduleData
+from rtu_schedule_parser.utils import academic_calendar
+from rtu_schedule_parser.utils.academic_calendar import Period
+
+__all__ = ["main"]
+
+logger = logging.getLogger(__name__)
+
+_SCHEDULE_TYPES = {
+    "semester": ScheduleType.SEMESTER,
+    "test_session": ScheduleType.TEST_SESSION,
+    "exam_session": ScheduleType.EXAM_SESSION,
+}
+
+_DEGREES = {degree.name.lower(): degree for degree in Degree}
+
+_FORMATS = ("parquet", "sqlite", "json", "ics")
+
+# Only Excel documents can be parsed
+_EXCEL_EXTENSIONS = (".xls", ".xlsx")
+
+
+@dataclass
+class _ParseTask:
+    path: str
+    schedule_type: ScheduleType
+    period: Period
+    institute: Institute
+    degree: Degree
+    document_url: str | None = None
+
+
+@dataclass
+class _ParseResult:
+    task: _ParseTask
+    schedule_data: ScheduleData | None
+    metrics: ParserMetrics
+    error: str | None = None
+
+
+def _parse_document(task: _ParseTask) -> _ParseResult:
+    """Parse one document. Runs in a worker process."""
+    from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+    from rtu_schedule_parser.excel_parser import ExcelScheduleParser
+
+    parser_class = (
+        ExcelExamScheduleParser
+        if task.schedule_type == ScheduleType.EXAM_SESSION
+        else ExcelScheduleParser
+    )
+    parser = parser_class(task.path, task.period, task.institute, task.degree)
+
+    with parser.collect_metrics() as metrics:
+        try:
+            if task.schedule_type == ScheduleType.EXAM_SESSION:
+                schedule_data = parser.parse(force=True)
+            else:
+                schedule_data = parser.parse(
+                    force=True, schedule_type=task.schedule_type
+                )
+        except Exception as ex:
+            return _ParseResult(task, None, metrics, str(ex))
+
+    for schedule in schedule_data.get_schedule():
+        schedule.document_url = task.document_url
+
+    return _ParseResult(task, schedule_data, metrics)
+
+
+def _parse_documents(
+    tasks: list[_ParseTask], workers: int, metrics_path: str | None = None
+) -> dict[ScheduleType, ScheduleData]:
+    """
+    Parse documents on a process pool and merge them by schedule type. Metrics of the parsers are written to
+    `metrics_path` in the Prometheus text format, if it is specified.
+    """
+    start = time.perf_counter()
+
+    if workers == 1:
+        results = [_parse_document(task) for task in tasks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_document, tasks))
+
+    elapsed = time.perf_counter() - start
+
+    merged = {}  # type: dict[ScheduleType, ScheduleData]
+    parsed_documents = groups = 0
+    metrics = ParserMetrics()
+
+    for result in results:
+        metrics.merge(result.metrics)
+
+        if result.schedule_data is None:
+            logger.error(f"Parsing {result.task.path} failed: {result.error}")
+            continue
+
+        parsed_documents += 1
+        groups += len(result.schedule_data.get_schedule())
+
+        schedule_type = result.task.schedule_type
+        if schedule_type in merged:
+            merged[schedule_type].update(result.schedule_data.get_schedule())
+        else:
+            merged[schedule_type] = result.schedule_data
+
+    _print_stats(
+        f"Parsed {parsed_documents}/{len(tasks)} documents, {groups} groups in {elapsed:.2f} s "
+        f"({_rate(parsed_documents, elapsed)} documents/s, {_rate(groups, elapsed)} groups/s)"
+    )
+    # Time of the formatter methods is a part of the time of parsing the groups
+    timings = metrics.timings
+    formatter_time = sum(
+        seconds for stage, seconds in timings.items() if stage.startswith("formatter.")
+    )
+    _print_stats(
+        f"Parsing time: open workbook {timings.get('open_workbook', 0.0):.2f} s, "
+        f"find groups {timings.get('find_groups', 0.0):.2f} s, "
+        f"rows {timings.get('parse_rows', 0.0):.2f} s, "
+        f"groups {timings.get('parse_groups', 0.0):.2f} s (formatter {formatter_time:.2f} s)"
+    )
+
+    if metrics_path is not None:
+        with open(metrics_path, "w") as file:
+            file.write(metrics.to_prometheus())
+
+    return merged
+
+
+def _export(
+    schedules: dict[ScheduleType, ScheduleData], fmt: str, output: str
+) -> list[str]:
+    """Write schedule data of each type to the output directory. Returns paths of the written files."""
+    os.makedirs(output, exist_ok=True)
+    paths = []
+
+    for schedule_type, schedule_data in schedules.items():
+        name = os.path.join(output, schedule_type.name.lower())
+        is_exams = schedule_type == ScheduleType.EXAM_SESSION
+
+        if fmt in ("sqlite", "ics") and is_exams:
+            logger.warning(f"Exams schedule cannot be exported to {fmt}, skipping")
+            continue
+
+        if fmt == "parquet":
+            path = f"{name}.parquet"
+            schedule_data.to_parquet(path)
+            paths.append(path)
+
+        elif fmt == "sqlite":
+            from rtu_schedule_parser.store import ScheduleStore
+
+            path = f"{name}.sqlite"
+            if os.path.exists(path):
+                os.remove(path)
+            with ScheduleStore(path) as store:
+                store.load(schedule_data)
+            paths.append(path)
+
+        elif fmt == "json":
+            path = f"{name}.json"
+            # Group documents are taken from the serialization cache of the schedule data
+            with open(path, "wb") as file:
+                file.write(b"[")
+                for i, group in enumerate(schedule_data.get_groups()):
+                    if i:
+                        file.write(b",")
+                    file.write(schedule_data.get_group_json(group))
+                file.write(b"]")
+            paths.append(path)
+
+        elif fmt == "ics":
+            os.makedirs(name, exist_ok=True)
+            for group in schedule_data.get_groups():
+                path = os.path.join(name, f"{group}.ics")
+                schedule_data.to_ics(group, path)
+                paths.append(path)
+
+    return paths
+
+
+def _rate(count: int, elapsed: float) -> str:
+    return f"{count / elapsed:.1f}" if elapsed > 0 else "-"
+
+
+def _print_stats(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def _get_documents(args: argparse.Namespace) -> list:
+    from rtu_schedule_parser.downloader import ScheduleDownloader
+
+    downloader = ScheduleDownloader(os.path.abspath(args.dir))
+
+    start = time.perf_counter()
+    documents = [
+        document
+        for document in downloader.get_documents(
+            args.types, args.institutes, args.degrees
+        )
+        if os.path.splitext(document.url)[1] in _EXCEL_EXTENSIONS
+    ]
+    _print_stats(
+        f"Discovered {len(documents)} documents in {time.perf_counter() - start:.2f} s"
+    )
+
+    return documents
+
+
+def _download_documents(args: argparse.Namespace, documents: list) -> list[tuple]:
+    """Download documents concurrently. Returns list of (document, path, is_changed) for downloaded documents."""
+    from rtu_schedule_parser.downloader import ScheduleDownloader
+
+    downloader = ScheduleDownloader(os.path.abspath(args.dir))
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=args.download_workers
+    ) as executor:
+        results = list(executor.map(downloader.download, documents))
+    elapsed = time.perf_counter() - start
+
+    downloaded = [
+        (document, *result)
+        for document, result in zip(documents, results)
+        if result is not None
+    ]
+    changed = sum(1 for *_, is_changed in downloaded if is_changed)
+
+    _print_stats(
+        f"Downloaded {len(downloaded)}/{len(documents)} documents ({changed} changed) in {elapsed:.2f} s "
+        f"({_rate(len(downloaded), elapsed)} documents/s)"
+    )
+
+    return downloaded
+
+
+def _discover(args: argparse.Namespace) -> int:
+    for document in _get_documents(args):
+        print(
+            document.schedule_type.name.lower(),
+            document.degree.name.lower(),
+            document.institute.short_name,
+            document.url,
+            sep="\t",
+        )
+
+    return 0
+
+
+def _download(args: argparse.Namespace) -> int:
+    documents = _get_documents(args)
+
+    for _, path, is_changed in _download_documents(args, documents):
+        print(path, "changed" if is_changed else "unchanged", sep="\t")
+
+    return 0
+
+
+def _parse(args: argparse.Namespace) -> int:
+    if (args.format is None) != (args.output is None):
+        raise SystemExit("--format and --output must be specified together")
+
+    tasks = [
+        _ParseTask(path, args.type, args.period, args.institute, args.degree)
+        for path in args.files
+    ]
+    schedules = _parse_documents(tasks, args.workers, args.metrics)
+
+    for schedule_type, schedule_data in schedules.items():
+        print(
+            schedule_type.name.lower(),
+            len(schedule_data.get_schedule()),
+            "groups",
+            sep="\t",
+        )
+
+    if args.format is not None:
+        for path in _export(schedules, args.format, args.output):
+            print(path)
+
+    return 0 if schedules else 1
+
+
+def _export_command(args: argparse.Namespace) -> int:
+    documents = _get_documents(args)
+    downloaded = _download_documents(args, documents)
+
+    tasks = [
+        _ParseTask(
+            path,
+            document.schedule_type,
+            document.period,
+            document.institute,
+            document.degree,
+            document.url,
+        )
+        for document, path, _ in downloaded
+    ]
+    schedules = _parse_documents(tasks, args.workers, args.metrics)
+
+    for path in _export(schedules, args.format, args.output):
+        print(path)
+
+    return 0
+
+
+def _parse_period(value: str) -> Period:
+    try:
+        year_start, year_end, semester = map(int, value.split("-"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Period must be in format YYYY-YYYY-S, got {value!r}"
+        ) from None
+
+    return Period(year_start, year_end, semester)
+
+
+def _parse_institute(value: str) -> Institute:
+    try:
+        return Institute.get_by_short_name(value)
+    except ValueError as ex:
+        raise argparse.ArgumentTypeError(str(ex)) from None
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid number: {value!r}") from None
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Must be a positive number: {value!r}")
+    return number
+
+
+def _choice(mapping: dict):
+    def parse(value: str):
+        if value not in mapping:
+            raise argparse.ArgumentTypeError(
+                f"Invalid choice: {value!r} (choose from {', '.join(mapping)})"
+            )
+        return mapping[value]
+
+    return parse
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rtu-schedule",
+        description="Discover, download, parse and export RTU MIREA schedule documents.",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Show progress of parsing."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument(
+        "--type",
+        dest="types",
+        action="append",
+        type=_choice(_SCHEDULE_TYPES),
+        help=f"Schedule type ({', '.join(_SCHEDULE_TYPES)}). Can be repeated. Default: all.",
+    )
+    filters.add_argument(
+        "--institute",
+        dest="institutes",
+        action="append",
+        type=_parse_institute,
+        help="Institute short name (e.g. ИИТ). Can be repeated. Default: all.",
+    )
+    filters.add_argument(
+        "--degree",
+        dest="degrees",
+        action="append",
+        type=_choice(_DEGREES),
+        help=f"Degree ({', '.join(_DEGREES)}). Can be repeated. Default: all.",
+    )
+    filters.add_argument(
+        "--dir",
+        default="documents",
+        help="Directory to download documents to. Default: documents.",
+    )
+
+    download_options = argparse.ArgumentParser(add_help=False)
+    download_options.add_argument(
+        "--download-workers",
+        type=_positive_int,
+        default=8,
+        help="Number of concurrent downloads. Default: 8.",
+    )
+
+    parse_options = argparse.ArgumentParser(add_help=False)
+    parse_options.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="Number of parser processes. Default: number of CPUs.",
+    )
+    parse_options.add_argument(
+        "--metrics",
+        help="File to write parser metrics to in the Prometheus text format.",
+    )
+
+    subparsers.add_parser(
+        "discover", parents=[filters], help="List schedule documents from the site."
+    ).set_defaults(handler=_discover)
+
+    subparsers.add_parser(
+        "download",
+        parents=[filters, download_options],
+        help="Download schedule documents.",
+    ).set_defaults(handler=_download)
+
+    parse_parser = subparsers.add_parser(
+        "parse", parents=[parse_options], help="Parse local schedule documents."
+    )
+    parse_parser.add_argument("files", nargs="+", help="Excel documents to parse.")
+    parse_parser.add_argument(
+        "--type",
+        type=_choice(_SCHEDULE_TYPES),
+        default=ScheduleType.SEMESTER,
+        help="Schedule type of the documents. Default: semester.",
+    )
+    parse_parser.add_argument(
+        "--institute", type=_parse_institute, required=True, help="Institute."
+    )
+    parse_parser.add_argument(
+        "--degree",
+        type=_choice(_DEGREES),
+        default=Degree.BACHELOR,
+        help="Degree. Default: bachelor.",
+    )
+    parse_parser.add_argument(
+        "--period",
+        type=_parse_period,
+        default=academic_calendar.get_period(academic_calendar.now_date().date()),
+        help="Period in format YYYY-YYYY-S (e.g. 2022-2023-1). Default: current.",
+    )
+    parse_parser.add_argument("--format", choices=_FORMATS, help="Output format.")
+    parse_parser.add_argument("--output", help="Output directory.")
+    parse_parser.set_defaults(handler=_parse)
+
+    export_parser = subparsers.add_parser(
+        "export",
+        parents=[filters, download_options, parse_options],
+        help="Discover, download, parse and export schedule documents.",
+    )
+    export_parser.add_argument(
+        "--format", choices=_FORMATS, required=True, help="Output format."
+    )
+    export_parser.add_argument("--output", required=True, help="Output directory.")
+    export_parser.set_defaults(handler=_export_command)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _create_parser().parse_args(argv)
+
+    # Parsers log every processed group
+    logging.getLogger("rtu_schedule_parser").setLevel(
+        logging.INFO if args.verbose else logging.WARNING
+    )
+
+    for name in ("types", "institutes", "degrees"):
+        if getattr(args, name, None) is not None:
+            setattr(args, name, set(getattr(args, name)))
+
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
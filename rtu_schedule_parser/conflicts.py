@@ -0,0 +1,215 @@
+"""
+Detection of double-booked teachers and rooms.
+
+Lessons are put into buckets by the resource (teacher or room), weekday and lesson number, weeks of the lessons are
+stored as bitsets. Overlapping weeks of a bucket are found with one pass over its lessons, so the detection takes
+near-linear time instead of comparing all pairs of lessons.
+
+Lessons of a stream (e.g. a lecture for several groups) have the same name, room and teachers. Such lessons are
+grouped into one `Booking` and are not reported as a conflict with each other.
+
+Examples:
+    >>> for conflict in schedule_data.find_conflicts():
+    ...     print(conflict.resource, conflict.weekday, conflict.num, conflict.weeks)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterable
+
+from rtu_schedule_parser.constants import Campus
+from rtu_schedule_parser.occupancy import weeks_to_mask
+from rtu_schedule_parser.schedule import Lesson, LessonEmpty, LessonsSchedule, Room
+from rtu_schedule_parser.teachers import Teacher, TeacherRegistry
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+
+__all__ = ["Booking", "Conflict", "ConflictType", "find_conflicts"]
+
+# Placeholder of the formatter for subgroups without a teacher
+_NO_TEACHER = "Нет"
+
+
+class ConflictType(Enum):
+    """Type of the double-booked resource."""
+
+    __slots__ = ()
+
+    TEACHER = "teacher"
+    ROOM = "room"
+
+
+@dataclass
+class Booking:
+    """
+    Lessons of one or several groups that take the resource together, e.g. a stream lecture.
+    """
+
+    name: str
+    groups: list[str]
+    weeks: list[int]
+    lessons: list[Lesson] = field(repr=False)
+
+
+@dataclass
+class Conflict:
+    """
+    The resource is taken by several bookings in the same weeks of the lesson slot.
+    """
+
+    conflict_type: ConflictType
+    resource: Teacher | Room
+    weekday: Weekday
+    num: int
+    # Weeks in which at least two bookings overlap
+    weeks: list[int]
+    # Bookings that take the resource in these weeks
+    bookings: list[Booking]
+
+
+def _mask_to_weeks(mask: int) -> list[int]:
+    weeks = []
+    week = 0
+    while mask:
+        if mask & 1:
+            weeks.append(week)
+        mask >>= 1
+        week += 1
+
+    return weeks
+
+
+class _Bucket:
+    """For internal use only. Bookings of the resource in one lesson slot."""
+
+    __slots__ = ("masks", "lessons", "groups")
+
+    def __init__(self) -> None:
+        # Booking key -> weeks bitset, lessons and groups of the booking
+        self.masks = {}  # type: dict[tuple, int]
+        self.lessons = {}  # type: dict[tuple, list[Lesson]]
+        self.groups = {}  # type: dict[tuple, dict[str, None]]
+
+    def add(self, key: tuple, mask: int, lesson: Lesson, group: str) -> None:
+        if key in self.masks:
+            self.masks[key] |= mask
+            self.lessons[key].append(lesson)
+            self.groups[key][group] = None
+        else:
+            self.masks[key] = mask
+            self.lessons[key] = [lesson]
+            self.groups[key] = {group: None}
+
+    def get_overlap(self) -> int:
+        """Get bitset of the weeks taken by at least two bookings."""
+        taken, overlap = 0, 0
+        for mask in self.masks.values():
+            overlap |= taken & mask
+            taken |= mask
+
+        return overlap
+
+
+def find_conflicts(
+    schedules: Iterable[LessonsSchedule], include_online: bool = False
+) -> list[Conflict]:
+    """
+    Find teachers and rooms that are taken by several bookings in the same weeks. Schedules of several institutes
+    can be checked together.
+
+    Args:
+        schedules: Lessons schedules of the groups.
+        include_online: If False, rooms of the distance learning campus (`Campus.ONLINE`) are not checked.
+
+    Returns:
+        Conflicts in the order the resources were found: teachers conflicts first, then rooms conflicts.
+    """
+    teachers = TeacherRegistry()
+    # Rooms are replaced with their indexes, so the buckets keys are hashed without hashing the rooms
+    rooms = []  # type: list[Room]
+    room_indexes = {}  # type: dict[Room, int]
+
+    # (teacher ID or room index, weekday number, lesson number) -> bookings
+    teacher_buckets = {}  # type: dict[tuple[int, int, int], _Bucket]
+    room_buckets = {}  # type: dict[tuple[int, int, int], _Bucket]
+
+    for schedule in schedules:
+        if type(schedule) is not LessonsSchedule:
+            raise TypeError("Conflicts can be found only for lessons schedules")
+
+        for lesson in schedule.lessons:
+            if type(lesson) is LessonEmpty:
+                continue
+
+            teacher_ids = [
+                teachers.get(name).id
+                for name in lesson.teachers
+                if name and name != _NO_TEACHER
+            ]
+
+            room_index = None
+            if lesson.room is not None:
+                room_index = room_indexes.get(lesson.room)
+                if room_index is None:
+                    room_index = room_indexes[lesson.room] = len(rooms)
+                    rooms.append(lesson.room)
+
+            # Lessons of a stream have the same booking key
+            key = (lesson.name.lower(), room_index, frozenset(teacher_ids))
+            mask = weeks_to_mask(lesson.weeks)
+            weekday = lesson.weekday.value[0]
+
+            for teacher_id in teacher_ids:
+                slot = (teacher_id, weekday, lesson.num)
+                bucket = teacher_buckets.get(slot)
+                if bucket is None:
+                    bucket = teacher_buckets[slot] = _Bucket()
+                bucket.add(key, mask, lesson, schedule.group)
+
+            if room_index is not None and (
+                include_online or lesson.room.campus != Campus.ONLINE
+            ):
+                slot = (room_index, weekday, lesson.num)
+                bucket = room_buckets.get(slot)
+                if bucket is None:
+                    bucket = room_buckets[slot] = _Bucket()
+                bucket.add(key, mask, lesson, schedule.group)
+
+    conflicts = []
+
+    for conflict_type, buckets, get_resource in (
+        (ConflictType.TEACHER, teacher_buckets, teachers.get_by_id),
+        (ConflictType.ROOM, room_buckets, rooms.__getitem__),
+    ):
+        for (resource, weekday, num), bucket in buckets.items():
+            if len(bucket.masks) < 2:
+                continue
+
+            overlap = bucket.get_overlap()
+            if not overlap:
+                continue
+
+            bookings = [
+                Booking(
+                    bucket.lessons[key][0].name,
+                    list(bucket.groups[key]),
+                    _mask_to_weeks(mask),
+                    bucket.lessons[key],
+                )
+                for key, mask in bucket.masks.items()
+                if mask & overlap
+            ]
+
+            conflicts.append(
+                Conflict(
+                    conflict_type,
+                    get_resource(resource),
+                    Weekday.get_weekday_by_number(weekday),
+                    num,
+                    _mask_to_weeks(overlap),
+                    bookings,
+                )
+            )
+
+    return conflicts
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import re
 from enum import Enum, IntEnum
 
@@ -64,6 +66,14 @@ class TestSessionLessonType(Enum):
     COURSE_PROJECT = "кп"
 
 
+def get_lesson_type_by_value(value: str) -> LessonType | TestSessionLessonType:
+    """Returns the lesson type (semester or test session one) by its value, e.g. "лек" or "зач"."""
+    try:
+        return LessonType(value)
+    except ValueError:
+        return TestSessionLessonType(value)
+
+
 class ScheduleType(IntEnum):
     """
     Enumeration of schedule document types.
@@ -1,2 +1,3 @@
 from .schedule_document import ScheduleDocument
 from .schedule_downloader import ScheduleDownloader
+from .schedule_watcher import ScheduleChange, ScheduleWatcher
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import logging
 import os
 import re
 
 import bs4
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 import rtu_schedule_parser.utils.academic_calendar as academic_calendar
 from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
@@ -21,6 +22,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# lxml is much faster than the pure-Python parser, but it is optional
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Size of the chunks in which the files are downloaded and hashed
+_CHUNK_SIZE = 64 * 1024
+
+# Links to the documents of each schedule type for each degree and institute
+_DocumentLinks = dict[tuple[Degree, Institute], dict[ScheduleType, list[str]]]
+
+
+def _get_file_hash(path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.digest()
+
 
 class ScheduleDownloader:
     # Link to the schedule page.
@@ -56,9 +80,17 @@ class ScheduleDownloader:
         current_path = os.path.dirname(os.path.abspath(__file__))
         self._base_file_dir = os.path.join(current_path, base_file_dir)
 
-    def __download_schedule(self, url: str, path: str) -> tuple[str, bool]:
+        # ETag and hash of the schedule page and links parsed from it
+        self._links_cache: tuple[str | None, bytes, _DocumentLinks] | None = None
+
+    def __download_schedule(self, url: str, path: str) -> tuple[str, bool] | None:
         """
-        Download schedule from the specified url. If the file already exists, it will be not overwritten.
+        Download schedule from the specified url. If the file already exists and has the same content, it will be not
+        overwritten.
+
+        The file is streamed to a temporary `.part` file and hashed on the fly, so the memory usage does not depend on
+        the file size. The temporary file replaces the existing file only if the hashes differ. If the download is
+        interrupted, the `.part` file is kept and the next download continues from where it stopped.
 
         Args:
             url: Url to download the file from.
@@ -66,41 +98,81 @@ class ScheduleDownloader:
 
         Returns:
             Tuple with path to downloaded file and flag, that indicates whether file was overwritten or first
-            time downloaded.
+            time downloaded. None if the download failed.
         """
+        part_path = f"{path}.part"
 
-        if os.path.isfile(path):
-            old_file = open(path, "rb").read()
-            new_file = requests.get(url).content
-
-            if old_file == new_file:
-                return path, False
-
-            try:
-                return self.__extracted_from___download_schedule_20(url, path)
-            except Exception as ex:
-                logger.error(f"Download failed with error: {ex}")
         try:
-            return self.__extracted_from___download_schedule_20(url, path)
+            digest = self.__request_file(url, part_path)
         except Exception as ex:
             logger.error(f"Download failed with error: {ex}")
+            return None
+
+        if os.path.isfile(path) and _get_file_hash(path) == digest:
+            os.remove(part_path)
+            return path, False
 
-    # TODO Rename this here and in `__download_schedule`
-    def __extracted_from___download_schedule_20(self, url, path):
-        file_content = self.__request_file(url)
-        with open(path, "wb") as file:
-            file.write(file_content)
+        os.replace(part_path, path)
         return path, True
 
-    def __request_file(self, url: str) -> bytes:
-        try:
-            with requests.get(url, stream=True) as response:
+    def __request_file(self, url: str, part_path: str) -> bytes:
+        """
+        Stream the file to `part_path` and return its SHA-256 hash. If `part_path` exists and the validator (ETag or
+        Last-Modified) of the interrupted response is known, the download is resumed with a `Range` request.
+        """
+        validator_path = f"{part_path}.validator"
+        digest = hashlib.sha256()
+        headers = {}
+        offset = 0
+
+        if os.path.isfile(part_path) and os.path.isfile(validator_path):
+            with open(validator_path, encoding="utf-8") as file:
+                validator = file.read()
+
+            offset = os.path.getsize(part_path)
+            if offset and validator:
+                # The server sends the whole file instead of the range if the file has changed
+                headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+
+        with requests.get(url, headers=headers, stream=True) as response:
+            # The range cannot be resumed if the `.part` file is already complete (416) or the server sent another
+            # range. The file is downloaded again from the start.
+            restart = bool(headers) and (
+                response.status_code == 416
+                or response.status_code == 206
+                and not response.headers.get("Content-Range", "").startswith(
+                    f"bytes {offset}-"
+                )
+            )
+
+            if not restart:
                 response.raise_for_status()
 
-                return response.content
+                resume = response.status_code == 206 and bool(headers)
+                if resume:
+                    with open(part_path, "rb") as file:
+                        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+                            digest.update(chunk)
+
+                validator = response.headers.get("ETag") or response.headers.get(
+                    "Last-Modified", ""
+                )
+                with open(validator_path, "w", encoding="utf-8") as file:
+                    file.write(validator)
+
+                with open(part_path, "ab" if resume else "wb") as file:
+                    for chunk in response.iter_content(_CHUNK_SIZE):
+                        file.write(chunk)
+                        digest.update(chunk)
 
-        except requests.exceptions.HTTPError as http_err:
-            logger.error(f"Getting a file ({url}) failed with error: {http_err}")
+        if restart:
+            os.remove(part_path)
+            os.remove(validator_path)
+            return self.__request_file(url, part_path)
+
+        os.remove(validator_path)
+
+        return digest.digest()
 
     def __download_files(
         self, documents: list[ScheduleDocument]
@@ -124,7 +196,7 @@ class ScheduleDownloader:
             file_name = os.path.split(url)[1]
             try:
                 # название файла и его расширение
-                (file_root, file_ext) = os.path.splitext(file_name)
+                file_root, file_ext = os.path.splitext(file_name)
 
                 if file_ext not in self._ALLOWED_EXTENSIONS:
                     continue
@@ -150,7 +222,8 @@ class ScheduleDownloader:
 
                 os.makedirs(os.path.join(self._base_file_dir, subdir), exist_ok=True)
                 result = self.__download_schedule(url, path_to_file)
-                res.append((document, result[0], result[1]))
+                if result is not None:
+                    res.append((document, result[0], result[1]))
 
                 downloaded_files += 1
                 progress_percentage = downloaded_files / progress_all * 100
@@ -192,51 +265,105 @@ class ScheduleDownloader:
 
         return res
 
-    def __parse_links_by_type(
-        self, document_types: ScheduleType, element: bs4.Tag
-    ) -> list[str]:
-        document_links = []
+    def __parse_links(self, element: bs4.Tag) -> dict[ScheduleType, list[str]]:
+        """
+        Collect links to the documents of all schedule types from the institute card in one pass.
+        """
+        document_links = {
+            schedule_type: [] for schedule_type in ScheduleType
+        }  # type: dict[ScheduleType, list[str]]
 
-        document_type_title = self._SCHEDULE_TYPE_HEADERS[document_types]
         schedule_titles = element.find_all("b", class_="uk-h3")
 
         # If there are no document headers but there is one link to excel file, then it is a schedule for the whole
         # institute
         if not schedule_titles:
-            if len(element.select("a")) == 1:
-                doc_url = element.select_one("a")["href"]
+            links = element.find_all("a")
+            if len(links) == 1:
+                doc_url = links[0]["href"]
 
                 if doc_url.endswith(".xls") or doc_url.endswith(".xlsx"):
-                    document_links.append(doc_url)
+                    for schedule_links in document_links.values():
+                        schedule_links.append(doc_url)
 
             return document_links
 
         for title in schedule_titles:
-            if document_type_title in title.text:
-                all_divs = title.parent.parent.find_all("div", recursive=False)
-                for i, div in enumerate(all_divs):
-                    if document_type_title in div.text:
-                        # Проходим по всем div'ам, начиная от блока с расписанием, заканчивая другим блоком с
-                        # расписанием. Это нужно, т.к. эти блоки не имеют вложенности и довольно сложно определить
-                        # где начинаются и кончаются ссылки.
-                        for j in range(i + 1, len(all_divs)):
-                            if (
-                                "uk-h3" in str(all_divs[j])
-                                or all_divs[j].text == document_type_title
-                            ):
-                                break
-                            document = all_divs[j].find(
-                                "a", {"class": "uk-link-toggle"}
-                            )
-                            if (
-                                document is not None
-                                and document["href"] not in document_links
-                            ):
-                                document_links.append(document["href"])
+            schedule_type = next(
+                (
+                    schedule_type
+                    for schedule_type, header in self._SCHEDULE_TYPE_HEADERS.items()
+                    if header in title.text
+                ),
+                None,
+            )
+            if schedule_type is None:
+                continue
+
+            links = document_links[schedule_type]
+            # Blocks with the links follow the block with the header on the same level. They are not nested, so the
+            # links end at the block with the next header.
+            for div in title.parent.find_next_siblings("div"):
+                if (
+                    "uk-h3" in div.get("class", ())
+                    or div.find(class_="uk-h3") is not None
+                    or div.text == self._SCHEDULE_TYPE_HEADERS[schedule_type]
+                ):
+                    break
+
+                document = div.find("a", class_="uk-link-toggle")
+                if document is not None and document["href"] not in links:
+                    links.append(document["href"])
 
         return document_links
 
-    def download(self, schedule_document: ScheduleDocument) -> tuple[str, bool]:
+    def __get_schedule_links(self) -> _DocumentLinks:
+        """
+        Get links to the documents from the schedule page. The page is requested with the ETag of the cached page, and
+        it is parsed again only if it has changed (the server responds with new content with a different hash).
+        """
+        headers = {}
+        if self._links_cache is not None and self._links_cache[0]:
+            headers["If-None-Match"] = self._links_cache[0]
+
+        response = requests.get(self.SCHEDULE_URL, headers=headers)
+        if response.status_code == 304 and self._links_cache is not None:
+            return self._links_cache[2]
+
+        etag = response.headers.get("ETag")
+        digest = hashlib.sha256(response.content).digest()
+
+        if self._links_cache is not None and self._links_cache[1] == digest:
+            self._links_cache = (etag, digest, self._links_cache[2])
+            return self._links_cache[2]
+
+        # Only the block with the schedule tabs is parsed
+        bs = BeautifulSoup(
+            response.content,
+            _HTML_PARSER,
+            parse_only=SoupStrainer("div", {"id": "tabs"}),
+        )
+
+        # Schedule tabs with education levels: bachelor, master, etc. The presence of the `uk-active` class in the
+        # list item means that this tab is selected.
+        schedule_tabs = bs.find("div", {"id": "tabs"})  # type: bs4.Tag
+        tabs_content = schedule_tabs.find("ul", {"id": "tab-content"})
+
+        # Tabs:
+        # "БАКАЛАВРИАТ/СПЕЦИАЛИТЕТ", "МАГИСТРАТУРА", "АСПИРАНТУРА", "КОЛЛЕДЖ", "ЭКСТЕРНЫ"
+        tabs_content = list(tabs_content.find_all("li"))[:4]  # first 4 tabs
+
+        links = {}
+        for i, tab in enumerate(tabs_content):
+            degree = Degree(i + 1)
+            for institute, card in self.__parse_institute_cards(tab, degree).items():
+                links[(degree, institute)] = self.__parse_links(card)
+
+        self._links_cache = (etag, digest, links)
+
+        return links
+
+    def download(self, schedule_document: ScheduleDocument) -> tuple[str, bool] | None:
         """
         Download a schedule document.
 
@@ -245,7 +372,7 @@ class ScheduleDownloader:
 
         Returns:
             Tuple with path to downloaded file and flag, that indicates whether file was overwritten or first
-            time downloaded.
+            time downloaded. None if the download failed.
         """
         try:
             file_name = os.path.split(schedule_document.url)[1]
@@ -298,67 +425,24 @@ class ScheduleDownloader:
             List of documents.
         """
 
-        if specific_schedule_types is None:
-            specific_schedule_types = set()
-        if specific_degrees is None:
-            specific_degrees = set()
-        if specific_institutes is None:
-            specific_institutes = set()
-
-        html = requests.get(self.SCHEDULE_URL).text
-        bs = BeautifulSoup(html, "html.parser")
-
-        # Schedule tabs with education levels: bachelor, master, etc. The presence of the `uk-active` class in the
-        # list item means that this tab is selected.
-        schedule_tabs = bs.find("div", {"id": "tabs"})  # type: bs.Tag
-        tabs_content = schedule_tabs.find("ul", {"id": "tab-content"})
-
-        # Tabs:
-        # "БАКАЛАВРИАТ/СПЕЦИАЛИТЕТ", "МАГИСТРАТУРА", "АСПИРАНТУРА", "КОЛЛЕДЖ", "ЭКСТЕРНЫ"
-        tabs_content = list(tabs_content.find_all("li"))[:4]  # first 4 tabs
-
-        institute_schedule_cards = {}
-
-        for i in range(len(tabs_content)):
-            if specific_degrees and i + 1 not in [
-                specific_degree.value for specific_degree in specific_degrees
-            ]:
-                continue
-
-            degree = Degree(i + 1)
-            institute_schedule_cards[degree] = self.__parse_institute_cards(
-                tabs_content[i], degree
-            )
-
-        if specific_institutes:
-            for degree, value in institute_schedule_cards.items():
-                for institute in list(value):
-                    if institute not in specific_institutes:
-                        institute_schedule_cards[degree].pop(institute)
-
         if not specific_schedule_types:
             specific_schedule_types = set(ScheduleType)
 
+        period = academic_calendar.get_period(datetime.datetime.now().date())
         schedule_documents = []
 
-        for degree, value_ in institute_schedule_cards.items():
-            for institute in value_:
-                for specific_document_type in specific_schedule_types:
-                    links = self.__parse_links_by_type(
-                        specific_document_type,
-                        institute_schedule_cards[degree][institute],
-                    )
-                    schedule_documents.extend(
-                        ScheduleDocument(
-                            institute,
-                            specific_document_type,
-                            degree,
-                            academic_calendar.get_period(
-                                datetime.datetime.now().date()
-                            ),
-                            link,
-                        )
-                        for link in links
+        for (degree, institute), links in self.__get_schedule_links().items():
+            if specific_degrees and degree not in specific_degrees:
+                continue
+            if specific_institutes and institute not in specific_institutes:
+                continue
+
+            for specific_document_type in specific_schedule_types:
+                schedule_documents.extend(
+                    ScheduleDocument(
+                        institute, specific_document_type, degree, period, link
                     )
+                    for link in links[specific_document_type]
+                )
 
         return schedule_documents
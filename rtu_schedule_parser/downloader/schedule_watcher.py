@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+import requests
+
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
+from rtu_schedule_parser.downloader.schedule_document import ScheduleDocument
+from rtu_schedule_parser.downloader.schedule_downloader import ScheduleDownloader
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+from rtu_schedule_parser.excel_parser import ExcelScheduleParser
+from rtu_schedule_parser.schedule_data import ScheduleData
+
+logger = logging.getLogger(__name__)
+
+# Response headers used to detect changes of the document without downloading it
+_VALIDATOR_HEADERS = ("ETag", "Last-Modified", "Content-Length")
+
+# Only Excel documents can be parsed
+_PARSED_EXTENSIONS = (".xls", ".xlsx")
+
+
+@dataclass
+class ScheduleChange:
+    """
+    Change of the schedule caused by a new version of a document (or its removal from the site).
+    """
+
+    document: ScheduleDocument
+    # Groups that appeared in the schedule
+    added: list[str] = field(default_factory=list)
+    # Groups whose schedules were parsed again
+    updated: list[str] = field(default_factory=list)
+    # Groups that are no longer in the schedule
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def schedule_type(self) -> ScheduleType:
+        return self.document.schedule_type
+
+
+class ScheduleWatcher:
+    """
+    Long-running watcher of the schedule documents. On each poll it gets the list of documents from the site, checks
+    them for changes with `HEAD` requests (ETag, Last-Modified, Content-Length), downloads only the documents whose
+    validators have changed and parses only the documents whose content has changed. Parsed schedules are merged into
+    one `ScheduleData` for each schedule type, which is updated in place.
+
+    Changes are reported to the listeners added with `add_listener()` and, when running with `run_async()`, to the
+    asyncio queue.
+
+    Examples:
+        >>> watcher = ScheduleWatcher(schedule_types={ScheduleType.SEMESTER}, interval=15 * 60)
+        >>> watcher.add_listener(lambda change: print(change.updated))
+        >>> watcher.run()
+    """
+
+    def __init__(
+        self,
+        downloader: ScheduleDownloader | None = None,
+        interval: float = 60 * 60,
+        schedule_types: set[ScheduleType] | None = None,
+        institutes: set[Institute] | None = None,
+        degrees: set[Degree] | None = None,
+        force: bool = True,
+    ) -> None:
+        """
+        Args:
+            downloader: Downloader used to get and download documents. By default, a new downloader is created.
+            interval: Interval between polls in seconds.
+            schedule_types: Schedule types to watch. If None, all schedule types are watched.
+            institutes: Institutes to watch. If None, all institutes are watched.
+            degrees: Degrees to watch. If None, all degrees are watched.
+            force: Passed to the parsers. If True, groups that cannot be parsed are skipped.
+        """
+        self._downloader = downloader or ScheduleDownloader()
+        self._interval = interval
+        self._schedule_types = schedule_types
+        self._institutes = institutes
+        self._degrees = degrees
+        self._force = force
+
+        self._listeners = []  # type: list[Callable[[ScheduleChange], None]]
+
+        self._data = {}  # type: dict[ScheduleType, ScheduleData]
+        # Documents are identified by URL. Validators of the documents from the last poll.
+        self._validators = {}  # type: dict[str, tuple[str | None, ...]]
+        # Parsed documents, groups parsed from each document and the document each group was taken from
+        self._documents = {}  # type: dict[str, ScheduleDocument]
+        self._document_groups = {}  # type: dict[str, set[str]]
+        self._group_documents = {}  # type: dict[tuple[ScheduleType, str], str]
+
+    def add_listener(self, listener: Callable[[ScheduleChange], None]) -> None:
+        """Add a function called for each change of the schedule."""
+        self._listeners.append(listener)
+
+    def get_schedule_data(self, schedule_type: ScheduleType) -> ScheduleData | None:
+        """Get merged schedule data of the schedule type or None if nothing is parsed yet."""
+        return self._data.get(schedule_type)
+
+    def poll_once(self) -> list[ScheduleChange]:
+        """
+        Check documents for changes once and update the schedule data.
+
+        Returns:
+            List of changes. Listeners are called for each of them.
+        """
+        documents = [
+            document
+            for document in self._downloader.get_documents(
+                self._schedule_types, self._institutes, self._degrees
+            )
+            if os.path.splitext(document.url)[1] in _PARSED_EXTENSIONS
+        ]
+
+        changes = []
+
+        for document in documents:
+            try:
+                change = self.__check_document(document)
+            except Exception as ex:
+                logger.error(f"Checking document {document.url} failed: {ex}")
+                continue
+
+            if change is not None:
+                changes.append(change)
+
+        # Documents removed from the site
+        urls = {document.url for document in documents}
+        for url in [url for url in self._documents if url not in urls]:
+            changes.append(self.__remove_document(self._documents[url]))
+
+        for change in changes:
+            for listener in self._listeners:
+                listener(change)
+
+        return changes
+
+    def run(self, stop_event: threading.Event | None = None) -> None:
+        """
+        Poll documents with the interval until `stop_event` is set.
+        """
+        stop_event = stop_event or threading.Event()
+
+        while not stop_event.is_set():
+            self.poll_once()
+            stop_event.wait(self._interval)
+
+    async def run_async(self, queue: asyncio.Queue | None = None) -> None:
+        """
+        Poll documents with the interval until the task is cancelled. Polls are run in the default executor, so the
+        event loop is not blocked. Changes are put into the queue, if it is specified.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            changes = await loop.run_in_executor(None, self.poll_once)
+
+            if queue is not None:
+                for change in changes:
+                    queue.put_nowait(change)
+
+            await asyncio.sleep(self._interval)
+
+    def __check_document(self, document: ScheduleDocument) -> ScheduleChange | None:
+        parsed = document.url in self._documents
+
+        validators = self.__get_validators(document.url)
+        # Validators are not compared if the server sends none of them
+        if (
+            parsed
+            and any(validators)
+            and self._validators.get(document.url) == validators
+        ):
+            return None
+
+        result = self._downloader.download(document)
+        if result is None:
+            return None
+
+        path, is_changed = result
+        self._validators[document.url] = validators
+
+        if parsed and not is_changed:
+            return None
+
+        return self.__parse_document(document, path)
+
+    @staticmethod
+    def __get_validators(url: str) -> tuple[str | None, ...]:
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=30)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as ex:
+            logger.warning(f"HEAD request to {url} failed: {ex}")
+            return (None,) * len(_VALIDATOR_HEADERS)
+
+        return tuple(response.headers.get(header) for header in _VALIDATOR_HEADERS)
+
+    def __parse_document(
+        self, document: ScheduleDocument, path: str
+    ) -> ScheduleChange | None:
+        logger.info(f"Parsing changed document {document.url}")
+
+        try:
+            if document.schedule_type == ScheduleType.EXAM_SESSION:
+                schedule_data = ExcelExamScheduleParser(
+                    path, document.period, document.institute, document.degree
+                ).parse(force=self._force)
+            else:
+                schedule_data = ExcelScheduleParser(
+                    path, document.period, document.institute, document.degree
+                ).parse(force=self._force, schedule_type=document.schedule_type)
+        except Exception as ex:
+            # The previous version of the schedule is kept
+            logger.error(f"Parsing document {document.url} failed: {ex}")
+            return None
+
+        schedule = schedule_data.get_schedule()
+        for item in schedule:
+            item.document_url = document.url
+
+        schedule_type = document.schedule_type
+        old_groups = self._document_groups.get(document.url, set())
+        new_groups = {item.group for item in schedule}
+
+        change = ScheduleChange(
+            document,
+            added=sorted(
+                group
+                for group in new_groups
+                if (schedule_type, group) not in self._group_documents
+            ),
+            updated=sorted(
+                group
+                for group in new_groups
+                if (schedule_type, group) in self._group_documents
+            ),
+        )
+
+        if schedule_type in self._data:
+            self._data[schedule_type].update(schedule)
+        else:
+            self._data[schedule_type] = schedule_data
+
+        self._documents[document.url] = document
+        self._document_groups[document.url] = new_groups
+        for group in new_groups:
+            self._group_documents[(schedule_type, group)] = document.url
+
+        change.removed = self.__remove_groups(document, old_groups - new_groups)
+
+        return change
+
+    def __remove_document(self, document: ScheduleDocument) -> ScheduleChange:
+        logger.info(f"Document {document.url} was removed")
+
+        del self._documents[document.url]
+        groups = self._document_groups.pop(document.url)
+        self._validators.pop(document.url, None)
+
+        return ScheduleChange(document, removed=self.__remove_groups(document, groups))
+
+    def __remove_groups(
+        self, document: ScheduleDocument, groups: set[str]
+    ) -> list[str]:
+        """Remove groups that belong to the document. Groups moved to another document are kept."""
+        schedule_type = document.schedule_type
+        removed = sorted(
+            group
+            for group in groups
+            if self._group_documents.get((schedule_type, group)) == document.url
+        )
+
+        for group in removed:
+            del self._group_documents[(schedule_type, group)]
+
+        if removed:
+            self._data[schedule_type].remove(removed)
+
+        return removed
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import datetime
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from rtu_schedule_parser.constants import ScheduleType
+from rtu_schedule_parser.schedule import Lesson, LessonEmpty
+from rtu_schedule_parser.schedule_data import ScheduleData
+from rtu_schedule_parser.utils import academic_calendar
+
+__all__ = ["Event", "EventIndex"]
+
+
+@dataclass
+class Event:
+    """
+    Lesson occurrence on a concrete date. Start and end are naive datetimes in the local (Moscow) time.
+    """
+
+    start: datetime.datetime
+    end: datetime.datetime
+    group: str
+    lesson: Lesson
+
+
+class _SortedEvents:
+    """For internal use only. Events sorted by start time with a parallel list of start times for binary search."""
+
+    __slots__ = ("events", "starts", "max_duration")
+
+    def __init__(self, events: list[Event]) -> None:
+        self.events = sorted(events, key=lambda event: event.start)
+        self.starts = [event.start for event in self.events]
+        self.max_duration = max(
+            (event.end - event.start for event in self.events),
+            default=datetime.timedelta(),
+        )
+
+    def between(
+        self, start: datetime.datetime | None, end: datetime.datetime | None
+    ) -> list[Event]:
+        left, right = 0, len(self.starts)
+
+        if start is not None:
+            # Events that started before `start` may still be in progress, so the search starts earlier by the
+            # duration of the longest event.
+            left = bisect_left(self.starts, start - self.max_duration)
+        if end is not None:
+            right = bisect_left(self.starts, end, left)
+
+        events = self.events[left:right]
+
+        if start is not None:
+            events = [event for event in events if event.end > start]
+
+        return events
+
+
+class EventIndex:
+    """
+    Index of lesson occurrences. Each lesson is expanded into concrete dates once, using the academic calendar of
+    the group schedule period. Events are stored sorted by start time, so date and time range queries are binary
+    searches.
+
+    Examples:
+        >>> index = EventIndex(schedule_data)
+        >>> index.get_group_events("ИКБО-01-20", datetime.date(2022, 9, 5))
+    """
+
+    def __init__(self, schedule_data: ScheduleData) -> None:
+        if schedule_data.schedule_type == ScheduleType.EXAM_SESSION:
+            raise TypeError("Event index can be built only for lessons schedules")
+
+        # Lesson occurrences are collected for each period and converted to dates with one vectorized call
+        occurrences = {}  # type: dict[tuple[int, int, int], tuple[list, list, list]]
+
+        for schedule in schedule_data.get_schedule():
+            period = schedule.period
+            key = (period.year_start, period.year_end, period.semester)
+            lessons, weekdays, weeks = occurrences.setdefault(key, ([], [], []))
+
+            for lesson in schedule.lessons:
+                if type(lesson) is LessonEmpty:
+                    continue
+
+                lessons.extend((schedule.group, lesson) for _ in lesson.weeks)
+                weekdays.extend(lesson.weekday.value[0] for _ in lesson.weeks)
+                weeks.extend(lesson.weeks)
+
+        events = []
+        groups = {
+            schedule.group: [] for schedule in schedule_data.get_schedule()
+        }  # type: dict[str, list[Event]]
+
+        for key, (lessons, weekdays, weeks) in occurrences.items():
+            dates = academic_calendar.get_days_by_week(
+                academic_calendar.Period(*key), weekdays, weeks
+            ).tolist()
+
+            for (group, lesson), date in zip(lessons, dates):
+                event = Event(
+                    datetime.datetime.combine(date, lesson.time_start),
+                    datetime.datetime.combine(date, lesson.time_end),
+                    group,
+                    lesson,
+                )
+                events.append(event)
+                groups[group].append(event)
+
+        self._events = _SortedEvents(events)
+        self._groups = {
+            group: _SortedEvents(group_events) for group, group_events in groups.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._events.events)
+
+    def __iter__(self):
+        return iter(self._events.events)
+
+    def get_events(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        group: str | None = None,
+    ) -> list[Event]:
+        """
+        Get events that take place between `start` and `end` (including events that are in progress at `start`).
+
+        Args:
+            start: Start of the time range. If not specified, the range is not limited from the left.
+            end: End of the time range (exclusive). If not specified, the range is not limited from the right.
+            group: If specified, only events of this group are returned.
+        """
+        if group is None:
+            events = self._events
+        elif group in self._groups:
+            events = self._groups[group]
+        else:
+            raise ValueError("Group not found")
+
+        return events.between(start, end)
+
+    def get_day_events(
+        self, date: datetime.date, group: str | None = None
+    ) -> list[Event]:
+        """Get events that take place on the date. If `group` is specified, only events of this group are returned."""
+        start = datetime.datetime.combine(date, datetime.time())
+        return self.get_events(start, start + datetime.timedelta(days=1), group)
+
+    def get_group_events(self, group: str, date: datetime.date) -> list[Event]:
+        """Get events of the group on the date."""
+        return self.get_day_events(date, group)
@@ -11,11 +11,10 @@ from typing import Generator
 from openpyxl.worksheet.worksheet import Worksheet
 
 import rtu_schedule_parser.utils.academic_calendar as academic_calendar
-from rtu_schedule_parser import ExamsSchedule
 from rtu_schedule_parser.constants import Degree, ExamType, Institute, ScheduleType
 from rtu_schedule_parser.excel_formatter import ExcelFormatter
 from rtu_schedule_parser.parser import ScheduleParser
-from rtu_schedule_parser.schedule import Exam, ExamEmpty, ExamsSchedule
+from rtu_schedule_parser.schedule import _EMPTY_SLOT, Exam, ExamEmpty, ExamsSchedule
 from rtu_schedule_parser.schedule_data import ScheduleData
 
 __all__ = ["ExcelExamScheduleParser"]
@@ -23,6 +22,10 @@ __all__ = ["ExcelExamScheduleParser"]
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of consecutive blank rows after which the table ends. Days take a few rows, so the empty days of the session
+# are much shorter.
+_TABLE_END_BLANK_ROWS = 10
+
 
 class _ColumnDataType(IntEnum):
     """
@@ -63,107 +66,115 @@ class ExcelExamScheduleParser(ScheduleParser):
         period: academic_calendar.Period,
         institute: Institute,
         degree: Degree,
+        max_rows: int | None = None,
     ) -> None:
-        super().__init__(document_path, ExcelFormatter(), period, institute, degree)
+        super().__init__(
+            document_path, ExcelFormatter(), period, institute, degree, max_rows
+        )
+
+    # Start time of the exam in the format "hh-mm" (e.g. 10-30) or "h-mm" (e.g. 9-30)
+    _RE_START_TIME = re.compile(r"(\d{1,2})-(\d{2})")
 
     def __parse_exams(
-        self, group_column: int, exam_rows: list[_ExamRow], worksheet: Worksheet
-    ) -> Generator[Exam | ExamEmpty, None, None]:
+        self,
+        group_column: int,
+        exam_rows: list[_ExamRow],
+        row_days: list[int],
+        day_exams: bytearray,
+    ) -> Generator[tuple[int, Exam | ExamEmpty], None, None]:
         """
-        Parses the exams from the table.
+        Parses the exams from the table in one pass over the rows. Only the first exam of each day is parsed: rows of
+        the days that are already set in `day_exams` are skipped without reading their cells.
 
         Args:
             group_column: The column in which the group name is located.
             exam_rows: The rows of the table.
-            worksheet: The worksheet in which the table is located.
+            row_days: Index of the day of each row.
+            day_exams: Days that already have an exam. It is updated by the caller after each yielded exam.
 
         Yields:
-            The parsed exams.
+            Index of the day and the parsed exam.
         """
 
         # Convert to 0-based index
         group_column -= 1
+        rows_count = len(exam_rows)
 
         for i, exam_row_data in enumerate(exam_rows):
+            day_index = row_days[i]
+            if day_exams[day_index]:
+                continue
+
             row = exam_row_data.row
 
-            exam_type, exam_name, exam_teachers, time_start = None, None, None, None
-            rooms = row[group_column + _ColumnDataType.ROOM].value
-            start_time_cell_value = row[group_column + _ColumnDataType.START_TIME].value
+            exam_type = row[group_column + _ColumnDataType.GROUP].value
+            if exam_type:
+                normalized_exam_type_or_name = exam_type.replace(" ", "").lower()
+                if normalized_exam_type_or_name == "консультация":
+                    exam_type = ExamType.CONSULTATION
+                elif normalized_exam_type_or_name == "экзамен":
+                    exam_type = ExamType.EXAMINATION
+                else:
+                    exam_type = None
 
-            try:
-                exam_type = exam_rows[i].row[group_column + _ColumnDataType.GROUP].value
-                if exam_type:
-                    normalized_exam_type_or_name = exam_type.replace(" ", "").lower()
-                    if normalized_exam_type_or_name == "консультация":
-                        exam_type = ExamType.CONSULTATION
-                    elif normalized_exam_type_or_name == "экзамен":
-                        exam_type = ExamType.EXAMINATION
-                    else:
-                        exam_type = None
-
-                if (
-                    exam_type
-                ):  # If the exam type is not None, then the exam name and teachers are in the next row
-                    # Example of offsets:
-                    # +---------------------------+---+
-                    # | Консультация              | 0 |
-                    # +---------------------------+---+
-                    # | Проектирование баз данных | 1 |
-                    # +---------------------------+---+
-                    # | Богомольная Г.В.          | 2 |
-                    # +---------------------------+---+
-                    exam_name = (
-                        exam_rows[i + 1].row[group_column + _ColumnDataType.GROUP].value
-                    )
-                    exam_teachers = (
-                        exam_rows[i + 2].row[group_column + _ColumnDataType.GROUP].value
-                    )
-                    exam_teachers = str(exam_teachers) if exam_teachers else ""
-
-                if exam_name:
-                    exam_name = exam_name.strip()
-                    exam_teachers = self._formatter.get_teachers(exam_teachers)
-
-                if rooms:
-                    rooms = self._formatter.get_rooms(rooms)
-                    rooms = [self._set_default_campus(room) for room in rooms]
-
-                if start_time_cell_value:
-                    try:
-                        # In one cell, the time can be written in two ways:
-                        # Match the time in the format "hh-mm" (e.g. 10-30) or "h-mm" (e.g. 9-30)
-                        if times := re.findall(
-                            r"(\d{1,2}-\d{2})",
-                            start_time_cell_value,
-                        ):
-                            time_start = datetime.time(
-                                hour=int(times[0].split("-")[0]),
-                                minute=int(times[0].split("-")[1]),
-                            )
-
-                    except ValueError:
-                        time_start = None
-
-                if exam_name is None:
-                    yield ExamEmpty(
-                        month=exam_row_data.month,
-                        day=exam_row_data.day,
-                    )
+            if not exam_type:
+                # Name or teacher row of the previous exam, or an empty row
+                yield day_index, ExamEmpty(
+                    month=exam_row_data.month, day=exam_row_data.day
+                )
+                continue
+
+            if i + 2 >= rows_count:
+                # The exam is cut off by the end of the table
+                return
+
+            # The exam name and teachers are in the next rows. Example of offsets:
+            # +---------------------------+---+
+            # | Консультация              | 0 |
+            # +---------------------------+---+
+            # | Проектирование баз данных | 1 |
+            # +---------------------------+---+
+            # | Богомольная Г.В.          | 2 |
+            # +---------------------------+---+
+            exam_name = exam_rows[i + 1].row[group_column + _ColumnDataType.GROUP].value
+
+            if exam_name is None:
+                yield day_index, ExamEmpty(
+                    month=exam_row_data.month, day=exam_row_data.day
+                )
+                continue
 
-                elif exam_name and exam_type and time_start:
-                    yield Exam(
-                        month=exam_row_data.month,
-                        day=exam_row_data.day,
-                        time_start=time_start,
-                        name=exam_name,
-                        exam_type=exam_type,
-                        teachers=exam_teachers or [],
-                        rooms=rooms or [],
-                    )
+            time_start = None
+            start_time_cell_value = row[group_column + _ColumnDataType.START_TIME].value
+            if start_time_cell_value:
+                # Only the first time of the cell is used
+                if match := self._RE_START_TIME.search(start_time_cell_value):
+                    with contextlib.suppress(ValueError):
+                        time_start = datetime.time(
+                            hour=int(match.group(1)), minute=int(match.group(2))
+                        )
+
+            # Exams without the name or the start time are skipped
+            exam_name = exam_name.strip()
+            if not exam_name or not time_start:
+                continue
+
+            exam_teachers = (
+                exam_rows[i + 2].row[group_column + _ColumnDataType.GROUP].value
+            )
+            rooms = row[group_column + _ColumnDataType.ROOM].value
 
-            except IndexError:
-                break
+            yield day_index, Exam(
+                month=exam_row_data.month,
+                day=exam_row_data.day,
+                time_start=time_start,
+                name=exam_name,
+                exam_type=exam_type,
+                teachers=self._formatter.get_teachers(
+                    str(exam_teachers) if exam_teachers else ""
+                ),
+                rooms=self._get_rooms(rooms) if rooms else [],
+            )
 
     def __parse_exams_rows(
         self, group_cell_index: int, group_row_index: int, worksheet: Worksheet
@@ -175,16 +186,34 @@ class ExcelExamScheduleParser(ScheduleParser):
         # The index of the first row in the table
         initial_row_num = group_row_index + 1
 
-        row_count = min(worksheet.max_row, 100)
-
         month, day = None, None
 
+        # Blank rows are yielded only if the table continues after them, so the blank rows under the table (e.g. styled
+        # empty rows) are not a part of the last day. Rows of the last day are not limited, it can be taller than the
+        # other days.
+        blank_rows = []  # type: list[_ExamRow]
+
         group_cell_index -= 1  # Convert to 0-based index
 
-        for row in worksheet.iter_rows(min_row=initial_row_num, max_row=row_count):
+        for row in worksheet.iter_rows(
+            min_row=initial_row_num, max_row=self._get_last_row(initial_row_num)
+        ):
             month_cell_value = row[group_cell_index + _ColumnDataType.MONTH].value
             day_cell_value = row[group_cell_index + _ColumnDataType.DAY].value
 
+            if (
+                month_cell_value is None
+                and day_cell_value is None
+                and all(cell.value is None for cell in row)
+            ):
+                if month and day:
+                    blank_rows.append(_ExamRow(month=month, day=day, row=row))
+
+                    # Blank rows have no date cells, so a long run of them is under the last day of the table
+                    if len(blank_rows) >= _TABLE_END_BLANK_ROWS:
+                        break
+                continue
+
             with contextlib.suppress(ValueError):
                 if month_cell_value:
                     month_cell_value = month_cell_value.replace(" ", "")
@@ -199,6 +228,9 @@ class ExcelExamScheduleParser(ScheduleParser):
                         day = int(only_digits)
 
                 if month and day:
+                    yield from blank_rows
+                    blank_rows.clear()
+
                     yield _ExamRow(
                         month=month,
                         day=day,
@@ -206,48 +238,79 @@ class ExcelExamScheduleParser(ScheduleParser):
                     )
 
     def __parse_worksheet(
-        self, worksheet: Worksheet, force: bool = False
+        self, worksheet: Worksheet, force: bool = False, skip_empty: bool = False
     ) -> list[ExamsSchedule] | None:
         schedule = []  # type: list[ExamsSchedule]
 
-        group_name_row = self._find_group_row(worksheet)
+        with self._measure("find_groups"):
+            group_name_row = self._find_group_row(worksheet)
 
-        if group_name_row is None:
-            return
+            if group_name_row is None:
+                return
 
-        group_columns = self._get_group_columns(group_name_row, worksheet)
+            group_columns = self._get_group_columns(group_name_row, worksheet)
 
-        first_group_column = group_columns[0][1]
-        exams_cells = list(
-            self.__parse_exams_rows(first_group_column, group_name_row, worksheet)
-        )
+        with self._measure("parse_rows"):
+            first_group_column = group_columns[0][1]
+            exams_cells = list(
+                self.__parse_exams_rows(first_group_column, group_name_row, worksheet)
+            )
+
+            # Days of the table are shared by all groups
+            days = tuple(dict.fromkeys((row.month, row.day) for row in exams_cells))
+            day_indexes = {day: i for i, day in enumerate(days)}
+            row_days = [day_indexes[(row.month, row.day)] for row in exams_cells]
+
+        self._count("worksheets")
+        self._count("rows", len(exams_cells))
 
         for group_column in group_columns:
             try:
                 exams = []
+                # Only the first exam of the day is used: 1 - exam, `_EMPTY_SLOT` - empty day, 0 - not parsed yet
+                day_exams = bytearray(len(days))
+
+                with self._measure("parse_groups"):
+                    for day_index, exam in self.__parse_exams(
+                        group_column[1], exams_cells, row_days, day_exams
+                    ):
+                        if type(exam) is ExamEmpty:
+                            day_exams[day_index] = _EMPTY_SLOT
+                            if skip_empty:
+                                continue
+                        else:
+                            day_exams[day_index] = 1
 
-                for exam in self.__parse_exams(group_column[1], exams_cells, worksheet):
-                    if (exam.day, exam.month) not in ((i.day, i.month) for i in exams):
                         exams.append(exam)
 
+                if self._metrics is not None:
+                    self._metrics.increment("groups")
+                    self._metrics.increment(
+                        "exams", sum(1 for exam in exams if type(exam) is Exam)
+                    )
+
                 group_name = group_column[0]
 
                 logger.info(
                     f"Processing group '{group_name}', worksheet '{worksheet.title}'"
                 )
 
-                schedule.append(
-                    ExamsSchedule(
-                        group=group_name,
-                        period=self._period,
-                        institute=self._institute,
-                        degree=self._degree,
-                        document_url=None,  # TODO: implement
-                        exams=exams,
-                    )
+                group_schedule = ExamsSchedule(
+                    group=group_name,
+                    period=self._period,
+                    institute=self._institute,
+                    degree=self._degree,
+                    document_url=None,  # TODO: implement
+                    exams=exams,
                 )
+                if skip_empty:
+                    group_schedule._set_slots(days, bytes(day_exams))
+
+                schedule.append(group_schedule)
 
             except ValueError:
+                self._count("errors")
+
                 if not force:
                     raise
                 else:
@@ -259,23 +322,29 @@ class ExcelExamScheduleParser(ScheduleParser):
         return schedule
 
     def parse(
-        self, force: bool = False, generate_dataframe: bool = False
+        self,
+        force: bool = False,
+        generate_dataframe: bool = False,
+        skip_empty: bool = False,
     ) -> ScheduleData:
         """
         Args:
             force: If True, then the schedule will be parsed even if exceptions occur during parsing.
             generate_dataframe: If True, then the schedule will be converted to a pandas DataFrame. It increases the
                 parsing time.
+            skip_empty: If True, then empty days are not stored in `ExamsSchedule.exams`. Use
+                `ExamsSchedule.get_grid()` to get all days including the empty ones.
         """
 
-        self._open_worksheets()
+        with self._measure("parse"):
+            self._open_worksheets()
 
-        schedule = []
+            schedule = []
 
-        for worksheet in self._worksheets:
-            if result := self.__parse_worksheet(worksheet, force):
-                schedule.extend(result)
+            for worksheet in self._worksheets:
+                if result := self.__parse_worksheet(worksheet, force, skip_empty):
+                    schedule.extend(result)
 
-        return ScheduleData(
-            schedule, generate_dataframe, schedule_type=ScheduleType.EXAM_SESSION
-        )
+            return ScheduleData(
+                schedule, generate_dataframe, schedule_type=ScheduleType.EXAM_SESSION
+            )
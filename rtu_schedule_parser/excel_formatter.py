@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+from collections import Counter
 from dataclasses import replace
+from types import MappingProxyType
+from typing import Mapping
 
 from .constants import Campus, LessonType, RoomType, TestSessionLessonType
 from .formatter import Formatter
@@ -12,6 +16,54 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _build_lesson_type_aliases() -> Mapping[str, LessonType | TestSessionLessonType]:
+    # If an alias is listed for several types, the first type is used
+    aliases = (
+        (LessonType.PRACTICE, (LessonType.PRACTICE.value, "п", "пр", "кр", "крпа")),
+        (LessonType.LECTURE, (LessonType.LECTURE.value, "лк", "лек", "л")),
+        (LessonType.INDIVIDUAL_WORK, (LessonType.INDIVIDUAL_WORK.value, "ср")),
+        (
+            LessonType.LABORATORY_WORK,
+            (LessonType.LABORATORY_WORK.value, "лб", "лаб", "лр"),
+        ),
+        (
+            TestSessionLessonType.CREDIT,
+            (TestSessionLessonType.CREDIT.value, "зач", "з"),
+        ),
+        (
+            TestSessionLessonType.COURSE_WORK,
+            (
+                TestSessionLessonType.COURSE_WORK.value,
+                "к/р",
+                "защ кр",
+                "защ к/р",
+                "защ",
+            ),
+        ),
+        (
+            TestSessionLessonType.COURSE_PROJECT,
+            (TestSessionLessonType.COURSE_PROJECT.value, "к/п"),
+        ),
+        (
+            TestSessionLessonType.DIFFERENTIATED_CREDIT,
+            (
+                TestSessionLessonType.DIFFERENTIATED_CREDIT.value,
+                "диф. зач",
+                "д/з",
+                "диф",
+                "зд",
+            ),
+        ),
+    )
+
+    mapping = {}
+    for lesson_type, names in aliases:
+        for name in names:
+            mapping.setdefault(name, lesson_type)
+
+    return MappingProxyType(mapping)
+
+
 class ExcelFormatter(Formatter):
     """Format the lesson name according to the specified rules."""
 
@@ -37,6 +89,34 @@ class ExcelFormatter(Formatter):
 
     _RE_SEPARATORS = r" {2,}|\n{1,}|,|;|\+|\/"
 
+    # Teachers cells patterns are compiled once
+    _RE_SEPARATORS_COMPILED = re.compile(_RE_SEPARATORS)
+    _RE_CYRILLIC = re.compile(r"[а-яА-Я]")
+    _RE_EMPTY_SUBGROUP_TEACHER = re.compile(
+        r"^(\d п/г)$", flags=re.IGNORECASE | re.MULTILINE
+    )
+    # Comma instead of a dot after an initial
+    _RE_TEACHER_INITIALS_TYPO = re.compile(r"([а-яё]),( {0,2}[а-яё][. ])", flags=re.I)
+    _RE_TEACHER_FULL_NAME = re.compile(
+        r"([а-яА-ЯёЁ]+)\s+([а-яА-ЯёЁ]+)\.?\s*([а-яА-ЯёЁ]+)\.?"
+    )
+    _RE_TEACHER_INITIALS = re.compile(
+        r"([а-яА-ЯёЁ\-]+) ([а-яА-ЯёЁ])\.? ?([а-яА-ЯёЁ])\.?"
+    )
+    _RE_TEACHER_HAS_SUBGROUPS = re.compile(rf"(\d) ?{_RE_SUBGROUPS}")
+    _RE_TEACHER_WITH_SUBGROUP = re.compile(
+        rf"([а-яА-ЯёЁ\- \.]+), ?(\d) ?{_RE_SUBGROUPS}({_RE_SEPARATORS})?|([а-яА-ЯёЁ\- \.]+)",
+        flags=re.I,
+    )
+    # Names with initials (e.g. И.И. Иванов) may be separated by spaces
+    _RE_TEACHER_NAME = re.compile(
+        r"(?:(?:(?:[а-яё\-]{1,}) +(?:[а-яё]{1}\. {0,2}){1,2})|(?:(?:[а-яё\-]{3,}) ?))",
+        flags=re.I,
+    )
+
+    # Lesson type aliases in lower case. Built once, new aliases are added with `register_lesson_type()`.
+    _LESSON_TYPE_ALIASES = _build_lesson_type_aliases()
+
     # Room type short names
     ROOM_TYPE_SHORT_NAMES = {
         "ауд": RoomType.AUDITORY,
@@ -50,6 +130,14 @@ class ExcelFormatter(Formatter):
         "лаб спец": RoomType.LABORATORY,
     }
 
+    def __init__(self) -> None:
+        # Unknown lesson type -> number of occurrences
+        self._unknown_lesson_types = Counter()  # type: Counter[str]
+        # Teachers cell -> parsed teachers
+        self._teachers_cache = (
+            {}
+        )  # type: dict[str, tuple[str | tuple[str, int | None], ...]]
+
     def __format_subgroups_and_type(self, lesson: str) -> list:
         """Format rare cases when subgroup and lesson type are specified in a strange way.
 
@@ -410,115 +498,114 @@ class ExcelFormatter(Formatter):
 
     def __replace_empty_teachers_to_text(self, text: str) -> str:
         """Иногда стоят подгруппы бе преподавателей, заменяем их на текст. Такое бывает, если расписание не доделано."""
-        return re.sub(
-            r"^(\d п/г)$",
-            r"Нет,\g<1>",
-            text.strip(),
-            flags=re.IGNORECASE | re.MULTILINE,
-        )
-
-    def get_teachers(self, names_cell_value: str) -> list[str] | list[tuple[str, int]]:
-        if not re.search(r"[а-яА-Я]", names_cell_value):
-            return []
-
-        names_cell_value = self.__replace_empty_teachers_to_text(names_cell_value)
+        return self._RE_EMPTY_SUBGROUP_TEACHER.sub(r"Нет,\g<1>", text.strip())
 
-        teachers_names = names_cell_value.strip()
+    def __fix_teacher_typos(self, formatted_name: str) -> str:
+        # Format names to "Иванов И.И." format
+        fixed = self._RE_TEACHER_FULL_NAME.sub(
+            r"\g<1> \g<2>.\g<3>.", formatted_name
+        ).strip()
 
-        re_typos = r"[а-яё]{1}(,) {0,2}[а-яё]{1}[. ]"
-        typos = re.finditer(re_typos, teachers_names, flags=re.I)
-        for typo in typos:
-            teachers_names = (
-                f"{teachers_names[:typo.span(1)[0]]}.{teachers_names[typo.span(1)[1]:]}"
-            )
+        return fixed or formatted_name
 
-        def fix_typos(formatted_name: str):
-            # Format names to "Иванов И.И." format
-            re_name = r"([а-яА-ЯёЁ]+)\s+([а-яА-ЯёЁ]+)\.?\s*([а-яА-ЯёЁ]+)\.?"
+    def __normalize_teacher_names(self, names: list[str]) -> list[str]:
+        # Format names like "Иванов И.И.", "Иванов И. И.", "Иванов И И.", "Иванов И. И" and etc to "Иванов И.И."
+        return [
+            self._RE_TEACHER_INITIALS.sub(r"\g<1> \g<2>.\g<3>.", name) for name in names
+        ]
 
-            fixed = re.sub(re_name, r"\g<1> \g<2>.\g<3>.", formatted_name).strip()
+    def __parse_teacher_subgroups(
+        self, cell_value: str
+    ) -> list[tuple[str, int | None]] | None:
+        """Parse teacher subgroups from teacher name.
+        Returns list of tuples with teacher name and subgroup number.
+        Or None if no subgroups found in teacher names cell.
 
-            if not fixed or abs(len(formatted_name) - len(formatted_name)) > 3:
-                return formatted_name
-
-            return fixed
+        Example:
+            "Казачкова О.А.,1 пг\nИванова И.С.,2 пг" -> [("Казачкова О.А.", 1), ("Иванова И.С.", 2)]
+            "Казачкова О.А.,1 пг\nИванова И.С" -> [("Казачкова О.А.", 1), ("Иванова И.С.", None)]
+        """
+        if not self._RE_TEACHER_HAS_SUBGROUPS.search(cell_value):
+            return None
 
-        names = re.split(self._RE_SEPARATORS, teachers_names)
+        teachers = self._RE_TEACHER_WITH_SUBGROUP.findall(cell_value)
 
-        def parse_teacher_subgroups(
-            cell_value: str,
-        ) -> list[tuple[str, int | None]] | None:
-            """Parse teacher subgroups from teacher name.
-            Returns list of tuples with teacher name and subgroup number.
-            Or None if no subgroups found in teacher names cell.
+        if not teachers:
+            return None
 
-            Example:
-                "Казачкова О.А.,1 пг\nИванова И.С.,2 пг" -> [("Казачкова О.А.", 1), ("Иванова И.С.", 2)]
-                "Казачкова О.А.,1 пг\nИванова И.С" -> [("Казачкова О.А.", 1), ("Иванова И.С.", None)]
-            """
+        result = []
 
-            if not re.search(rf"(\d) ?{self._RE_SUBGROUPS}", cell_value):
-                return None
+        for teacher in teachers:
+            teacher_name, subgroup, _, _, teacher_name_without_subgroup = teacher
 
-            re_teacher = rf"([а-яА-ЯёЁ\- \.]+), ?(\d) ?{self._RE_SUBGROUPS}({self._RE_SEPARATORS})?|([а-яА-ЯёЁ\- \.]+)"
+            if (
+                len(teacher_name.strip()) < 3
+                and len(teacher_name_without_subgroup.strip()) < 3
+            ):
+                continue
 
-            re_teacher = re.compile(re_teacher, flags=re.I)
-            teachers = re_teacher.findall(cell_value)
+            if teacher_name and not teacher_name_without_subgroup:
+                teacher_name = self.__fix_teacher_typos(teacher_name)
+            elif teacher_name_without_subgroup and not teacher_name:
+                teacher_name_without_subgroup = self.__fix_teacher_typos(
+                    teacher_name_without_subgroup
+                )
 
-            if not teachers:
-                return None
+            subgroup = int(subgroup) if subgroup else None
+            if subgroup:
+                result.append((teacher_name.strip(), subgroup))
+            else:
+                result.append((teacher_name_without_subgroup.strip(), None))
 
-            result = []
+        return result
 
-            for teacher in teachers:
-                teacher_name, subgroup, _, _, teacher_name_without_subgroup = teacher
+    def get_teachers(self, names_cell_value: str) -> list[str] | list[tuple[str, int]]:
+        # The same teachers cells are repeated in all weeks and groups, so the result is parsed once for each cell.
+        # A copy is returned, because the parsers modify the list.
+        cached = self._teachers_cache.get(names_cell_value)
+        if cached is None:
+            cached = tuple(
+                (
+                    (sys.intern(teacher[0]), teacher[1])
+                    if isinstance(teacher, tuple)
+                    else sys.intern(teacher)
+                )
+                for teacher in self.__get_teachers(names_cell_value)
+            )
+            self._teachers_cache[names_cell_value] = cached
 
-                if (
-                    len(teacher_name.strip()) < 3
-                    and len(teacher_name_without_subgroup.strip()) < 3
-                ):
-                    continue
+        return list(cached)
 
-                if teacher_name and not teacher_name_without_subgroup:
-                    teacher_name = fix_typos(teacher_name)
-                elif teacher_name_without_subgroup and not teacher_name:
-                    teacher_name_without_subgroup = fix_typos(
-                        teacher_name_without_subgroup
-                    )
+    def __get_teachers(
+        self, names_cell_value: str
+    ) -> list[str] | list[tuple[str, int | None]]:
+        if not self._RE_CYRILLIC.search(names_cell_value):
+            return []
 
-                subgroup = int(subgroup) if subgroup else None
-                if subgroup:
-                    result.append((teacher_name.strip(), subgroup))
-                else:
-                    result.append((teacher_name_without_subgroup.strip(), None))
+        names_cell_value = self.__replace_empty_teachers_to_text(names_cell_value)
 
-            return result
+        # Replace commas between initials with dots, e.g. "Комарова М,И." -> "Комарова М.И."
+        teachers_names = self._RE_TEACHER_INITIALS_TYPO.sub(
+            r"\g<1>.\g<2>", names_cell_value.strip()
+        )
 
-        def normalize_names(names_to_normalize: list[str]) -> list[str]:
-            # Format names like "Иванов И.И.", "Иванов И. И.", "Иванов И И.", "Иванов И. И" and etc to "Иванов И.И."
-            return [
-                re.sub(
-                    r"([а-яА-ЯёЁ\-]+) ([а-яА-ЯёЁ])\.? ?([а-яА-ЯёЁ])\.?",
-                    r"\g<1> \g<2>.\g<3>.",
-                    name,
-                )
-                for name in names_to_normalize
-            ]
+        names = self._RE_SEPARATORS_COMPILED.split(teachers_names)
 
         if len(names) > 1:
-            with_subgroups = parse_teacher_subgroups(names_cell_value)
+            with_subgroups = self.__parse_teacher_subgroups(names_cell_value)
 
             return with_subgroups or [
                 name.strip()
-                for name in normalize_names(names)
+                for name in self.__normalize_teacher_names(names)
                 if len(name.strip().replace(" ", "")) > 2
             ]
 
-        # Names with initials (e.g. И.И. Иванов) may be separated by spaces
-        re_teacher_name = r"(?:(?:(?:[а-яё\-]{1,}) +(?:[а-яё]{1}\. {0,2}){1,2})|(?:(?:[а-яё\-]{3,}) ?))"
-        found = re.findall(re_teacher_name, teachers_names, flags=re.I)
+        found = self._RE_TEACHER_NAME.findall(teachers_names)
 
-        found = [fix_typos(name) for name in normalize_names(found)]
+        found = [
+            self.__fix_teacher_typos(name)
+            for name in self.__normalize_teacher_names(found)
+        ]
 
         return [x.strip() for x in found if len(x.strip()) > 2]
 
@@ -526,44 +613,50 @@ class ExcelFormatter(Formatter):
         self, type_name: str
     ) -> LessonType | TestSessionLessonType | None:
         """Get lesson type by name"""
-        if type_name in [LessonType.PRACTICE.value, "п", "пр", "кр", "крпа"]:
-            return LessonType.PRACTICE
-        elif type_name in [LessonType.LECTURE.value, "лк", "лек", "л"]:
-            return LessonType.LECTURE
-        elif type_name in [LessonType.INDIVIDUAL_WORK.value, "ср"]:
-            return LessonType.INDIVIDUAL_WORK
-        elif type_name in [LessonType.LABORATORY_WORK.value, "лб", "лаб", "лр"]:
-            return LessonType.LABORATORY_WORK
-        elif type_name in [TestSessionLessonType.CREDIT.value, "зач", "з"]:
-            return TestSessionLessonType.CREDIT
-        elif type_name in [
-            TestSessionLessonType.COURSE_WORK.value,
-            "к/р",
-            "защ кр",
-            "защ к/р",
-            "защ",
-        ]:
-            return TestSessionLessonType.COURSE_WORK
-        elif type_name in [TestSessionLessonType.COURSE_PROJECT.value, "к/п"]:
-            return TestSessionLessonType.COURSE_PROJECT
-        elif type_name in [
-            TestSessionLessonType.DIFFERENTIATED_CREDIT.value,
-            "диф. зач",
-            "д/з",
-            "диф",
-            "зд",
-        ]:
-            return TestSessionLessonType.DIFFERENTIATED_CREDIT
-        else:
-            logger.warning(f"Unknown lesson type: {type_name}")
-            return None
+        if (lesson_type := self._LESSON_TYPE_ALIASES.get(type_name)) is not None:
+            return lesson_type
 
-    def get_weeks(self, lesson: str, is_even=None, max_weeks=None) -> list[list[int]]:
-        result = []
+        self.__report_unknown_lesson_type(type_name)
+        return None
+
+    def __report_unknown_lesson_type(self, type_name: str) -> None:
+        """Count the unknown lesson type. Only the first occurrence of each type is logged."""
+        self._unknown_lesson_types[type_name] += 1
+
+        if self._unknown_lesson_types[type_name] == 1 and logger.isEnabledFor(
+            logging.WARNING
+        ):
+            logger.warning("Unknown lesson type: %s", type_name)
+
+    def get_unknown_lesson_types(self) -> dict[str, int]:
+        """Get unknown lesson types found by this formatter and the number of their occurrences."""
+        return dict(self._unknown_lesson_types)
 
+    @classmethod
+    def register_lesson_type(
+        cls, alias: str, lesson_type: LessonType | TestSessionLessonType
+    ) -> None:
+        """
+        Register an abbreviation of the lesson type. The alias must be in lower case, as lesson types are looked up
+        in lower case. An existing alias is replaced.
+
+        Examples:
+            >>> ExcelFormatter.register_lesson_type("семинар", LessonType.PRACTICE)
+        """
+        cls._LESSON_TYPE_ALIASES = MappingProxyType(
+            {**cls._LESSON_TYPE_ALIASES, alias: lesson_type}
+        )
+
+    def get_weeks(self, lesson: str, is_even=None, max_weeks=None) -> list[list[int]]:
         lesson = self.__fix_lesson_typos(lesson)
 
-        lessons = self.__split_lessons(lesson)
+        return self.__get_weeks(self.__split_lessons(lesson), is_even, max_weeks)
+
+    def __get_weeks(
+        self, lessons: list[str], is_even=None, max_weeks=None
+    ) -> list[list[int]]:
+        """Get weeks of the lessons split by `__split_lessons()`."""
+        result = []
 
         include_weeks = (
             r"(\b(\d+[-, ]*)+)((н|нед)?(?![.\s,\-\d]*(?:подгруппа|подгруп|подгр|п\/г|группа|гр))"
@@ -639,7 +732,23 @@ class ExcelFormatter(Formatter):
     ) -> list[tuple[str, LessonType | None, int | None]]:
         lesson = self.__fix_lesson_typos(lessons_cell_value)
 
-        lessons = self.__format_subgroups(self.__split_lessons(lesson))
+        return self.__get_lessons(self.__split_lessons(lesson))
+
+    def parse_subject_cell(
+        self, value: str, is_even: bool | None = None, max_weeks: int | None = None
+    ) -> tuple[list[tuple[str, LessonType | None, int | None]], list[list[int]]]:
+        # The cell value is fixed and split once for both the lessons and the weeks
+        lessons = self.__split_lessons(self.__fix_lesson_typos(value))
+
+        return self.__get_lessons(lessons), self.__get_weeks(
+            lessons, is_even, max_weeks
+        )
+
+    def __get_lessons(
+        self, lessons: list[str]
+    ) -> list[tuple[str, LessonType | None, int | None]]:
+        """Get names, types and subgroups of the lessons split by `__split_lessons()`."""
+        lessons = self.__format_subgroups(lessons)
         result = []
 
         for i in range(len(lessons)):
@@ -13,7 +13,12 @@ import rtu_schedule_parser.utils.academic_calendar as academic_calendar
 from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
 from rtu_schedule_parser.excel_formatter import ExcelFormatter
 from rtu_schedule_parser.parser import ScheduleParser
-from rtu_schedule_parser.schedule import Lesson, LessonEmpty, LessonsSchedule
+from rtu_schedule_parser.schedule import (
+    _EMPTY_SLOT,
+    Lesson,
+    LessonEmpty,
+    LessonsSchedule,
+)
 from rtu_schedule_parser.schedule_data import ScheduleData
 
 __all__ = ["ExcelScheduleParser"]
@@ -65,8 +70,11 @@ class ExcelScheduleParser(ScheduleParser):
         period: academic_calendar.Period,
         institute: Institute,
         degree: Degree,
+        max_rows: int | None = None,
     ) -> None:
-        super().__init__(document_path, ExcelFormatter(), period, institute, degree)
+        super().__init__(
+            document_path, ExcelFormatter(), period, institute, degree, max_rows
+        )
 
     def __get_lesson_element(
         self, lesson_length: int, lesson_index: int, elements: list[Any]
@@ -90,15 +98,21 @@ class ExcelScheduleParser(ScheduleParser):
             return None
 
     def __parse_lessons(
-        self, group_column: int, lesson_rows: list[_LessonRow], worksheet: Worksheet
-    ) -> Generator[Lesson | LessonEmpty, None, None]:
+        self,
+        group_column: int,
+        lesson_rows: list[_LessonRow],
+        empty_lessons: tuple[LessonEmpty, ...],
+        worksheet: Worksheet,
+    ) -> Generator[tuple[int, Lesson | LessonEmpty], None, None]:
         """
         Parses the lessons for the group. The lessons are parsed from the table in the worksheet. The lessons are
         parsed from the cells specified in the lesson_cells list. The lessons are parsed for the group in the
         column specified by the group_column parameter.
+
+        Yields the index of the row and the lesson. Empty cells are the shared empty lessons of the rows.
         """
         group_column -= 1
-        for lesson_row_data in lesson_rows:
+        for row_index, lesson_row_data in enumerate(lesson_rows):
             row = lesson_row_data.row
 
             subjects = row[group_column + _ColumnDataType.SUBJECT].value
@@ -109,17 +123,11 @@ class ExcelScheduleParser(ScheduleParser):
             rooms = str(rooms) if rooms else ""
 
             if subjects is None or subjects.strip() == "":
-                yield LessonEmpty(
-                    lesson_row_data.num,
-                    lesson_row_data.weekday,
-                    lesson_row_data.time_start,
-                    lesson_row_data.time_end,
-                )
+                yield row_index, empty_lessons[row_index]
             else:
                 is_even_week = lesson_row_data.week % 2 == 0
 
-                lesson_names = self._formatter.get_lessons(subjects)
-                lesson_weeks = self._formatter.get_weeks(
+                lesson_names, lesson_weeks = self._formatter.parse_subject_cell(
                     subjects, is_even_week, academic_calendar.MAX_WEEKS
                 )
 
@@ -132,7 +140,7 @@ class ExcelScheduleParser(ScheduleParser):
                 if types:
                     lesson_types = self._formatter.get_types(types)
                 if rooms:
-                    lesson_rooms = self._formatter.get_rooms(rooms)
+                    lesson_rooms = self._get_rooms(rooms)
 
                 lessons_len = len(lesson_names)
 
@@ -148,9 +156,6 @@ class ExcelScheduleParser(ScheduleParser):
                         else None
                     )
 
-                    if lesson_room:
-                        lesson_room = self._set_default_campus(lesson_room)
-
                     lesson_teachers = (
                         lesson_teachers or []
                     )  # type: list[str] | list[tuple[str, int]] | None
@@ -176,7 +181,7 @@ class ExcelScheduleParser(ScheduleParser):
                         for teacher in lesson_teachers
                     ]
 
-                    yield Lesson(
+                    yield row_index, Lesson(
                         lesson_row_data.num,
                         lesson_names[i][0],
                         lesson_weeks[i],
@@ -201,12 +206,13 @@ class ExcelScheduleParser(ScheduleParser):
         # Header line with the names of the columns after the group name
         initial_row_num = group_row_index + 2
 
-        row_count = min(worksheet.max_row, 100)
-
         weekday, lesson_num, time_start, time_end = None, None, None, None
+        table_started = False
 
         group_cell_index -= 1  # Convert to 0-based index
-        for row in worksheet.iter_rows(min_row=initial_row_num, max_row=row_count):
+        for row in worksheet.iter_rows(
+            min_row=initial_row_num, max_row=self._get_last_row(initial_row_num)
+        ):
             # The parity of the week is determined by the row number in the table. The rest through the line, so
             # find the parity of the week in each iteration (row).
             #
@@ -218,6 +224,19 @@ class ExcelScheduleParser(ScheduleParser):
 
             week = None
 
+            week_cell_value = row[group_cell_index + _ColumnDataType.WEEK].value
+            if week_cell_value == "I":
+                week = 1
+            elif week_cell_value == "II":
+                week = 2
+
+            if week is not None:
+                table_started = True
+            elif table_started:
+                # All rows of the table have the week, so the table ends before the first row without it (e.g. notes
+                # under the table or styled empty rows)
+                break
+
             weekday_cell_value = row[group_cell_index + _ColumnDataType.WEEKDAY].value
             lesson_num_cell_value = row[
                 group_cell_index + _ColumnDataType.LESSON_NUMBER
@@ -226,7 +245,6 @@ class ExcelScheduleParser(ScheduleParser):
                 group_cell_index + _ColumnDataType.START_TIME
             ].value
             end_time_cell_value = row[group_cell_index + _ColumnDataType.END_TIME].value
-            week_cell_value = row[group_cell_index + _ColumnDataType.WEEK].value
 
             with contextlib.suppress(ValueError):
                 if weekday_cell_value:
@@ -249,58 +267,90 @@ class ExcelScheduleParser(ScheduleParser):
                 if end_time_cell_value:
                     time_end = get_time(end_time_cell_value)
 
-                if week_cell_value == "I":
-                    week = 1
-                elif week_cell_value == "II":
-                    week = 2
-
                 if weekday and lesson_num and time_start and time_end and week:
                     yield _LessonRow(
                         weekday, lesson_num, time_start, time_end, week, row
                     )
 
-    def __parse_worksheet(self, worksheet: Worksheet, force: bool = False):
+    def __parse_worksheet(
+        self, worksheet: Worksheet, force: bool = False, skip_empty: bool = False
+    ):
         """
         Parses the worksheet and returns a list of groups.
         """
         schedule = []  # type: list[LessonsSchedule]
 
-        group_name_row = self._find_group_row(worksheet)
+        with self._measure("find_groups"):
+            group_name_row = self._find_group_row(worksheet)
 
-        if group_name_row is None:
-            return
+            if group_name_row is None:
+                return
 
-        group_columns = self._get_group_columns(group_name_row, worksheet)
+            group_columns = self._get_group_columns(group_name_row, worksheet)
 
-        first_group_column = group_columns[0][1]
-        lesson_cells = list(
-            self.__parse_lesson_cells(first_group_column, group_name_row, worksheet)
-        )
+        with self._measure("parse_rows"):
+            first_group_column = group_columns[0][1]
+            lesson_cells = list(
+                self.__parse_lesson_cells(first_group_column, group_name_row, worksheet)
+            )
+
+            # Empty lessons of the rows are shared by all groups
+            empty_lessons = tuple(
+                LessonEmpty(row.num, row.weekday, row.time_start, row.time_end)
+                for row in lesson_cells
+            )
+
+        self._count("worksheets")
+        self._count("rows", len(lesson_cells))
 
         for group_column in group_columns:
             try:
                 group_name = group_column[0]
 
-                lessons = list(
-                    self.__parse_lessons(group_column[1], lesson_cells, worksheet)
-                )
+                with self._measure("parse_groups"):
+                    lessons = []  # type: list[Lesson | LessonEmpty]
+                    # Number of lessons parsed from each row
+                    row_lessons = bytearray(len(lesson_cells))
+
+                    for row_index, lesson in self.__parse_lessons(
+                        group_column[1], lesson_cells, empty_lessons, worksheet
+                    ):
+                        if lesson is empty_lessons[row_index]:
+                            row_lessons[row_index] = _EMPTY_SLOT
+                            if skip_empty:
+                                continue
+                        else:
+                            row_lessons[row_index] += 1
+
+                        lessons.append(lesson)
+
+                if self._metrics is not None:
+                    self._metrics.increment("groups")
+                    self._metrics.increment(
+                        "lessons",
+                        sum(1 for lesson in lessons if type(lesson) is Lesson),
+                    )
 
                 logger.info(
                     f"Processing group '{group_name}', worksheet '{worksheet.title}'"
                 )
 
-                schedule.append(
-                    LessonsSchedule(
-                        group=group_name,
-                        period=self._period,
-                        institute=self._institute,
-                        degree=self._degree,
-                        document_url=None,  # TODO: implement,
-                        lessons=lessons,
-                    )
+                group_schedule = LessonsSchedule(
+                    group=group_name,
+                    period=self._period,
+                    institute=self._institute,
+                    degree=self._degree,
+                    document_url=None,  # TODO: implement,
+                    lessons=lessons,
                 )
+                if skip_empty:
+                    group_schedule._set_slots(empty_lessons, bytes(row_lessons))
+
+                schedule.append(group_schedule)
 
             except ValueError:
+                self._count("errors")
+
                 if not force:
                     raise
                 else:
@@ -316,6 +366,8 @@ class ExcelScheduleParser(ScheduleParser):
         force: bool = False,
         generate_dataframe: bool = False,
         schedule_type: ScheduleType = ScheduleType.SEMESTER,
+        deduplicate_lessons: bool = False,
+        skip_empty: bool = False,
     ) -> ScheduleData:
         """
         Args:
@@ -323,6 +375,10 @@ class ExcelScheduleParser(ScheduleParser):
             generate_dataframe: If True, then the schedule will be converted to a pandas DataFrame. It increases the
                 parsing time.
             schedule_type: The type of schedule to parse (semester or test session for this parser).
+            deduplicate_lessons: If True, then identical lessons of different groups (e.g. lectures of a stream) are
+                stored as one shared object. See `ScheduleData.deduplicate_lessons`.
+            skip_empty: If True, then empty lessons are not stored in `LessonsSchedule.lessons`. Use
+                `LessonsSchedule.get_grid()` to get all lessons including the empty ones.
         """
 
         if schedule_type not in [ScheduleType.SEMESTER, ScheduleType.TEST_SESSION]:
@@ -330,12 +386,18 @@ class ExcelScheduleParser(ScheduleParser):
                 "This parser supports only semester and test session schedules."
             )
 
-        self._open_worksheets()
+        with self._measure("parse"):
+            self._open_worksheets()
+
+            schedule = []
+
+            for worksheet in self._worksheets:
+                if result := self.__parse_worksheet(worksheet, force, skip_empty):
+                    schedule.extend(result)
 
-        schedule = []
+            schedule_data = ScheduleData(schedule, generate_dataframe, schedule_type)
 
-        for worksheet in self._worksheets:
-            if result := self.__parse_worksheet(worksheet, force):
-                schedule.extend(result)
+            if deduplicate_lessons:
+                schedule_data.deduplicate_lessons()
 
-        return ScheduleData(schedule, generate_dataframe, schedule_type)
+            return schedule_data
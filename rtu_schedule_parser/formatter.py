@@ -120,6 +120,30 @@ class Formatter(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def parse_subject_cell(
+        self, value: str, is_even: bool | None = None, max_weeks: int | None = None
+    ) -> tuple[list[tuple[str, LessonType | None, int | None]], list[list[int]]]:
+        """
+        Get the subjects and their weeks from the schedule table cell value at once. The result is equal to the
+        results of `get_lessons()` and `get_weeks()`, but formatters can override this method to process the cell
+        value only once.
+
+        Args:
+            value: The value of the schedule lesson table cell.
+            is_even: The parity of the week. See `get_weeks()`.
+            max_weeks: The maximum number of weeks in the semester. See `get_weeks()`.
+
+        Returns:
+            A tuple of the list returned by `get_lessons()` and the list returned by `get_weeks()`.
+
+        Examples:
+            >>> from rtu_schedule_parser.excel_formatter import ExcelFormatter
+            >>> formatter = ExcelFormatter()
+            >>> formatter.parse_subject_cell("2,6,10,14 н Экология\\n4,8,12,16 Правоведение", is_even=True)
+            ([('Экология', None, None), ('Правоведение', None, None)], [[2, 6, 10, 14], [4, 8, 12, 16]])
+        """
+        return self.get_lessons(value), self.get_weeks(value, is_even, max_weeks)
+
     @abstractmethod
     def get_types(self, types_cell_value: str) -> list[LessonType]:
         """
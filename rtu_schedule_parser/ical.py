@@ -0,0 +1,240 @@
+"""
+iCalendar (RFC 5545) export of lessons schedules.
+
+Each lesson is exported as one recurring event instead of one event per week. Weeks of the lesson are converted to a
+weekly `RRULE` with the interval equal to the greatest common divisor of the distances between the weeks (e.g.
+every week, every second week, every fourth week). Weeks that do not fit the rule are excluded with `EXDATE`. If the
+weeks are too irregular for a rule, the dates are listed with `RDATE`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import math
+from typing import TYPE_CHECKING, Iterator, TextIO
+
+from rtu_schedule_parser.schedule import Lesson, LessonEmpty
+from rtu_schedule_parser.utils import academic_calendar
+
+if TYPE_CHECKING:
+    from rtu_schedule_parser.schedule import LessonsSchedule
+
+__all__ = ["write_ics", "iter_ics_lines"]
+
+TIMEZONE = "Europe/Moscow"
+
+_PRODID = "-//mirea-ninja//rtu-schedule-parser//RU"
+
+# Moscow time has no daylight saving time since 2014
+_VTIMEZONE = [
+    "BEGIN:VTIMEZONE",
+    f"TZID:{TIMEZONE}",
+    "BEGIN:STANDARD",
+    "DTSTART:19700101T000000",
+    "TZOFFSETFROM:+0300",
+    "TZOFFSETTO:+0300",
+    "TZNAME:MSK",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+]
+
+# Maximum length of a content line in octets, excluding the line break
+_MAX_LINE_LENGTH = 75
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold the content line to lines not longer than 75 octets. Multibyte characters are not split."""
+    if len(line.encode()) <= _MAX_LINE_LENGTH:
+        return line
+
+    parts = []
+    current, current_length = [], 0
+    limit = _MAX_LINE_LENGTH
+
+    for char in line:
+        char_length = len(char.encode())
+        if current_length + char_length > limit:
+            parts.append("".join(current))
+            # Continuation lines start with a space, which is counted in the line length
+            current, current_length, limit = [], 0, _MAX_LINE_LENGTH - 1
+        current.append(char)
+        current_length += char_length
+
+    parts.append("".join(current))
+
+    return "\r\n ".join(parts)
+
+
+def _format_datetime(date: datetime.date, time: datetime.time) -> str:
+    return f"{date:%Y%m%d}T{time:%H%M%S}"
+
+
+def _get_recurrence(
+    weeks: list[int],
+) -> tuple[int, int, list[int], list[int]]:
+    """
+    Get recurrence of the lesson weeks.
+
+    Returns:
+        Tuple with the interval of the rule in weeks, the number of occurrences of the rule, the weeks excluded from the
+        rule and additional weeks. If the rule is not used, the number of occurrences is 1 and all weeks except the
+        first one are additional.
+    """
+    if len(weeks) == 1:
+        return 1, 1, [], []
+
+    interval = 0
+    for previous, week in zip(weeks, weeks[1:]):
+        interval = math.gcd(interval, week - previous)
+
+    count = (weeks[-1] - weeks[0]) // interval + 1
+    weeks_set = set(weeks)
+    excluded = [
+        week
+        for week in range(weeks[0], weeks[-1] + 1, interval)
+        if week not in weeks_set
+    ]
+
+    # Listing the dates takes fewer lines than excluding them from the rule
+    if len(excluded) >= len(weeks) - 1:
+        return 1, 1, [], weeks[1:]
+
+    return interval, count, excluded, []
+
+
+def _lesson_uid(group: str, index: int, lesson: Lesson) -> str:
+    key = "|".join(
+        [
+            group,
+            str(index),
+            str(lesson.weekday.value[0]),
+            str(lesson.num),
+            lesson.name,
+            ",".join(map(str, lesson.weeks)),
+            str(lesson.subgroup),
+        ]
+    )
+    return f"{hashlib.sha1(key.encode()).hexdigest()}@rtu-schedule-parser"
+
+
+def _iter_event_lines(
+    schedule: LessonsSchedule, index: int, lesson: Lesson, dtstamp: str
+) -> Iterator[str]:
+    weeks = sorted(set(lesson.weeks))
+    if not weeks:
+        return
+
+    def get_date(week: int) -> datetime.date:
+        return academic_calendar.get_day_by_week(schedule.period, lesson.weekday, week)
+
+    def format_dates(dates_weeks: list[int]) -> str:
+        return ",".join(
+            _format_datetime(get_date(week), lesson.time_start) for week in dates_weeks
+        )
+
+    interval, count, excluded, additional = _get_recurrence(weeks)
+    first_date = get_date(weeks[0])
+
+    summary = lesson.name
+    if lesson.type is not None:
+        summary = f"{summary} ({lesson.type.value})"
+    if lesson.subgroup:
+        summary = f"{summary}, {lesson.subgroup} п/г"
+
+    yield "BEGIN:VEVENT"
+    yield f"UID:{_lesson_uid(schedule.group, index, lesson)}"
+    yield f"DTSTAMP:{dtstamp}"
+    yield f"DTSTART;TZID={TIMEZONE}:{_format_datetime(first_date, lesson.time_start)}"
+    yield f"DTEND;TZID={TIMEZONE}:{_format_datetime(first_date, lesson.time_end)}"
+
+    if count > 1:
+        rule = f"RRULE:FREQ=WEEKLY;COUNT={count}"
+        if interval > 1:
+            rule = f"{rule};INTERVAL={interval}"
+        yield rule
+    if excluded:
+        yield f"EXDATE;TZID={TIMEZONE}:{format_dates(excluded)}"
+    if additional:
+        yield f"RDATE;TZID={TIMEZONE}:{format_dates(additional)}"
+
+    yield f"SUMMARY:{_escape(summary)}"
+
+    if lesson.room is not None:
+        location = lesson.room.name
+        if lesson.room.campus is not None:
+            location = f"{location} ({lesson.room.campus.short_name})"
+        yield f"LOCATION:{_escape(location)}"
+
+    teachers = [teacher for teacher in lesson.teachers if teacher]
+    if teachers:
+        yield f"DESCRIPTION:{_escape(', '.join(teachers))}"
+
+    yield "END:VEVENT"
+
+
+def iter_ics_lines(
+    schedule: LessonsSchedule, dtstamp: datetime.datetime | None = None
+) -> Iterator[str]:
+    """
+    Generate folded content lines of the iCalendar document for the lessons schedule (without line breaks).
+
+    Args:
+        schedule: Lessons schedule of the group.
+        dtstamp: Time of the document creation. By default, the current time is used.
+    """
+    if dtstamp is None:
+        dtstamp = datetime.datetime.now(datetime.timezone.utc)
+    dtstamp = dtstamp.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    yield "BEGIN:VCALENDAR"
+    yield "VERSION:2.0"
+    yield f"PRODID:{_PRODID}"
+    yield "CALSCALE:GREGORIAN"
+    yield _fold(f"X-WR-CALNAME:{_escape(schedule.group)}")
+    yield f"X-WR-TIMEZONE:{TIMEZONE}"
+    yield from _VTIMEZONE
+
+    for index, lesson in enumerate(schedule.lessons):
+        if type(lesson) is LessonEmpty:
+            continue
+
+        for line in _iter_event_lines(schedule, index, lesson, dtstamp):
+            yield _fold(line)
+
+    yield "END:VCALENDAR"
+
+
+def write_ics(
+    schedule: LessonsSchedule,
+    fp: TextIO | str,
+    dtstamp: datetime.datetime | None = None,
+) -> None:
+    """
+    Write the iCalendar document for the lessons schedule. Lines are written one by one, so the document is not
+    built in memory.
+
+    Args:
+        schedule: Lessons schedule of the group.
+        fp: Path to the file or text file object. The file object should be opened with `newline=""`, since
+            iCalendar uses CRLF line breaks.
+        dtstamp: Time of the document creation. By default, the current time is used.
+    """
+    if isinstance(fp, str):
+        with open(fp, "w", encoding="utf-8", newline="") as file:
+            write_ics(schedule, file, dtstamp)
+        return
+
+    for line in iter_ics_lines(schedule, dtstamp):
+        fp.write(line)
+        fp.write("\r\n")
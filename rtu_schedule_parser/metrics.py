@@ -0,0 +1,142 @@
+"""
+Instrumentation of the parsers.
+
+Metrics are collected only within `ScheduleParser.collect_metrics()`. Outside of it the parsers and the formatter are
+not wrapped, so parsing without metrics has no overhead.
+
+Stages:
+
+- ``convert_xls`` — conversion of an xls document to xlsx.
+- ``open_workbook`` — reading and opening the workbook with openpyxl.
+- ``find_groups`` — search of the group names row and the group columns.
+- ``parse_rows`` — parsing of the row skeleton of the table (weekdays, lesson numbers and times or exam days).
+- ``parse_groups`` — parsing of the lessons or exams of the groups. Includes the time of the formatter methods.
+- ``formatter.<method>`` — each method of the formatter (``formatter.get_lessons``, ``formatter.get_rooms``, ...).
+- ``parse`` — the whole `parse()` call.
+
+Counters: ``worksheets``, ``groups``, ``rows`` (rows of the tables), ``lessons`` and ``exams`` (non-empty parsed
+items), ``errors`` (groups skipped with ``force=True``).
+
+Examples:
+    >>> parser = ExcelScheduleParser(path, period, institute, degree)
+    >>> with parser.collect_metrics() as metrics:
+    ...     parser.parse()
+    >>> print(metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Iterator
+
+from rtu_schedule_parser.formatter import Formatter
+
+__all__ = ["ParserMetrics"]
+
+
+class ParserMetrics:
+    """Time spent in the stages of parsing and counts of the parsed items."""
+
+    def __init__(self) -> None:
+        # Stage -> total time in seconds
+        self.timings = {}  # type: dict[str, float]
+        # Stage -> number of calls
+        self.calls = {}  # type: dict[str, int]
+        # Counter -> value
+        self.counters = {}  # type: dict[str, int]
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Add a call of the stage that took `seconds`."""
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    @contextlib.contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Measure the time of the block as a call of the stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def merge(self, other: ParserMetrics) -> None:
+        """Add metrics of another parser (e.g. from a worker process)."""
+        for stage, seconds in other.timings.items():
+            self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+        for stage, calls in other.calls.items():
+            self.calls[stage] = self.calls.get(stage, 0) + calls
+        for counter, value in other.counters.items():
+            self.increment(counter, value)
+
+    def wrap_formatter(self, formatter: Formatter) -> Formatter:
+        """Get a proxy of the formatter that measures its methods as ``formatter.<method>`` stages."""
+        return _MeasuredFormatter(formatter, self)
+
+    def to_prometheus(self, prefix: str = "rtu_schedule_parser") -> str:
+        """
+        Export metrics in the Prometheus text format.
+
+        Returns:
+            ``<prefix>_stage_seconds_total`` and ``<prefix>_stage_calls_total`` with the ``stage`` label and
+            ``<prefix>_items_total`` with the ``item`` label.
+        """
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Time spent in the parsing stages.",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+            *(
+                f'{prefix}_stage_seconds_total{{stage="{stage}"}} {seconds:.6f}'
+                for stage, seconds in sorted(self.timings.items())
+            ),
+            f"# HELP {prefix}_stage_calls_total Number of calls of the parsing stages.",
+            f"# TYPE {prefix}_stage_calls_total counter",
+            *(
+                f'{prefix}_stage_calls_total{{stage="{stage}"}} {calls}'
+                for stage, calls in sorted(self.calls.items())
+            ),
+            f"# HELP {prefix}_items_total Number of the processed items.",
+            f"# TYPE {prefix}_items_total counter",
+            *(
+                f'{prefix}_items_total{{item="{counter}"}} {value}'
+                for counter, value in sorted(self.counters.items())
+            ),
+        ]
+
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        return (
+            f"ParserMetrics(timings={self.timings!r}, calls={self.calls!r}, "
+            f"counters={self.counters!r})"
+        )
+
+
+class _MeasuredFormatter:
+    """For internal use only. Proxy of the formatter that measures the time spent in its methods."""
+
+    def __init__(self, formatter: Formatter, metrics: ParserMetrics) -> None:
+        self._formatter = formatter
+        self._metrics = metrics
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._formatter, name)
+        if not callable(attr):
+            return attr
+
+        stage = f"formatter.{name}"
+        add_time = self._metrics.add_time
+
+        def measured(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                add_time(stage, time.perf_counter() - start)
+
+        # The wrapper is created once for each method
+        setattr(self, name, measured)
+
+        return measured
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from rtu_schedule_parser.constants import Campus, RoomType, ScheduleType
+from rtu_schedule_parser.schedule import LessonEmpty, Room
+from rtu_schedule_parser.schedule_data import ScheduleData
+from rtu_schedule_parser.utils.academic_calendar import MAX_WEEKS, Weekday
+
+__all__ = ["RoomOccupancyIndex", "weeks_to_mask"]
+
+
+def weeks_to_mask(weeks: list[int]) -> int:
+    """
+    Convert a list of weeks to a bitset, where the bit with the index of the week number is set.
+
+    Examples:
+        >>> weeks_to_mask([1, 3, 5])
+        42
+    """
+    mask = 0
+    for week in weeks:
+        mask |= 1 << week
+    return mask
+
+
+def _count_weeks(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+class RoomOccupancyIndex:
+    """
+    Index of room occupancy. For each room and each lesson slot (weekday and lesson number) the index stores a
+    bitset of weeks in which the room is occupied. Free room, occupancy heatmap and room utilization queries are
+    answered with bit operations, without iterating over lessons.
+
+    Examples:
+        >>> index = RoomOccupancyIndex(schedule_data)
+        >>> index.get_free_rooms(Weekday.TUESDAY, 3, 7, campus=Campus.V_78)
+    """
+
+    def __init__(self, schedule_data: ScheduleData) -> None:
+        if schedule_data.schedule_type == ScheduleType.EXAM_SESSION:
+            raise TypeError("Room occupancy can be built only for lessons schedules")
+
+        # slot -> room -> weeks bitset
+        self._slots = defaultdict(
+            dict
+        )  # type: dict[tuple[Weekday, int], dict[Room, int]]
+
+        # (campus, room type) -> rooms. Used to filter rooms without iterating over all of them.
+        self._rooms_by_filter = defaultdict(
+            dict
+        )  # type: dict[tuple[Campus | None, RoomType | None], dict[Room, None]]
+
+        for schedule in schedule_data.get_schedule():
+            for lesson in schedule.lessons:
+                if type(lesson) is LessonEmpty or lesson.room is None:
+                    continue
+
+                room = lesson.room
+                rooms = self._slots[(lesson.weekday, lesson.num)]
+                rooms[room] = rooms.get(room, 0) | weeks_to_mask(lesson.weeks)
+
+                for key in (
+                    (None, None),
+                    (room.campus, None),
+                    (None, room.room_type),
+                    (room.campus, room.room_type),
+                ):
+                    self._rooms_by_filter[key][room] = None
+
+    def get_rooms(
+        self, campus: Campus | None = None, room_type: RoomType | None = None
+    ) -> list[Room]:
+        """Get list of indexed rooms. Rooms can be filtered by campus and room type."""
+        return list(self._rooms_by_filter.get((campus, room_type), ()))
+
+    def get_slots(self) -> list[tuple[Weekday, int]]:
+        """Get list of lesson slots (weekday and lesson number) in which at least one room is occupied."""
+        return sorted(self._slots, key=lambda slot: (slot[0].value[0], slot[1]))
+
+    def get_weeks_mask(self, room: Room, weekday: Weekday, num: int) -> int:
+        """Get bitset of weeks in which the room is occupied in the lesson slot."""
+        return self._slots.get((weekday, num), {}).get(room, 0)
+
+    def is_free(self, room: Room, weekday: Weekday, num: int, week: int) -> bool:
+        """Check if the room is free in the lesson slot of the week."""
+        return not self.get_weeks_mask(room, weekday, num) >> week & 1
+
+    def get_free_rooms(
+        self,
+        weekday: Weekday,
+        num: int,
+        week: int,
+        campus: Campus | None = None,
+        room_type: RoomType | None = None,
+    ) -> list[Room]:
+        """
+        Get rooms that are free in the lesson slot of the week.
+
+        Args:
+            weekday: Weekday of the lesson slot.
+            num: Lesson number.
+            week: Week number.
+            campus: If specified, only rooms of this campus are returned.
+            room_type: If specified, only rooms of this type are returned.
+        """
+        occupancy = self._slots.get((weekday, num), {})
+        return [
+            room
+            for room in self._rooms_by_filter.get((campus, room_type), ())
+            if not occupancy.get(room, 0) >> week & 1
+        ]
+
+    def get_occupied_rooms(
+        self,
+        weekday: Weekday,
+        num: int,
+        week: int,
+        campus: Campus | None = None,
+        room_type: RoomType | None = None,
+    ) -> list[Room]:
+        """Get rooms that are occupied in the lesson slot of the week. Filters are the same as in `get_free_rooms`."""
+        return [
+            room
+            for room, mask in self._slots.get((weekday, num), {}).items()
+            if mask >> week & 1
+            and (campus is None or room.campus == campus)
+            and (room_type is None or room.room_type == room_type)
+        ]
+
+    def get_heatmap(
+        self,
+        week: int | None = None,
+        campus: Campus | None = None,
+        room_type: RoomType | None = None,
+    ) -> dict[tuple[Weekday, int], int]:
+        """
+        Get occupancy heatmap. Returns a dictionary, where the key is a lesson slot (weekday and lesson number) and
+        the value is the number of occupied rooms in the slot.
+
+        Args:
+            week: If specified, the number of rooms occupied in this week is counted. Otherwise, the total number of
+                occupied room-weeks is counted.
+            campus: If specified, only rooms of this campus are counted.
+            room_type: If specified, only rooms of this type are counted.
+        """
+        rooms = self._rooms_by_filter.get((campus, room_type), {})
+        heatmap = {}
+
+        for slot in self.get_slots():
+            masks = [mask for room, mask in self._slots[slot].items() if room in rooms]
+            if week is None:
+                heatmap[slot] = sum(_count_weeks(mask) for mask in masks)
+            else:
+                heatmap[slot] = sum(mask >> week & 1 for mask in masks)
+
+        return heatmap
+
+    def get_utilization(self, room: Room, max_weeks: int = MAX_WEEKS) -> float:
+        """
+        Get room utilization: the share of occupied room-weeks among all lesson slots of the schedule.
+
+        Args:
+            room: Room to check.
+            max_weeks: Number of weeks in the semester.
+        """
+        if not self._slots:
+            return 0.0
+
+        # Bits with week numbers from 1 to max_weeks
+        weeks_mask = ((1 << max_weeks) - 1) << 1
+        occupied = sum(
+            _count_weeks(rooms.get(room, 0) & weeks_mask)
+            for rooms in self._slots.values()
+        )
+
+        return occupied / (len(self._slots) * max_weeks)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import os
 from abc import ABCMeta, abstractmethod
 from io import BytesIO
+from typing import ContextManager, Iterator
 
 from openpyxl.reader.excel import load_workbook
 from openpyxl.workbook import Workbook
@@ -11,6 +13,8 @@ from xls2xlsx import XLS2XLSX
 
 from rtu_schedule_parser.constants import RE_GROUP_NAME, Campus, Degree, Institute
 from rtu_schedule_parser.formatter import Formatter
+from rtu_schedule_parser.metrics import ParserMetrics
+from rtu_schedule_parser.rooms import RoomRegistry
 from rtu_schedule_parser.schedule import Room
 from rtu_schedule_parser.schedule_data import ScheduleData
 from rtu_schedule_parser.utils import Period
@@ -32,71 +36,145 @@ class ScheduleParser(metaclass=ABCMeta):
         period: Period,
         institute: Institute,
         degree: Degree,
+        max_rows: int | None = None,
     ) -> None:
+        """
+        Args:
+            max_rows: Maximum number of rows of the table to read. By default, rows are read until the end of the table
+                is detected.
+        """
+        if max_rows is not None and max_rows < 1:
+            raise ValueError("max_rows must be positive")
+
         self._document_path = document_path
         self._formatter = formatter
         self._period = period
         self._degree = degree
         self._institute = institute
+        self._max_rows = max_rows
 
         self._workbook: Workbook | None = None
         self._worksheets: list[Worksheet] | None = None
+        # Rooms of all lessons are shared, the default campus is set once for each room
+        self._rooms = RoomRegistry(self._DEFAULT_CAMPUS.get(institute))
+        # Metrics are collected only within `collect_metrics()`
+        self._metrics: ParserMetrics | None = None
+
+    @contextlib.contextmanager
+    def collect_metrics(
+        self, metrics: ParserMetrics | None = None
+    ) -> Iterator[ParserMetrics]:
+        """
+        Collect metrics of parsing within the context: time spent in the stages of parsing and in each formatter
+        method, counts of the parsed worksheets, groups, rows, lessons and errors.
+
+        Args:
+            metrics: Metrics to add to. If None, new metrics are created.
+
+        Examples:
+            >>> with parser.collect_metrics() as metrics:
+            ...     parser.parse()
+            >>> metrics.timings["open_workbook"]
+        """
+        metrics = metrics or ParserMetrics()
+        formatter = self._formatter
+
+        self._metrics = metrics
+        self._formatter = metrics.wrap_formatter(formatter)
+        try:
+            yield metrics
+        finally:
+            self._metrics = None
+            self._formatter = formatter
+
+    def _measure(self, stage: str) -> ContextManager:
+        """Measure the time of the stage if metrics are collected."""
+        if self._metrics is None:
+            return contextlib.nullcontext()
+
+        return self._metrics.measure(stage)
+
+    def _count(self, counter: str, value: int = 1) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(counter, value)
 
     def _open_worksheets(self):
         """Opens the workbook and all worksheets."""
 
         if self._document_path.endswith(".xls"):
-            x2x = XLS2XLSX(self._document_path)
-            self._document_path = f"{os.path.splitext(self._document_path)[0]}.xlsx"
-            x2x.to_xlsx(self._document_path)
+            with self._measure("convert_xls"):
+                x2x = XLS2XLSX(self._document_path)
+                self._document_path = f"{os.path.splitext(self._document_path)[0]}.xlsx"
+                x2x.to_xlsx(self._document_path)
+
+        with self._measure("open_workbook"):
+            input_excel = open(self._document_path, "rb")
 
-        input_excel = open(self._document_path, "rb")
+            self._workbook = load_workbook(
+                filename=BytesIO(input_excel.read()), read_only=True, data_only=True
+            )
+            self._worksheets = self._workbook.worksheets
 
-        self._workbook = load_workbook(
-            filename=BytesIO(input_excel.read()), read_only=True, data_only=True
-        )
-        self._worksheets = self._workbook.worksheets
+            for worksheet in self._worksheets:
+                # Some writers (e.g. openpyxl in the write-only mode) do not store the dimensions of the worksheets
+                if worksheet.max_row is None:
+                    worksheet.calculate_dimension(force=True)
 
     def _get_group_columns(
         self, group_row_index: int, worksheet: Worksheet
     ) -> list[tuple[str, int]]:
         """Returns a list of tuples containing the group name and the column index for each group in the table."""
-        group_columns = []
+        group_columns = {}  # type: dict[str, int]
 
-        for row in worksheet.iter_rows(group_row_index):
-            for cell in row:
-                if cell and cell.value:
-                    cell_value = str(cell.value).replace(" ", "")
-                    if group_name := RE_GROUP_NAME.search(cell_value):
-                        if group_name.group(1) not in [
-                            group[0] for group in group_columns
-                        ]:
-                            group_columns.append((group_name.group(1), cell.column))
+        for row in worksheet.iter_rows(
+            min_row=group_row_index, max_row=group_row_index, values_only=True
+        ):
+            for column, value in enumerate(row, start=1):
+                # Group names are strings with dashes, e.g. "ИКБО-01-20"
+                if type(value) is not str or "-" not in value:
+                    continue
 
-        return group_columns
+                if group_name := RE_GROUP_NAME.search(value.replace(" ", "")):
+                    group_columns.setdefault(group_name.group(1), column)
+
+        return list(group_columns.items())
 
     def _find_group_row(self, worksheet) -> int | None:
         """Find the row containing the group name."""
-        for row in worksheet.iter_rows(max_row=20, max_col=30):
-            for cell in row:
-                if (
-                    cell
-                    and cell.value
-                    and RE_GROUP_NAME.match(str(cell.value.replace(" ", "")))
-                ):
-                    return cell.row
+        # A table has at least the group row and one row of lessons or exams, so sheets without a table (e.g. empty
+        # sheets of the colleges' workbooks) are skipped without reading them. It relies on the dimensions computed
+        # in `_open_worksheets` for the workbooks without stored dimensions, otherwise all their sheets are skipped.
+        if (worksheet.max_row or 0) < 2 or (worksheet.max_column or 0) < 2:
+            return None
+
+        for row_index, row in enumerate(
+            worksheet.iter_rows(max_row=20, max_col=30, values_only=True), start=1
+        ):
+            values = [
+                value.replace(" ", "")
+                for value in row
+                if type(value) is str and "-" in value
+            ]
+
+            # One search over the whole row filters out the rows without group names
+            if not values or not RE_GROUP_NAME.search("\n".join(values)):
+                continue
+
+            if any(RE_GROUP_NAME.match(value) for value in values):
+                return row_index
 
         return None
 
-    def _set_default_campus(self, room: Room) -> Room:
-        """Sets the campus to the default value if the campus is not specified."""
-        new_room = room
-        if new_room.campus is None and self._institute in self._DEFAULT_CAMPUS:
-            new_room = Room(
-                room.name, self._DEFAULT_CAMPUS[self._institute], room.room_type
-            )
+    def _get_last_row(self, first_row: int) -> int | None:
+        """Returns the last row of the table to read, or None if rows are read until the end of the worksheet."""
+        if self._max_rows is None:
+            return None
+
+        return first_row + self._max_rows - 1
 
-        return new_room
+    def _get_rooms(self, rooms_cell_value: str) -> list[Room]:
+        """Returns shared rooms of the rooms cell with the default campus set."""
+        return self._rooms.get_cell_rooms(rooms_cell_value, self._formatter)
 
     @abstractmethod
     def parse(self) -> ScheduleData:
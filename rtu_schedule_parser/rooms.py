@@ -0,0 +1,89 @@
+"""
+Shared room records.
+
+The same rooms are repeated in all lessons of the schedule. `RoomRegistry` keeps one `Room` instance for each
+(name, campus, room type), so rooms of different lessons are the same objects and comparing them is an identity
+check.
+
+Examples:
+    >>> registry = RoomRegistry(default_campus=Campus.V_78)
+    >>> registry.get(Room("А-101")) is registry.get(Room("А-101", Campus.V_78))
+    True
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Iterator
+
+from rtu_schedule_parser.constants import Campus
+from rtu_schedule_parser.formatter import Formatter
+from rtu_schedule_parser.schedule import Room
+
+__all__ = ["RoomRegistry"]
+
+
+class RoomRegistry:
+    """
+    Registry of the shared room instances. Parsed rooms cells are cached, so each cell is parsed once.
+
+    One instance is shared by all lessons and exams in the room. `Room` is frozen, so the shared instance cannot be
+    changed in place. To change the room of one lesson, assign a new room, e.g. ``dataclasses.replace(room, ...)``.
+
+    Args:
+        default_campus: Campus of the rooms without the campus. If None, the campus is not changed.
+    """
+
+    def __init__(self, default_campus: Campus | None = None) -> None:
+        self._default_campus = default_campus
+        # Room -> shared instance of the room
+        self._rooms = {}  # type: dict[Room, Room]
+        # Rooms cell -> rooms
+        self._cells = {}  # type: dict[str, tuple[Room, ...]]
+
+    def get(self, room: Room) -> Room:
+        """Get the shared instance of the room. The default campus is set if the campus is not specified."""
+        shared = self._rooms.get(room)
+        if shared is not None:
+            return shared
+
+        key = room
+        if room.campus is None and self._default_campus is not None:
+            key = Room(room.name, self._default_campus, room.room_type)
+
+        shared = self._rooms.get(key)
+        if shared is None:
+            shared = Room(sys.intern(key.name), key.campus, key.room_type)
+            self._rooms[shared] = shared
+
+        self._rooms[room] = shared
+
+        return shared
+
+    def get_cell_rooms(self, rooms_cell_value: str, formatter: Formatter) -> list[Room]:
+        """
+        Get the shared rooms of the rooms cell. The cell is parsed with `formatter.get_rooms()` only the first time.
+        A new list is returned for each call.
+        """
+        rooms = self._cells.get(rooms_cell_value)
+        if rooms is None:
+            rooms = tuple(
+                self.get(room) for room in formatter.get_rooms(rooms_cell_value)
+            )
+            self._cells[rooms_cell_value] = rooms
+
+        return list(rooms)
+
+    def get_rooms(self) -> list[Room]:
+        """Get list of all registered rooms in the order they were found."""
+        # Rooms without the campus are keys of the rooms with the default campus too
+        return list(dict.fromkeys(self._rooms.values()))
+
+    def __iter__(self) -> Iterator[Room]:
+        return iter(self.get_rooms())
+
+    def __len__(self) -> int:
+        return len(self.get_rooms())
+
+    def __repr__(self) -> str:
+        return f"RoomRegistry({self.get_rooms()!r})"
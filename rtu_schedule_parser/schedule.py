@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import datetime
+import io
 from abc import ABCMeta
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Optional, TextIO
 
 import numpy as np
 import pandas as pd
@@ -89,6 +90,10 @@ class LessonEmpty:
     time_end: datetime.time
 
 
+# Number of items of the slot that means that the slot contains only the empty item
+_EMPTY_SLOT = 0xFF
+
+
 @dataclass
 class _Schedule(metaclass=ABCMeta):
     """
@@ -104,6 +109,13 @@ class _Schedule(metaclass=ABCMeta):
 
     _dataframe: pd.DataFrame | None = field(init=False, repr=False, default=None)
 
+    # Slots of the table (rows or days) and the number of items parsed from each slot. Set by the parsers if empty
+    # items are not stored, used to restore them in `get_grid()`.
+    _slots: tuple | None = field(init=False, repr=False, compare=False, default=None)
+    _slot_items: bytes | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
     def get_dataframe(self) -> pd.DataFrame:
         """
         Get pandas dataframe.
@@ -112,6 +124,49 @@ class _Schedule(metaclass=ABCMeta):
             "Method is not implemented. Use `LessonsSchedule` or `ExamsSchedule` instead."
         )
 
+    def _set_slots(self, slots: tuple, slot_items: bytes) -> None:
+        """
+        For internal use only. Set slots of the table for the items parsed without the empty ones.
+
+        Args:
+            slots: Slots of the table. Slots are shared by all groups of the table.
+            slot_items: Number of items parsed from each slot, or `_EMPTY_SLOT` if the slot is empty.
+        """
+        self._slots = slots
+        self._slot_items = slot_items
+
+    def _get_grid(self, items: list, get_empty: Callable[[Any], Any]) -> list:
+        """For internal use only. Insert empty items of the slots between the items."""
+        if self._slots is None:
+            return list(items)
+
+        items_count = sum(count for count in self._slot_items if count != _EMPTY_SLOT)
+        if items_count != len(items):
+            raise ValueError(
+                "Schedule items were changed after parsing, the grid cannot be restored"
+            )
+
+        grid = []
+        position = 0
+        for slot, count in zip(self._slots, self._slot_items):
+            if count == _EMPTY_SLOT:
+                grid.append(get_empty(slot))
+            elif count:
+                grid.extend(items[position : position + count])
+                position += count
+
+        return grid
+
+    def to_ics(
+        self, fp: TextIO | str | None = None, dtstamp: datetime.datetime | None = None
+    ) -> str | None:
+        """
+        Export schedule to iCalendar (RFC 5545) format.
+        """
+        raise NotImplementedError(
+            "Method is not implemented. Use `LessonsSchedule` instead."
+        )
+
 
 @dataclass
 class LessonsSchedule(_Schedule):
@@ -121,6 +176,15 @@ class LessonsSchedule(_Schedule):
 
     lessons: list[Lesson | LessonEmpty] = field(default_factory=lambda: [])
 
+    def get_grid(self) -> list[Lesson | LessonEmpty]:
+        """
+        Get all lessons of the table including the empty ones. If the schedule was parsed with `skip_empty=True`,
+        `lessons` contains only non-empty lessons and the empty ones are created from the table slots. Otherwise,
+        a copy of `lessons` is returned.
+        """
+        # Slots of the lessons are empty lessons
+        return self._get_grid(self.lessons, lambda slot: slot)
+
     def get_dataframe(self) -> pd.DataFrame:
         """
         Get pandas dataframe. The dataframe contains the following columns: `group`, `lesson_num`,
@@ -133,6 +197,28 @@ class LessonsSchedule(_Schedule):
 
         return self._dataframe
 
+    def to_ics(
+        self, fp: TextIO | str | None = None, dtstamp: datetime.datetime | None = None
+    ) -> str | None:
+        """
+        Export schedule to iCalendar (RFC 5545) format. Each lesson is exported as one recurring event: regular
+        weeks are described by `RRULE` (e.g. every week or every second week), irregular ones by `EXDATE`/`RDATE`.
+
+        Args:
+            fp: Path to the file or text file object (opened with `newline=""`) to stream the document to. If not
+                specified, the document is returned as a string.
+            dtstamp: Time of the document creation. By default, the current time is used.
+        """
+        from rtu_schedule_parser import ical
+
+        if fp is not None:
+            ical.write_ics(self, fp, dtstamp)
+            return None
+
+        buffer = io.StringIO(newline="")
+        ical.write_ics(self, buffer, dtstamp)
+        return buffer.getvalue()
+
     def _generate_dataframe(self):
         """
         Convert schedule to pandas dataframe. The dataframe contains the following columns: `group`, `lesson_num`,
@@ -200,6 +286,15 @@ class ExamsSchedule(_Schedule):
 
     exams: list[Exam | ExamEmpty] = field(default_factory=lambda: [])
 
+    def get_grid(self) -> list[Exam | ExamEmpty]:
+        """
+        Get all exams of the table including the empty days. If the schedule was parsed with `skip_empty=True`,
+        `exams` contains only non-empty exams and the empty days are created from the table slots. Otherwise, a copy
+        of `exams` is returned.
+        """
+        # Slots of the exams are (month, day) pairs
+        return self._get_grid(self.exams, lambda slot: ExamEmpty(*slot))
+
     def get_dataframe(self) -> pd.DataFrame:
         """
         Get pandas dataframe. The dataframe contains the following columns: `group`, `month`, `day`,
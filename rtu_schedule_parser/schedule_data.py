@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+import datetime
+from typing import TYPE_CHECKING, Iterable, TextIO
+
 import pandas as pd
 
 from rtu_schedule_parser.constants import ScheduleType
 from rtu_schedule_parser.schedule import (
     ExamEmpty,
     ExamsSchedule,
+    Lesson,
     LessonEmpty,
     LessonsSchedule,
     Room,
 )
+from rtu_schedule_parser.teachers import Teacher, TeacherRegistry
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from rtu_schedule_parser.conflicts import Conflict
+
+
+def _get_lesson_key(lesson: Lesson) -> tuple:
+    """Key of the lesson. Lessons with the same key are identical."""
+    return (
+        lesson.num,
+        lesson.name,
+        tuple(lesson.weeks),
+        lesson.weekday,
+        tuple(lesson.teachers),
+        lesson.time_start,
+        lesson.time_end,
+        lesson.type,
+        lesson.room,
+        lesson.subgroup,
+    )
 
 
 class ScheduleData:
@@ -39,6 +65,8 @@ class ScheduleData:
         self._schedule = schedule  # type: list[LessonsSchedule | ExamsSchedule]
         self._schedule_type = schedule_type  # type: ScheduleType
         self._df = None  # type: pd.DataFrame | None
+        # Serialized group schedules: (format, group) -> bytes
+        self._serialized = {}  # type: dict[tuple[str, str], bytes]
 
         if generate_dataframe:
             self.generate_dataframe()
@@ -47,12 +75,8 @@ class ScheduleData:
         """
         Generate pandas dataframe.
         """
-        df = None
-        for schedule in self._schedule:
-            dataframe = schedule.get_dataframe()
-            # if df has no columns, add columns from dataframe
-            df = dataframe if df is None else pd.concat([df, dataframe])
-
+        # Dataframes are concatenated at once: concatenating them one by one copies the data for each group
+        df = pd.concat([schedule.get_dataframe() for schedule in self._schedule])
         df.index = range(len(df))
 
         self._df = df
@@ -65,8 +89,9 @@ class ScheduleData:
             raise TypeError(f"Schedule type must be {self._schedule_type}")
 
         self._schedule.append(schedule)
+        self._serialized.clear()
 
-        if self._df:
+        if self._df is not None:
             self.generate_dataframe()
 
     def extend(self, schedule: list[LessonsSchedule | ExamsSchedule]):
@@ -77,11 +102,52 @@ class ScheduleData:
             raise TypeError(f"Schedule type must be {self._schedule_type}")
 
         self._schedule.extend(schedule)
+        self._serialized.clear()
 
         # if dataframe is generated, regenerate it
         if self._df is not None:
             self.generate_dataframe()
 
+    def update(self, schedule: list[LessonsSchedule | ExamsSchedule]) -> None:
+        """
+        Update schedule data with new schedules of the groups. Existing schedules of the same groups are replaced,
+        schedules of new groups are appended.
+        """
+        if any(type(item) is not self.__current_type for item in schedule):
+            raise TypeError(f"Schedule type must be {self._schedule_type}")
+
+        indexes = {item.group: i for i, item in enumerate(self._schedule)}
+        for item in schedule:
+            if item.group in indexes:
+                self._schedule[indexes[item.group]] = item
+            else:
+                indexes[item.group] = len(self._schedule)
+                self._schedule.append(item)
+
+        self.__invalidate({item.group for item in schedule})
+
+    def remove(self, groups: Iterable[str]) -> None:
+        """
+        Remove schedules of the groups. Unknown groups are ignored.
+        """
+        groups = set(groups)
+        self._schedule[:] = [
+            item for item in self._schedule if item.group not in groups
+        ]
+
+        self.__invalidate(groups)
+
+    def __invalidate(self, groups: set[str]) -> None:
+        """Drop cached data of the changed groups."""
+        for key in [key for key in self._serialized if key[1] in groups]:
+            del self._serialized[key]
+
+        if self._df is not None:
+            if self._schedule:
+                self.generate_dataframe()
+            else:
+                self._df = None
+
     def get_schedule(self) -> list[LessonsSchedule | ExamsSchedule]:
         """
         Get list of schedules.
@@ -104,23 +170,112 @@ class ScheduleData:
         """
         Get list of all rooms. Rooms are unique.
         """
-        rooms = []
+        # Rooms are deduplicated with a dict. Parsed rooms are shared instances, so they are found by identity.
+        rooms = {}  # type: dict[Room, None]
+        for schedule in self._schedule:
+            if type(schedule) is LessonsSchedule:
+                for lesson in schedule.lessons:
+                    if type(lesson) is not LessonEmpty and lesson.room is not None:
+                        rooms[lesson.room] = None
+            else:
+                for exam in schedule.exams:
+                    if type(exam) is not ExamEmpty:
+                        rooms.update(dict.fromkeys(exam.rooms))
+
+        return list(rooms)
+
+    def get_teacher_registry(self) -> TeacherRegistry:
+        """
+        Get registry of all teachers. The registry maps spelling variants of the teacher names used in the lessons
+        (`Lesson.teachers`, `Exam.teachers`) to the canonical `Teacher` records.
+        """
+        registry = TeacherRegistry()
         for schedule in self._schedule:
             if type(schedule) is LessonsSchedule:
-                data = schedule.lessons
+                for lesson in schedule.lessons:
+                    if type(lesson) is not LessonEmpty:
+                        registry.add_all(lesson.teachers)
             else:
-                data = schedule.exams
+                for exam in schedule.exams:
+                    if type(exam) is not ExamEmpty:
+                        # Exam teachers of the cells with subgroups are (name, subgroup) tuples
+                        registry.add_all(
+                            name if isinstance(name, str) else name[0]
+                            for name in exam.teachers
+                        )
 
-            for item in data:
-                if (
-                    type(item) is not LessonEmpty
-                    and type(item) is not ExamEmpty
-                    and item.room is not None
-                    and item.room not in rooms
-                ):
-                    rooms.append(item.room)
+        return registry
 
-        return rooms
+    def get_teachers(self) -> list[Teacher]:
+        """
+        Get list of all teachers. Spelling variants of the same teacher name are merged into one `Teacher`.
+        """
+        return self.get_teacher_registry().get_teachers()
+
+    def find_conflicts(self, include_online: bool = False) -> list[Conflict]:
+        """
+        Find double-booked teachers and rooms. Lessons of a stream (the same name, room and teachers in several
+        groups) are not reported. See `rtu_schedule_parser.conflicts.find_conflicts` for details.
+        """
+        if self._schedule_type == ScheduleType.EXAM_SESSION:
+            raise TypeError("Conflicts can be found only for lessons schedules")
+
+        from rtu_schedule_parser.conflicts import find_conflicts
+
+        return find_conflicts(self._schedule, include_online)
+
+    def deduplicate_lessons(self) -> int:
+        """
+        Replace identical lessons of different groups (e.g. lectures of a stream) with one shared `Lesson` object.
+        Schedules of the groups still contain all their lessons, but the shared lessons are stored once, so changing a
+        shared lesson changes it in all these groups.
+
+        Returns:
+            Number of replaced lessons.
+        """
+        if self._schedule_type == ScheduleType.EXAM_SESSION:
+            raise TypeError("Lessons can be deduplicated only in lessons schedules")
+
+        # Lesson key -> shared lesson
+        shared = {}  # type: dict[tuple, Lesson]
+        replaced = 0
+
+        for schedule in self._schedule:
+            lessons = schedule.lessons
+            for i, lesson in enumerate(lessons):
+                if type(lesson) is LessonEmpty:
+                    continue
+
+                shared_lesson = shared.setdefault(_get_lesson_key(lesson), lesson)
+                if shared_lesson is not lesson:
+                    lessons[i] = shared_lesson
+                    replaced += 1
+
+        return replaced
+
+    def get_unique_lessons(self) -> list[tuple[Lesson, list[str]]]:
+        """
+        Get list of unique lessons with the groups that have them. Identical lessons of different groups (e.g. lectures
+        of a stream) are returned once.
+        """
+        if self._schedule_type == ScheduleType.EXAM_SESSION:
+            raise TypeError("Unique lessons can be found only in lessons schedules")
+
+        # Lesson key -> first lesson and groups of the lesson
+        lessons = {}  # type: dict[tuple, tuple[Lesson, dict[str, None]]]
+
+        for schedule in self._schedule:
+            for lesson in schedule.lessons:
+                if type(lesson) is LessonEmpty:
+                    continue
+
+                key = _get_lesson_key(lesson)
+                if key in lessons:
+                    lessons[key][1][schedule.group] = None
+                else:
+                    lessons[key] = (lesson, {schedule.group: None})
+
+        return [(lesson, list(groups)) for lesson, groups in lessons.values()]
 
     def get_group_schedule(self, group: str) -> LessonsSchedule | ExamsSchedule:
         """
@@ -143,6 +298,71 @@ class ScheduleData:
 
         return groups
 
+    def get_group_json(self, group: str) -> bytes:
+        """
+        Get schedule of the group serialized to UTF-8 JSON. The result is cached until the schedule data is changed
+        with `append()` or `extend()`. See `rtu_schedule_parser.serialization` for the format.
+        """
+        return self.__get_serialized("json", group)
+
+    def get_group_msgpack(self, group: str) -> bytes:
+        """
+        Get schedule of the group serialized to msgpack. The result is cached like in `get_group_json()`. Requires
+        `msgpack`.
+        """
+        return self.__get_serialized("msgpack", group)
+
+    def __get_serialized(self, fmt: str, group: str) -> bytes:
+        key = (fmt, group)
+        if key not in self._serialized:
+            from rtu_schedule_parser import serialization
+
+            serializer = (
+                serialization.to_json if fmt == "json" else serialization.to_msgpack
+            )
+            self._serialized[key] = serializer(self.get_group_schedule(group))
+
+        return self._serialized[key]
+
+    def to_ics(
+        self,
+        group: str,
+        fp: TextIO | str | None = None,
+        dtstamp: datetime.datetime | None = None,
+    ) -> str | None:
+        """
+        Export schedule of the group to iCalendar (RFC 5545) format. See `LessonsSchedule.to_ics` for details.
+        """
+        return self.get_group_schedule(group).to_ics(fp, dtstamp)
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Convert schedule data to an Apache Arrow table. The table is built directly from the lesson/exam objects,
+        string columns are dictionary-encoded and lesson weeks are stored as `list<int8>`. Requires `pyarrow`.
+        """
+        from rtu_schedule_parser import arrow
+
+        return arrow.to_arrow(self)
+
+    def to_parquet(self, path: str, **kwargs) -> None:
+        """
+        Write schedule data to a Parquet file. Additional keyword arguments are passed to
+        `pyarrow.parquet.write_table`. Requires `pyarrow`.
+        """
+        from rtu_schedule_parser import arrow
+
+        arrow.to_parquet(self, path, **kwargs)
+
+    @classmethod
+    def from_parquet(cls, path: str) -> ScheduleData:
+        """
+        Read schedule data from a Parquet file written by `to_parquet`. Empty lessons and exams are not stored in the
+        file, so the restored schedules contain only non-empty items. Requires `pyarrow`.
+        """
+        from rtu_schedule_parser import arrow
+
+        return arrow.from_parquet(path)
+
     @property
     def schedule_type(self) -> ScheduleType:
         """
@@ -0,0 +1,151 @@
+"""
+Serialization of group schedules to JSON and msgpack.
+
+Schedules are converted to plain dicts and lists directly, without `dataclasses.asdict`. Enums are encoded with
+precomputed lookup tables, and times and rooms (which repeat a lot in a schedule) are encoded once and reused. Empty
+lessons and exams are not serialized.
+
+Lesson fields: `num`, `name`, `weeks`, `weekday` (1 - Monday, ..., 7 - Sunday), `teachers`, `time_start` and
+`time_end` (``HH:MM``), `type`, `room`, `subgroup`. Exam fields: `month`, `day`, `name`, `time_start`, `teachers`,
+`rooms`, `exam_type`. Room fields: `name`, `campus` (short name), `room_type`.
+
+msgpack serialization requires `msgpack` to be installed (``pip install rtu-schedule-parser[msgpack]``).
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import json
+
+from rtu_schedule_parser.constants import (
+    Campus,
+    LessonType,
+    RoomType,
+    TestSessionLessonType,
+)
+from rtu_schedule_parser.schedule import (
+    Exam,
+    ExamEmpty,
+    ExamsSchedule,
+    Lesson,
+    LessonEmpty,
+    LessonsSchedule,
+    Room,
+)
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+
+__all__ = [
+    "room_to_dict",
+    "lesson_to_dict",
+    "exam_to_dict",
+    "schedule_to_dict",
+    "dumps_json",
+    "to_json",
+    "to_msgpack",
+]
+
+_WEEKDAYS = {weekday: weekday.value[0] for weekday in Weekday}
+_LESSON_TYPES = {
+    lesson_type: lesson_type.value
+    for lesson_type in (*LessonType, *TestSessionLessonType)
+}
+_CAMPUSES = {campus: campus.short_name for campus in Campus}
+_ROOM_TYPES = {room_type: room_type.value for room_type in RoomType}
+
+
+@functools.lru_cache(maxsize=None)
+def _encode_time(time: datetime.time) -> str:
+    return time.isoformat("minutes")
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_room(room: Room) -> dict:
+    return {
+        "name": room.name,
+        "campus": _CAMPUSES.get(room.campus),
+        "room_type": _ROOM_TYPES.get(room.room_type),
+    }
+
+
+def room_to_dict(room: Room | None) -> dict | None:
+    """
+    Convert room to dict. Dicts of equal rooms are shared, so they must not be modified.
+    """
+    return None if room is None else _encode_room(room)
+
+
+def lesson_to_dict(lesson: Lesson) -> dict:
+    """Convert lesson to dict."""
+    return {
+        "num": lesson.num,
+        "name": lesson.name,
+        "weeks": lesson.weeks,
+        "weekday": _WEEKDAYS[lesson.weekday],
+        "teachers": lesson.teachers,
+        "time_start": _encode_time(lesson.time_start),
+        "time_end": _encode_time(lesson.time_end),
+        "type": _LESSON_TYPES.get(lesson.type),
+        "room": None if lesson.room is None else _encode_room(lesson.room),
+        "subgroup": lesson.subgroup,
+    }
+
+
+def exam_to_dict(exam: Exam) -> dict:
+    """Convert exam to dict."""
+    return {
+        "month": int(exam.month),
+        "day": exam.day,
+        "name": exam.name,
+        "time_start": _encode_time(exam.time_start),
+        "teachers": exam.teachers,
+        "rooms": [_encode_room(room) for room in exam.rooms],
+        "exam_type": int(exam.exam_type),
+    }
+
+
+def schedule_to_dict(schedule: LessonsSchedule | ExamsSchedule) -> dict:
+    """
+    Convert group schedule to dict. Lessons schedule has the `lessons` key, exams schedule has the `exams` key.
+    """
+    data = {
+        "group": schedule.group,
+        "period": {
+            "year_start": schedule.period.year_start,
+            "year_end": schedule.period.year_end,
+            "semester": schedule.period.semester,
+        },
+        "institute": schedule.institute.short_name,
+        "degree": int(schedule.degree),
+        "document_url": schedule.document_url,
+    }
+
+    if type(schedule) is ExamsSchedule:
+        data["exams"] = [
+            exam_to_dict(exam) for exam in schedule.exams if type(exam) is not ExamEmpty
+        ]
+    else:
+        data["lessons"] = [
+            lesson_to_dict(lesson)
+            for lesson in schedule.lessons
+            if type(lesson) is not LessonEmpty
+        ]
+
+    return data
+
+
+def dumps_json(value) -> bytes:
+    """Serialize value to compact UTF-8 JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def to_json(schedule: LessonsSchedule | ExamsSchedule) -> bytes:
+    """Serialize group schedule to UTF-8 JSON."""
+    return dumps_json(schedule_to_dict(schedule))
+
+
+def to_msgpack(schedule: LessonsSchedule | ExamsSchedule) -> bytes:
+    """Serialize group schedule to msgpack. Requires `msgpack`."""
+    import msgpack
+
+    return msgpack.packb(schedule_to_dict(schedule), use_bin_type=True)
@@ -0,0 +1,369 @@
+"""
+HTTP API for schedule data.
+
+`ScheduleServer` is an ASGI application without third-party dependencies, so it can be run by any ASGI server (e.g.
+``uvicorn``). Schedule data is loaded once into an immutable `ScheduleSnapshot`: JSON responses for groups, teachers
+and rooms are prebuilt, and date queries are served from an `EventIndex`. All responses of a snapshot share one ETag
+(the hash of the snapshot), so clients can revalidate their caches with `If-None-Match`.
+
+New schedule data is loaded with `ScheduleServer.update()`. The snapshot is built aside and then swapped with a single
+assignment, so requests are served without interruption and each request sees exactly one snapshot.
+
+Routes (`GET` and `HEAD` only):
+
+- ``/groups`` — list of groups with lessons schedules.
+- ``/groups/{group}`` — lessons schedule of the group.
+- ``/exams`` — list of groups with exams schedules.
+- ``/exams/{group}`` — exams schedule of the group.
+- ``/teachers`` and ``/teachers/{teacher}`` — list of teachers and lessons and exams of the teacher.
+- ``/rooms`` and ``/rooms/{room}`` — list of rooms and lessons and exams in the room.
+- ``/dates/{YYYY-MM-DD}?group={group}`` — lessons on the date, optionally only of the group.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+from http import HTTPStatus
+from typing import Awaitable, Callable, Iterable
+from urllib.parse import parse_qs
+
+from rtu_schedule_parser.constants import ScheduleType
+from rtu_schedule_parser.events import EventIndex
+from rtu_schedule_parser.schedule import ExamEmpty, LessonEmpty
+from rtu_schedule_parser.schedule_data import ScheduleData
+from rtu_schedule_parser.serialization import dumps_json, exam_to_dict, lesson_to_dict
+
+__all__ = ["ScheduleSnapshot", "ScheduleServer"]
+
+_Receive = Callable[[], Awaitable[dict]]
+_Send = Callable[[dict], Awaitable[None]]
+
+
+class ScheduleSnapshot:
+    """
+    Immutable view of schedule data prepared for serving. JSON responses are built once when the snapshot is created.
+    If several schedules have the same group, the first one is used.
+
+    Args:
+        schedule_data: Schedule data or several schedule data (e.g. of different institutes, lessons and exams).
+    """
+
+    def __init__(self, schedule_data: ScheduleData | Iterable[ScheduleData]) -> None:
+        if isinstance(schedule_data, ScheduleData):
+            schedule_data = [schedule_data]
+
+        # Group schedules with the schedule data they belong to. Group documents are taken from the serialization
+        # cache of the schedule data, so they are not serialized again if the same data is loaded to a new snapshot.
+        lessons_schedules = {}  # type: dict[str, tuple]
+        exams_schedules = {}  # type: dict[str, tuple]
+
+        for data in schedule_data:
+            schedules = (
+                exams_schedules
+                if data.schedule_type == ScheduleType.EXAM_SESSION
+                else lessons_schedules
+            )
+            for schedule in data.get_schedule():
+                schedules.setdefault(schedule.group, (data, schedule))
+
+        # Lessons and exams of each teacher and room. Rooms without a name (e.g. only campus is known) are skipped.
+        teachers = {}  # type: dict[str, dict[str, list]]
+        rooms = {}  # type: dict[str, dict[str, list]]
+
+        def add_item(index: dict, key: str, kind: str, item: dict) -> None:
+            index.setdefault(key, {"lessons": [], "exams": []})[kind].append(item)
+
+        self._groups = {}  # type: dict[str, bytes]
+        for group, (data, schedule) in lessons_schedules.items():
+            self._groups[group] = data.get_group_json(group)
+
+            for lesson in schedule.lessons:
+                if type(lesson) is LessonEmpty:
+                    continue
+
+                item = {"group": group, **lesson_to_dict(lesson)}
+                for teacher in filter(None, lesson.teachers):
+                    add_item(teachers, teacher, "lessons", item)
+                if lesson.room is not None and lesson.room.name:
+                    add_item(rooms, lesson.room.name, "lessons", item)
+
+        self._exams = {}  # type: dict[str, bytes]
+        for group, (data, schedule) in exams_schedules.items():
+            self._exams[group] = data.get_group_json(group)
+
+            for exam in schedule.exams:
+                if type(exam) is ExamEmpty:
+                    continue
+
+                item = {"group": group, **exam_to_dict(exam)}
+                # Teachers of the exams can be (name, subgroup) tuples
+                for teacher in exam.teachers:
+                    name = teacher if isinstance(teacher, str) else teacher[0]
+                    if name:
+                        add_item(teachers, name, "exams", item)
+                for room in {room.name for room in exam.rooms if room.name}:
+                    add_item(rooms, room, "exams", item)
+
+        self._teachers = {
+            teacher: dumps_json({"teacher": teacher, **items})
+            for teacher, items in teachers.items()
+        }
+        self._rooms = {
+            room: dumps_json({"room": room, **items}) for room, items in rooms.items()
+        }
+
+        self._lists = {
+            "groups": dumps_json({"groups": sorted(self._groups)}),
+            "exams": dumps_json({"groups": sorted(self._exams)}),
+            "teachers": dumps_json({"teachers": sorted(self._teachers)}),
+            "rooms": dumps_json({"rooms": sorted(self._rooms)}),
+        }
+
+        self._events = (
+            EventIndex(
+                ScheduleData([schedule for _, schedule in lessons_schedules.values()])
+            )
+            if lessons_schedules
+            else None
+        )
+
+        # Group and exam documents contain all data of the snapshot, other responses are derived from them
+        digest = hashlib.blake2b(digest_size=16)
+        for documents in (self._groups, self._exams):
+            for group in sorted(documents):
+                digest.update(documents[group])
+            digest.update(b"\x00")
+
+        self._etag = f'"{digest.hexdigest()}"'
+
+    @property
+    def etag(self) -> str:
+        """ETag of the snapshot (quoted hash of the schedule data). It changes only if the schedule data changes."""
+        return self._etag
+
+    def get_groups(self) -> list[str]:
+        """Get list of groups with lessons schedules."""
+        return sorted(self._groups)
+
+    def get_resource(self, kind: str, key: str | None = None) -> bytes | None:
+        """
+        Get prebuilt JSON response.
+
+        Args:
+            kind: One of `groups`, `exams`, `teachers`, `rooms`.
+            key: Group, teacher or room name. If not specified, the list of names is returned.
+
+        Returns:
+            JSON response or None if the resource is not found.
+        """
+        if key is None:
+            return self._lists.get(kind)
+
+        resources = {
+            "groups": self._groups,
+            "exams": self._exams,
+            "teachers": self._teachers,
+            "rooms": self._rooms,
+        }.get(kind)
+
+        return None if resources is None else resources.get(key)
+
+    def get_date(self, date: datetime.date, group: str | None = None) -> bytes | None:
+        """
+        Get JSON response with lessons on the date.
+
+        Args:
+            date: Date of the lessons.
+            group: If specified, only lessons of this group are returned.
+
+        Returns:
+            JSON response or None if the group is not found.
+        """
+        if group is not None and group not in self._groups:
+            return None
+
+        events = []
+        if self._events is not None:
+            events = [
+                {
+                    "group": event.group,
+                    "start": event.start.isoformat(),
+                    "end": event.end.isoformat(),
+                    **lesson_to_dict(event.lesson),
+                }
+                for event in self._events.get_day_events(date, group)
+            ]
+
+        return dumps_json({"date": date.isoformat(), "events": events})
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Check `If-None-Match` header. Weak comparison is used, as required for `GET` and `HEAD` requests."""
+    if header.strip() == "*":
+        return True
+
+    return any(value.strip().removeprefix("W/") == etag for value in header.split(","))
+
+
+class ScheduleServer:
+    """
+    ASGI application serving schedule data.
+
+    Args:
+        schedule_data: Initial schedule data. If not specified, the server responds with `503 Service Unavailable`
+            until the data is loaded with `update()`.
+
+    Examples:
+        >>> server = ScheduleServer(schedule_data)
+        >>> # uvicorn.run(server)
+        >>> server.update([semester_data, exams_data])  # e.g. after downloading new documents
+    """
+
+    def __init__(
+        self, schedule_data: ScheduleData | Iterable[ScheduleData] | None = None
+    ) -> None:
+        self._snapshot = None  # type: ScheduleSnapshot | None
+        if schedule_data is not None:
+            self.update(schedule_data)
+
+    @property
+    def snapshot(self) -> ScheduleSnapshot | None:
+        """Current snapshot."""
+        return self._snapshot
+
+    def update(self, schedule_data: ScheduleData | Iterable[ScheduleData]) -> bool:
+        """
+        Replace served schedule data. The new snapshot is built before the swap, so requests being served at the
+        moment are not affected.
+
+        Returns:
+            True if the snapshot was replaced, False if the schedule data did not change.
+        """
+        return self.swap(ScheduleSnapshot(schedule_data))
+
+    async def update_async(
+        self, schedule_data: ScheduleData | Iterable[ScheduleData]
+    ) -> bool:
+        """Same as `update()`, but the snapshot is built in the default executor to not block the event loop."""
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(None, ScheduleSnapshot, schedule_data)
+        return self.swap(snapshot)
+
+    def swap(self, snapshot: ScheduleSnapshot) -> bool:
+        """
+        Replace the snapshot with the prebuilt one.
+
+        Returns:
+            True if the snapshot was replaced, False if it has the same ETag as the current one.
+        """
+        if self._snapshot is not None and self._snapshot.etag == snapshot.etag:
+            return False
+
+        self._snapshot = snapshot
+        return True
+
+    async def __call__(self, scope: dict, receive: _Receive, send: _Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.__lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported scope type: {scope['type']}")
+
+        # The snapshot is read once, so the response is consistent even if the snapshot is swapped meanwhile
+        snapshot = self._snapshot
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await self.__send(scope, send, HTTPStatus.METHOD_NOT_ALLOWED)
+            return
+
+        if snapshot is None:
+            await self.__send(scope, send, HTTPStatus.SERVICE_UNAVAILABLE)
+            return
+
+        status, body = self.__route(snapshot, scope)
+
+        # The ETag is checked only for existing resources, so unknown paths and bad queries are not "not modified"
+        if status == HTTPStatus.OK:
+            for name, value in scope.get("headers", []):
+                if name == b"if-none-match" and _etag_matches(
+                    value.decode("latin-1"), snapshot.etag
+                ):
+                    await self.__send(
+                        scope, send, HTTPStatus.NOT_MODIFIED, etag=snapshot.etag
+                    )
+                    return
+
+        await self.__send(
+            scope,
+            send,
+            status,
+            body,
+            etag=snapshot.etag if status == HTTPStatus.OK else None,
+        )
+
+    @staticmethod
+    def __route(
+        snapshot: ScheduleSnapshot, scope: dict
+    ) -> tuple[HTTPStatus, bytes | None]:
+        kind, _, key = scope["path"].strip("/").partition("/")
+
+        if kind in ("groups", "exams", "teachers", "rooms"):
+            body = snapshot.get_resource(kind, key or None)
+            return (HTTPStatus.OK, body) if body else (HTTPStatus.NOT_FOUND, None)
+
+        if kind == "dates" and key:
+            try:
+                date = datetime.date.fromisoformat(key)
+            except ValueError:
+                return HTTPStatus.BAD_REQUEST, None
+
+            query = parse_qs(scope.get("query_string", b"").decode())
+            group = query["group"][0] if "group" in query else None
+
+            body = snapshot.get_date(date, group)
+            return (HTTPStatus.OK, body) if body else (HTTPStatus.NOT_FOUND, None)
+
+        return HTTPStatus.NOT_FOUND, None
+
+    @staticmethod
+    async def __send(
+        scope: dict,
+        send: _Send,
+        status: HTTPStatus,
+        body: bytes | None = None,
+        etag: str | None = None,
+    ) -> None:
+        if body is None and status >= HTTPStatus.BAD_REQUEST:
+            body = dumps_json({"detail": status.phrase})
+
+        headers = [(b"cache-control", b"no-cache")]
+        if etag is not None:
+            headers.append((b"etag", etag.encode()))
+        if body is not None:
+            headers.append((b"content-type", b"application/json; charset=utf-8"))
+            headers.append((b"content-length", str(len(body)).encode()))
+        if status == HTTPStatus.METHOD_NOT_ALLOWED:
+            headers.append((b"allow", b"GET, HEAD"))
+
+        await send(
+            {"type": "http.response.start", "status": int(status), "headers": headers}
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": body if body is not None and scope["method"] != "HEAD" else b"",
+            }
+        )
+
+    @staticmethod
+    async def __lifespan(receive: _Receive, send: _Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import datetime
+import sqlite3
+
+from rtu_schedule_parser.constants import (
+    Campus,
+    RoomType,
+    ScheduleType,
+    get_lesson_type_by_value,
+)
+from rtu_schedule_parser.schedule import Lesson, LessonEmpty, Room
+from rtu_schedule_parser.schedule_data import ScheduleData
+from rtu_schedule_parser.utils import academic_calendar
+from rtu_schedule_parser.utils.academic_calendar import Period, Weekday
+
+__all__ = ["ScheduleStore"]
+
+# Separator used to concatenate teacher names in queries. It cannot appear in the schedule document.
+_TEACHERS_SEPARATOR = "\x1f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    year_start INTEGER NOT NULL,
+    year_end INTEGER NOT NULL,
+    semester INTEGER NOT NULL,
+    institute TEXT NOT NULL,
+    degree INTEGER NOT NULL,
+    document_url TEXT
+);
+
+CREATE TABLE IF NOT EXISTS teachers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS rooms (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    campus TEXT,
+    room_type TEXT
+);
+
+CREATE TABLE IF NOT EXISTS lessons (
+    id INTEGER PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES groups (id) ON DELETE CASCADE,
+    num INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    weekday INTEGER NOT NULL,
+    time_start TEXT NOT NULL,
+    time_end TEXT NOT NULL,
+    type TEXT,
+    room_id INTEGER REFERENCES rooms (id),
+    subgroup INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS lesson_teachers (
+    lesson_id INTEGER NOT NULL REFERENCES lessons (id) ON DELETE CASCADE,
+    teacher_id INTEGER NOT NULL REFERENCES teachers (id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (lesson_id, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS lesson_weeks (
+    lesson_id INTEGER NOT NULL REFERENCES lessons (id) ON DELETE CASCADE,
+    week INTEGER NOT NULL,
+    PRIMARY KEY (lesson_id, week)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS ix_lessons_group ON lessons (group_id, weekday, num);
+CREATE INDEX IF NOT EXISTS ix_lessons_slot ON lessons (weekday, num);
+CREATE INDEX IF NOT EXISTS ix_lessons_room ON lessons (room_id, weekday, num);
+CREATE INDEX IF NOT EXISTS ix_lesson_teachers_teacher ON lesson_teachers (teacher_id);
+CREATE INDEX IF NOT EXISTS ix_lesson_weeks_week ON lesson_weeks (week, lesson_id);
+CREATE INDEX IF NOT EXISTS ix_rooms_name ON rooms (name, campus);
+"""
+
+# Select lessons with all data required to restore `Lesson` objects. Teachers and weeks are aggregated by
+# correlated subqueries, which use the primary keys of the link tables.
+_SELECT_LESSONS = f"""
+SELECT
+    g.name,
+    l.num,
+    l.name,
+    l.weekday,
+    l.time_start,
+    l.time_end,
+    l.type,
+    r.name,
+    r.campus,
+    r.room_type,
+    l.subgroup,
+    (
+        SELECT group_concat(name, '{_TEACHERS_SEPARATOR}') FROM (
+            SELECT t.name FROM lesson_teachers lt
+            JOIN teachers t ON t.id = lt.teacher_id
+            WHERE lt.lesson_id = l.id
+            ORDER BY lt.position
+        )
+    ),
+    (
+        SELECT group_concat(week) FROM (
+            SELECT week FROM lesson_weeks WHERE lesson_id = l.id ORDER BY week
+        )
+    )
+FROM lessons l
+JOIN groups g ON g.id = l.group_id
+LEFT JOIN rooms r ON r.id = l.room_id
+"""
+
+_ORDER_LESSONS = " ORDER BY g.name, l.weekday, l.num, l.id"
+
+
+class ScheduleStore:
+    """
+    On-disk schedule storage based on SQLite. The schedule is stored in normalized tables (groups, lessons,
+    teachers, rooms and week occurrences) with indexes for point queries by group, teacher, room and date. Several
+    processes can open the same database file, so the data is shared through the OS page cache instead of keeping a
+    full copy of the schedule in the memory of each process.
+
+    Only semester and test session schedules (`LessonsSchedule`) can be stored.
+
+    Examples:
+        >>> store = ScheduleStore("schedule.db")
+        >>> store.load(schedule_data)
+        >>> store.get_group_lessons("ИКБО-01-20")
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Args:
+            path: Path to the database file. By default, the database is created in memory.
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> ScheduleStore:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def load(self, schedule_data: ScheduleData) -> None:
+        """
+        Load schedule data into the store. Schedules of groups that are already stored are replaced. All rows are
+        inserted in one transaction using `executemany`.
+        """
+        if schedule_data.schedule_type == ScheduleType.EXAM_SESSION:
+            raise TypeError("Only semester and test session schedules can be stored")
+
+        cursor = self._connection.cursor()
+
+        teachers = dict(cursor.execute("SELECT name, id FROM teachers"))
+        rooms = {
+            (name, campus, room_type): room_id
+            for room_id, name, campus, room_type in cursor.execute(
+                "SELECT id, name, campus, room_type FROM rooms"
+            )
+        }
+
+        new_teachers, new_rooms = [], []
+        groups, lessons, lesson_teachers, lesson_weeks = [], [], [], []
+        loaded_groups = set()
+
+        (group_id,) = cursor.execute("SELECT coalesce(max(id), 0) FROM groups")
+        (lesson_id,) = cursor.execute("SELECT coalesce(max(id), 0) FROM lessons")
+        group_id, lesson_id = group_id[0], lesson_id[0]
+
+        for schedule in schedule_data.get_schedule():
+            # The first schedule of the group is used, as in `ScheduleData.get_group_schedule`
+            if schedule.group in loaded_groups:
+                continue
+            loaded_groups.add(schedule.group)
+
+            group_id += 1
+            groups.append(
+                (
+                    group_id,
+                    schedule.group,
+                    schedule.period.year_start,
+                    schedule.period.year_end,
+                    schedule.period.semester,
+                    schedule.institute.short_name,
+                    schedule.degree.value,
+                    schedule.document_url,
+                )
+            )
+
+            for lesson in schedule.lessons:
+                if type(lesson) is LessonEmpty:
+                    continue
+
+                lesson_id += 1
+
+                room_id = None
+                if lesson.room is not None:
+                    room_key = _room_key(lesson.room)
+                    room_id = rooms.get(room_key)
+                    if room_id is None:
+                        room_id = rooms[room_key] = len(rooms) + 1
+                        new_rooms.append((room_id, *room_key))
+
+                lessons.append(
+                    (
+                        lesson_id,
+                        group_id,
+                        lesson.num,
+                        lesson.name,
+                        lesson.weekday.value[0],
+                        lesson.time_start.isoformat(),
+                        lesson.time_end.isoformat(),
+                        lesson.type.value if lesson.type is not None else None,
+                        room_id,
+                        lesson.subgroup,
+                    )
+                )
+
+                for position, teacher in enumerate(lesson.teachers):
+                    teacher_id = teachers.get(teacher)
+                    if teacher_id is None:
+                        teacher_id = teachers[teacher] = len(teachers) + 1
+                        new_teachers.append((teacher_id, teacher))
+                    lesson_teachers.append((lesson_id, teacher_id, position))
+
+                lesson_weeks.extend((lesson_id, week) for week in set(lesson.weeks))
+
+        with self._connection:
+            cursor.executemany(
+                "DELETE FROM groups WHERE name = ?", ((group[1],) for group in groups)
+            )
+            cursor.executemany("INSERT INTO teachers VALUES (?, ?)", new_teachers)
+            cursor.executemany("INSERT INTO rooms VALUES (?, ?, ?, ?)", new_rooms)
+            cursor.executemany(
+                "INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?, ?, ?)", groups
+            )
+            cursor.executemany(
+                "INSERT INTO lessons VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", lessons
+            )
+            cursor.executemany(
+                "INSERT INTO lesson_teachers VALUES (?, ?, ?)", lesson_teachers
+            )
+            cursor.executemany("INSERT INTO lesson_weeks VALUES (?, ?)", lesson_weeks)
+
+        cursor.execute("ANALYZE")
+
+    def get_groups(self) -> list[str]:
+        """Get list of all stored groups."""
+        return [
+            row[0]
+            for row in self._connection.execute("SELECT name FROM groups ORDER BY name")
+        ]
+
+    def get_teachers(self) -> list[str]:
+        """Get list of all stored teachers."""
+        return [
+            row[0]
+            for row in self._connection.execute(
+                "SELECT name FROM teachers ORDER BY name"
+            )
+        ]
+
+    def get_rooms(self, campus: Campus | None = None) -> list[Room]:
+        """Get list of all stored rooms. If `campus` is specified, only rooms of this campus are returned."""
+        query = "SELECT name, campus, room_type FROM rooms"
+        params = ()
+        if campus is not None:
+            query += " WHERE campus = ?"
+            params = (campus.short_name,)
+
+        return [_row_to_room(*row) for row in self._connection.execute(query, params)]
+
+    def get_group_period(self, group: str) -> Period:
+        """Get the academic period of the stored group schedule."""
+        row = self._connection.execute(
+            "SELECT year_start, year_end, semester FROM groups WHERE name = ?",
+            (group,),
+        ).fetchone()
+        if row is None:
+            raise ValueError("Group not found")
+
+        return Period(*row)
+
+    def get_group_lessons(self, group: str) -> list[Lesson]:
+        """Get all lessons of the group."""
+        return [
+            lesson
+            for _, lesson in self.__select(
+                "WHERE g.name = ?" + _ORDER_LESSONS, (group,)
+            )
+        ]
+
+    def get_teacher_lessons(self, teacher: str) -> list[tuple[str, Lesson]]:
+        """Get all lessons of the teacher. Returns a list of tuples with the group name and the lesson."""
+        return self.__select(
+            """
+            WHERE l.id IN (
+                SELECT lt.lesson_id FROM lesson_teachers lt
+                JOIN teachers t ON t.id = lt.teacher_id
+                WHERE t.name = ?
+            )
+            """ + _ORDER_LESSONS,
+            (teacher,),
+        )
+
+    def get_room_lessons(
+        self, room: str, campus: Campus | None = None
+    ) -> list[tuple[str, Lesson]]:
+        """
+        Get all lessons held in the room. Returns a list of tuples with the group name and the lesson.
+
+        Args:
+            room: Room name, e.g. "А-101".
+            campus: Campus of the room. If not specified, lessons in rooms with this name on all campuses are
+                returned.
+        """
+        query = "WHERE r.name = ?"
+        params = (room,)
+        if campus is not None:
+            query += " AND r.campus = ?"
+            params += (campus.short_name,)
+
+        return self.__select(query + _ORDER_LESSONS, params)
+
+    def get_lessons_by_date(
+        self, date: datetime.date, group: str | None = None
+    ) -> list[tuple[str, Lesson]]:
+        """
+        Get lessons held on the date. The week number is calculated from the academic calendar for the period of
+        the date. Returns a list of tuples with the group name and the lesson.
+
+        Args:
+            date: Date of the lessons.
+            group: If specified, only lessons of this group are returned.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+
+        period = academic_calendar.get_period(date)
+        query = """
+            WHERE l.weekday = ?
+            AND g.year_start = ? AND g.semester = ?
+            AND EXISTS (SELECT 1 FROM lesson_weeks w WHERE w.lesson_id = l.id AND w.week = ?)
+        """
+        params = (
+            date.isoweekday(),
+            period.year_start,
+            period.semester,
+            academic_calendar.get_week(date),
+        )
+
+        if group is not None:
+            query += " AND g.name = ?"
+            params += (group,)
+
+        return self.__select(query + _ORDER_LESSONS, params)
+
+    def get_free_rooms(
+        self, at: datetime.datetime, campus: Campus | None = None
+    ) -> list[Room]:
+        """
+        Get rooms that are not occupied by any lesson at the specified time.
+
+        Args:
+            at: Date and time to check.
+            campus: If specified, only rooms of this campus are returned.
+        """
+        period = academic_calendar.get_period(at.date())
+        time = at.time().replace(microsecond=0).isoformat()
+
+        query = """
+            SELECT name, campus, room_type FROM rooms r
+            WHERE r.id NOT IN (
+                SELECT l.room_id FROM lessons l
+                JOIN groups g ON g.id = l.group_id
+                JOIN lesson_weeks w ON w.lesson_id = l.id
+                WHERE l.room_id IS NOT NULL
+                AND l.weekday = ? AND w.week = ?
+                AND l.time_start <= ? AND l.time_end > ?
+                AND g.year_start = ? AND g.semester = ?
+            )
+        """
+        params = (
+            at.isoweekday(),
+            academic_calendar.get_week(at.date()),
+            time,
+            time,
+            period.year_start,
+            period.semester,
+        )
+
+        if campus is not None:
+            query += " AND r.campus = ?"
+            params += (campus.short_name,)
+
+        query += " ORDER BY r.campus, r.name"
+
+        return [_row_to_room(*row) for row in self._connection.execute(query, params)]
+
+    def __select(self, where: str, params: tuple) -> list[tuple[str, Lesson]]:
+        return [
+            _row_to_lesson(row)
+            for row in self._connection.execute(f"{_SELECT_LESSONS} {where}", params)
+        ]
+
+
+def _room_key(room: Room) -> tuple[str, str | None, str | None]:
+    return (
+        room.name,
+        room.campus.short_name if room.campus is not None else None,
+        room.room_type.value if room.room_type is not None else None,
+    )
+
+
+def _row_to_room(name: str, campus: str | None, room_type: str | None) -> Room:
+    return Room(
+        name,
+        Campus.get_by_short_name(campus) if campus else None,
+        RoomType(room_type) if room_type else None,
+    )
+
+
+def _row_to_lesson(row: tuple) -> tuple[str, Lesson]:
+    (
+        group,
+        num,
+        name,
+        weekday,
+        time_start,
+        time_end,
+        lesson_type,
+        room_name,
+        room_campus,
+        room_type,
+        subgroup,
+        teachers,
+        weeks,
+    ) = row
+
+    return group, Lesson(
+        num=num,
+        name=name,
+        weeks=[int(week) for week in weeks.split(",")] if weeks else [],
+        weekday=Weekday.get_weekday_by_number(weekday),
+        teachers=teachers.split(_TEACHERS_SEPARATOR) if teachers is not None else [],
+        time_start=datetime.time.fromisoformat(time_start),
+        time_end=datetime.time.fromisoformat(time_end),
+        type=get_lesson_type_by_value(lesson_type) if lesson_type else None,
+        room=(
+            _row_to_room(room_name, room_campus, room_type)
+            if room_name is not None
+            else None
+        ),
+        subgroup=subgroup,
+    )
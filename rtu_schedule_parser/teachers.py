@@ -0,0 +1,159 @@
+"""
+Canonical teacher records.
+
+Names of the same teacher are written differently in the schedules: "Иванов И.И.", "Иванов И. И.", "иванов и.и.",
+"Иванов Иван Иванович", "Новосёлова Е.В." and "Новоселова Е.В.". `TeacherRegistry` maps such spelling variants to one
+`Teacher` record with a stable integer ID, so teachers are compared by their IDs instead of strings.
+
+Examples:
+    >>> registry = TeacherRegistry()
+    >>> registry.get("Иванов И. И.") == registry.get("иванов и.и.")
+    True
+    >>> registry.get("Иванов И. И.").name
+    'Иванов И. И.'
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+__all__ = ["Teacher", "TeacherRegistry", "get_teacher_id", "get_teacher_key"]
+
+# Parts of the name: surname, first name, patronymic or initials
+_RE_NAME_PARTS = re.compile(r"[^\s.,]+")
+
+
+@dataclass(frozen=True)
+class Teacher:
+    """
+    Teacher data class. Teachers are compared and hashed by the ID only, the name is the first spelling of the teacher
+    name found in the schedule.
+    """
+
+    id: int
+    name: str = field(compare=False)
+
+
+def get_teacher_key(name: str) -> str:
+    """
+    Get the normalized key of the teacher name: surname and initials in lower case, "ё" is replaced with "е". Names
+    with the same key are spelling variants of the same teacher.
+
+    Examples:
+        >>> get_teacher_key("Новосёлова Е. В.")
+        'новоселова ев'
+        >>> get_teacher_key("Е.В. Новоселова")
+        'новоселова ев'
+        >>> get_teacher_key("Новоселова Елена Викторовна")
+        'новоселова ев'
+    """
+    parts = _RE_NAME_PARTS.findall(name.lower().replace("ё", "е"))
+
+    words = [part for part in parts if len(part) > 1]
+    initials = [part for part in parts if len(part) == 1]
+
+    if not words:
+        return " ".join(initials)
+
+    # The first word is the surname, the others are the first name and the patronymic
+    initials += [word[0] for word in words[1:]]
+
+    return f"{words[0]} {''.join(initials)}".strip()
+
+
+def get_teacher_id(key: str) -> int:
+    """
+    Get the ID of the teacher by the normalized key. The ID is the same for all runs and processes and fits into a
+    signed 64-bit integer.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+
+    return int.from_bytes(digest, "big") & 0x7FFF_FFFF_FFFF_FFFF
+
+
+class TeacherRegistry:
+    """
+    Registry of the canonical teacher records. Each raw name is normalized once, the result is cached. Names of the
+    records are interned, so the records of all lessons share the same strings.
+
+    Examples:
+        >>> registry = TeacherRegistry()
+        >>> registry.add_all(["Иванов И.И.", "Петров П.П.", "Иванов И. И."])
+        >>> [teacher.name for teacher in registry]
+        ['Иванов И.И.', 'Петров П.П.']
+        >>> registry.get_variants(registry.get("Иванов И.И."))
+        ['Иванов И.И.', 'Иванов И. И.']
+    """
+
+    def __init__(self) -> None:
+        # Raw name -> teacher
+        self._by_name = {}  # type: dict[str, Teacher]
+        # Teacher ID -> teacher. Teachers are stored in the order they were found.
+        self._by_id = {}  # type: dict[int, Teacher]
+        # Teacher ID -> raw names
+        self._variants = {}  # type: dict[int, list[str]]
+
+    def get(self, name: str) -> Teacher:
+        """
+        Get the teacher record of the name. The record is created if the teacher is not registered yet.
+
+        Raises:
+            ValueError: If the name is empty.
+        """
+        teacher = self._by_name.get(name)
+        if teacher is not None:
+            return teacher
+
+        key = get_teacher_key(name)
+        if not key:
+            raise ValueError(f"Invalid teacher name: {name!r}")
+
+        name = sys.intern(name)
+        teacher_id = get_teacher_id(key)
+
+        teacher = self._by_id.get(teacher_id)
+        if teacher is None:
+            teacher = Teacher(teacher_id, name)
+            self._by_id[teacher_id] = teacher
+            self._variants[teacher_id] = []
+
+        self._by_name[name] = teacher
+        self._variants[teacher_id].append(name)
+
+        return teacher
+
+    def add_all(self, names: Iterable[str]) -> None:
+        """Register the teachers of the names. Empty names are skipped."""
+        for name in names:
+            if name and name not in self._by_name:
+                self.get(name)
+
+    def get_by_id(self, teacher_id: int) -> Teacher:
+        """
+        Get the registered teacher by the ID.
+
+        Raises:
+            KeyError: If the teacher is not registered.
+        """
+        return self._by_id[teacher_id]
+
+    def get_teachers(self) -> list[Teacher]:
+        """Get list of all registered teachers in the order they were found."""
+        return list(self._by_id.values())
+
+    def get_variants(self, teacher: Teacher) -> list[str]:
+        """Get all spellings of the teacher name found in the schedule."""
+        return list(self._variants.get(teacher.id, []))
+
+    def __iter__(self) -> Iterator[Teacher]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __repr__(self) -> str:
+        return f"TeacherRegistry({self.get_teachers()!r})"
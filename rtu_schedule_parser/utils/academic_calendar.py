@@ -1,7 +1,9 @@
 import datetime
+import functools
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 
+import numpy as np
 import pytz
 
 MAX_WEEKS = 18
@@ -26,20 +28,23 @@ class Month(IntEnum):
     @classmethod
     def from_str(cls, value: str) -> "Month":
         """Returns the month enum value for the given month name."""
-        return {
-            "январь": cls.JANUARY,
-            "февраль": cls.FEBRUARY,
-            "март": cls.MARCH,
-            "апрель": cls.APRIL,
-            "май": cls.MAY,
-            "июнь": cls.JUNE,
-            "июль": cls.JULY,
-            "август": cls.AUGUST,
-            "сентябрь": cls.SEPTEMBER,
-            "октябрь": cls.OCTOBER,
-            "ноябрь": cls.NOVEMBER,
-            "декабрь": cls.DECEMBER,
-        }[value.lower()]
+        return _MONTHS_BY_NAME[value.lower()]
+
+
+_MONTHS_BY_NAME = {
+    "январь": Month.JANUARY,
+    "февраль": Month.FEBRUARY,
+    "март": Month.MARCH,
+    "апрель": Month.APRIL,
+    "май": Month.MAY,
+    "июнь": Month.JUNE,
+    "июль": Month.JULY,
+    "август": Month.AUGUST,
+    "сентябрь": Month.SEPTEMBER,
+    "октябрь": Month.OCTOBER,
+    "ноябрь": Month.NOVEMBER,
+    "декабрь": Month.DECEMBER,
+}
 
 
 class Weekday(Enum):
@@ -53,17 +58,21 @@ class Weekday(Enum):
 
     @staticmethod
     def get_weekday_by_number(number) -> "Weekday":
-        for weekday in Weekday:
-            if weekday.value[0] == number:
-                return weekday
-        raise ValueError(f"No weekday with number {number}")
+        try:
+            return _WEEKDAYS_BY_NUMBER[number]
+        except (KeyError, TypeError):
+            raise ValueError(f"No weekday with number {number}") from None
 
     @staticmethod
     def get_weekday_by_name(name) -> "Weekday":
-        for weekday in Weekday:
-            if weekday.value[1] == name:
-                return weekday
-        raise ValueError(f"No weekday with name {name}")
+        try:
+            return _WEEKDAYS_BY_NAME[name]
+        except (KeyError, TypeError):
+            raise ValueError(f"No weekday with name {name}") from None
+
+
+_WEEKDAYS_BY_NUMBER = {weekday.value[0]: weekday for weekday in Weekday}
+_WEEKDAYS_BY_NAME = {weekday.value[1]: weekday for weekday in Weekday}
 
 
 @dataclass
@@ -84,23 +93,28 @@ def now_date() -> datetime.datetime:
     return datetime.datetime.now(pytz.timezone("Europe/Moscow"))
 
 
-def get_week(date: datetime.datetime = None) -> int:
+def get_week(date: datetime.date = None) -> int:
     """Возвращает номер учебной недели по дате
     Args:
-        date (datetime.datetime, optional): Дата, для которой необходимо получить учебную неделю.
+        date (datetime.date, optional): Дата, для которой необходимо получить учебную неделю.
     """
     now = now_date() if date is None else date
-    start_date = get_semester_start(date)
 
-    if now.timestamp() < start_date.timestamp():
-        return 1
+    if isinstance(now, datetime.datetime):
+        now = now.date()
 
-    week = now.isocalendar()[1] - start_date.isocalendar()[1]
+    period = get_period(now)
+    start_date = get_semester_start(period)
+
+    if now < start_date:
+        return 1
 
-    if now.isocalendar()[2] != 0:
-        week += 1
+    # The first week of the semester starts on Monday of the week containing the start date
+    first_monday = _get_first_monday(
+        period.year_start, period.year_end, period.semester
+    )
 
-    return week
+    return (now - first_monday).days // 7 + 1
 
 
 def get_day_by_week(period: Period, weekday: Weekday, week: int) -> datetime.date:
@@ -110,31 +124,30 @@ def get_day_by_week(period: Period, weekday: Weekday, week: int) -> datetime.dat
         weekday: Weekday for which the date of the day of the week is required.
         week: Week number for which the date of the day of the week is required.
     """
-    start_date = get_semester_start(period)
-
-    if week == 1:
-        return start_date + datetime.timedelta(
-            days=weekday.value[0] - 1 - start_date.weekday()
-        )
-
-    return start_date + datetime.timedelta(
-        days=7 * (week - 1) + weekday.value[0] - 1 - start_date.weekday()
+    first_monday = _get_first_monday(
+        period.year_start, period.year_end, period.semester
     )
 
+    return first_monday + datetime.timedelta(days=7 * (week - 1) + weekday.value[0] - 1)
+
 
 def get_semester_start(period: Period) -> datetime.date:
     """Returns the start date of the semester by date
     Args:
         period: Period for which the start date of the semester is required.
     """
+    return _get_semester_start(period.year_start, period.year_end, period.semester)
 
-    if period.semester == 1:
-        start_date = datetime.date(period.year_start, 9, 1)
+
+@functools.lru_cache(maxsize=None)
+def _get_semester_start(year_start: int, year_end: int, semester: int) -> datetime.date:
+    if semester == 1:
+        start_date = datetime.date(year_start, 9, 1)
         if start_date.weekday() == 6:
             start_date += datetime.timedelta(days=1)
         return start_date
 
-    start_date = datetime.date(period.year_end, 2, 1)
+    start_date = datetime.date(year_end, 2, 1)
 
     start_date += datetime.timedelta(days=8)
 
@@ -142,3 +155,62 @@ def get_semester_start(period: Period) -> datetime.date:
         start_date += datetime.timedelta(days=1)
 
     return start_date
+
+
+@functools.lru_cache(maxsize=None)
+def _get_first_monday(year_start: int, year_end: int, semester: int) -> datetime.date:
+    """Returns Monday of the first week of the semester."""
+    start_date = _get_semester_start(year_start, year_end, semester)
+    return start_date - datetime.timedelta(days=start_date.weekday())
+
+
+def get_days_by_week(
+    period: Period, weekdays: np.ndarray, weeks: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of `get_day_by_week`. Returns an array of dates (`datetime64[D]`) for each pair of the
+    weekday and the week number.
+    Args:
+        period: Period for which the dates are required.
+        weekdays: Array of weekday numbers (1 - Monday, ..., 7 - Sunday).
+        weeks: Array of week numbers with the same shape as `weekdays`.
+    """
+    first_monday = np.datetime64(
+        _get_first_monday(period.year_start, period.year_end, period.semester), "D"
+    )
+    days = 7 * (np.asarray(weeks, dtype=np.int64) - 1) + (
+        np.asarray(weekdays, dtype=np.int64) - 1
+    )
+
+    return first_monday + days.astype("timedelta64[D]")
+
+
+def get_weeks(dates: np.ndarray) -> np.ndarray:
+    """Vectorized version of `get_week`. Returns an array of week numbers for each date. The period of each date is
+    determined as in `get_period`.
+    Args:
+        dates: Array of dates (anything convertible to `datetime64[D]`).
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+    first_semester = months >= 7
+    year_start = np.where(first_semester, years, years - 1)
+    semester = np.where(first_semester, 1, 2)
+
+    # There are only a few different periods in the array, so the semester starts are calculated for unique ones
+    keys, inverse = np.unique(year_start * 2 + semester - 1, return_inverse=True)
+    periods = [(int(key) // 2, int(key) // 2 + 1, int(key) % 2 + 1) for key in keys]
+    inverse = inverse.reshape(dates.shape)
+
+    starts = np.array(
+        [_get_semester_start(*period) for period in periods], dtype="datetime64[D]"
+    )[inverse]
+    first_mondays = np.array(
+        [_get_first_monday(*period) for period in periods], dtype="datetime64[D]"
+    )[inverse]
+
+    weeks = (dates - first_mondays).astype(np.int64) // 7 + 1
+
+    return np.where(dates < starts, 1, weeks)
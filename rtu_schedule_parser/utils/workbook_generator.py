@@ -0,0 +1,331 @@
+"""
+Generator of synthetic schedule documents for load testing and benchmarks.
+
+Documents are written in the layouts expected by `ExcelScheduleParser` and `ExcelExamScheduleParser`. Workbooks are
+written in the write-only mode of openpyxl, so large documents (thousands of groups on many worksheets) can be
+generated without keeping them in memory.
+
+Examples:
+    >>> generate_semester_workbook("semester.xlsx", groups=2000, groups_per_sheet=100)
+    >>> generate_exam_workbook("exams.xlsx", groups=2000, exams=5)
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from openpyxl import Workbook
+
+from rtu_schedule_parser.utils.academic_calendar import MAX_WEEKS
+
+__all__ = [
+    "ContentMix",
+    "generate_semester_workbook",
+    "generate_exam_workbook",
+    "get_group_name",
+]
+
+_WEEKDAYS = ("ПОНЕДЕЛЬНИК", "ВТОРНИК", "СРЕДА", "ЧЕТВЕРГ", "ПЯТНИЦА", "СУББОТА")
+_LESSON_TIMES = (
+    ("9-00", "10-30"),
+    ("10-40", "12-10"),
+    ("12-40", "14-10"),
+    ("14-20", "15-50"),
+    ("16-20", "17-50"),
+    ("18-00", "19-30"),
+    ("19-40", "21-10"),
+)
+_EXAM_TIMES = ("9-00", "10-40", "12-40", "14-20", "16-20")
+
+_SUBJECTS = (
+    "Математический анализ",
+    "Линейная алгебра и аналитическая геометрия",
+    "Физика",
+    "Информатика",
+    "Дискретная математика",
+    "Теория вероятностей и математическая статистика",
+    "Базы данных",
+    "Операционные системы",
+    "Компьютерные сети",
+    "Программирование на языке Python",
+    "Архитектура вычислительных машин и систем",
+    "Методы оптимизации",
+    "Системы массового обслуживания",
+    "Русский язык и культура речи",
+    "Иностранный язык",
+    "История России",
+    "Философия",
+    "Экономика",
+    "Физическая культура и спорт",
+    "Безопасность жизнедеятельности",
+)
+_TEACHERS = (
+    "Иванов И.И.",
+    "Петров П.П.",
+    "Сидорова А.В.",
+    "Кузнецов Д.С.",
+    "Смирнова Е.А.",
+    "Попов В.Н.",
+    "Васильева О.Г.",
+    "Соколов М.Ю.",
+    "Михайлова Т.Р.",
+    "Новиков К.Л.",
+    "Фёдоров Р.Е.",
+    "Морозова Н.Б.",
+)
+_LESSON_TYPES = ("лк", "пр", "лр")
+_ROOM_TYPES = ("ауд.", "лаб.", "комп.")
+_CAMPUSES = ("В-78", "В-86", "МП-1", "С-20")
+_BUILDINGS = ("А", "Б", "В", "Г", "Д", "И")
+_GROUP_PREFIXES = (
+    "БНЧМ",
+    "ИКБО",
+    "ИНБО",
+    "КМБО",
+    "КРБО",
+    "ТХБО",
+    "ЭФБО",
+    "УИБО",
+    "ХББО",
+    "ГДБО",
+)
+# Number of different rooms in a document
+_ROOMS = 300
+
+# Rows of the semester table: two rows (odd and even weeks) for each lesson of each weekday
+_SEMESTER_ROWS = len(_WEEKDAYS) * len(_LESSON_TIMES) * 2
+
+
+@dataclass
+class ContentMix:
+    """
+    Probabilities of the kinds of lesson cells. Each non-empty cell gets one kind of the subject; rooms are
+    chosen independently. Probabilities of the subject kinds are checked in the order of the fields, the rest is plain
+    subjects without weeks.
+    """
+
+    # Empty cells (no lesson)
+    empty: float = 0.4
+    # Lists of weeks, for example "1,5,9,13 н. Физика"
+    weeks: float = 0.2
+    # Excluded weeks, for example "кр. 1,5 н. Физика"
+    excluded_weeks: float = 0.1
+    # Two subgroups with their own teachers, for example "Физика (1 п/г)\nФизика (2 п/г)"
+    subgroups: float = 0.05
+    # Two lessons on different weeks in one cell, for example "3,7 н. Физика\n11,15 н. Философия"
+    multiple_lessons: float = 0.05
+    # Several rooms in one cell
+    multiple_rooms: float = 0.1
+
+
+def get_group_name(index: int) -> str:
+    """Get a unique group name for the index of the group (up to 100000 groups)."""
+    prefix = _GROUP_PREFIXES[index // 10000]
+    return f"{prefix}-{index % 100:02d}-{index // 100 % 100:02d}"
+
+
+class _CellGenerator:
+    def __init__(self, rng: random.Random, mix: ContentMix) -> None:
+        self._rng = rng
+        self._mix = mix
+        # Each room has the same type and campus in all cells, as in the real documents
+        self._rooms = [
+            f"{rng.choice(_ROOM_TYPES)} {rng.choice(_BUILDINGS)}-{rng.randint(100, 499)} "
+            f"({rng.choice(_CAMPUSES)})"
+            for _ in range(_ROOMS)
+        ]
+
+    def get_weeks(self, is_even: bool, step: int = 4) -> list[int]:
+        start = self._rng.choice((2, 4) if is_even else (1, 3))
+        return list(range(start, MAX_WEEKS + 1, step))
+
+    @staticmethod
+    def format_weeks(weeks: list[int]) -> str:
+        return ",".join(map(str, weeks)) + " н."
+
+    def get_rooms(self) -> str:
+        if self._rng.random() < self._mix.multiple_rooms:
+            return "\n\n".join(self._rng.sample(self._rooms, 2))
+
+        return self._rng.choice(self._rooms)
+
+    def get_lesson(self, is_even: bool) -> tuple[str, str, str, str]:
+        """Get (subject, type, teacher, room) cells of the lesson."""
+        rng, mix = self._rng, self._mix
+
+        subject = rng.choice(_SUBJECTS)
+        lesson_type = rng.choice(_LESSON_TYPES)
+        teacher = rng.choice(_TEACHERS)
+
+        value = rng.random()
+        if value < mix.weeks:
+            subject = f"{self.format_weeks(self.get_weeks(is_even))} {subject}"
+
+        elif (value := value - mix.weeks) < mix.excluded_weeks:
+            excluded = rng.sample(self.get_weeks(is_even, 2), 2)
+            subject = f"кр. {self.format_weeks(sorted(excluded))} {subject}"
+
+        elif (value := value - mix.excluded_weeks) < mix.subgroups:
+            weeks = self.format_weeks(self.get_weeks(is_even))
+            subject = f"{weeks} {subject} (1 п/г)\n{weeks} {subject} (2 п/г)"
+            first, second = rng.sample(_TEACHERS, 2)
+            teacher = f"{first},1 п/г\n\n{second},2 п/г"
+
+        elif value - mix.subgroups < mix.multiple_lessons:
+            weeks = self.get_weeks(is_even)
+            first, second = rng.sample(_SUBJECTS, 2)
+            subject = (
+                f"{self.format_weeks(weeks[::2])} {first}\n"
+                f"{self.format_weeks(weeks[1::2])} {second}"
+            )
+            lesson_type = f"{lesson_type}\n{rng.choice(_LESSON_TYPES)}"
+            teacher = "\n".join(rng.sample(_TEACHERS, 2))
+
+        return subject, lesson_type, teacher, self.get_rooms()
+
+
+def _split(count: int, size: int) -> list[range]:
+    return [range(i, min(i + size, count)) for i in range(0, count, size)]
+
+
+def generate_semester_workbook(
+    path: str,
+    groups: int = 20,
+    groups_per_sheet: int = 20,
+    mix: ContentMix | None = None,
+    seed: int = 0,
+) -> None:
+    """
+    Generate a semester schedule document.
+
+    Each worksheet has a title row, a row with the group names, a header row and two rows (I and II weeks) for each
+    lesson of each weekday. Each group takes five columns: subject, type, teacher, room and link. The weekday, lesson
+    number, start and end time and week columns are placed before the first group.
+
+    Args:
+        path: Path of the xlsx file.
+        groups: Number of groups.
+        groups_per_sheet: Number of groups on one worksheet.
+        mix: Probabilities of the kinds of lesson cells. By default, `ContentMix()` is used.
+        seed: Seed of the random generator. Documents with the same arguments are equal.
+    """
+    rng = random.Random(seed)
+    mix = mix or ContentMix()
+    cells = _CellGenerator(rng, mix)
+
+    workbook = Workbook(write_only=True)
+
+    for sheet_num, indexes in enumerate(_split(groups, groups_per_sheet)):
+        worksheet = workbook.create_sheet(f"Лист{sheet_num + 1}")
+
+        worksheet.append(["РАСПИСАНИЕ занятий"])
+
+        header = ["День недели", "Группа", None, None, None]
+        for index in indexes:
+            header.extend([get_group_name(index), None, None, None, None])
+        worksheet.append(header)
+
+        columns = ["", "№ пары", "Нач.\nзанятий", "Оконч.\nзанятий", "Неделя"]
+        columns.extend(
+            ["Дисциплина", "Вид\nзанятий", "ФИО преподавателя", "№ \nауд.", "Ссылка"]
+            * len(indexes)
+        )
+        worksheet.append(columns)
+
+        for row_num in range(_SEMESTER_ROWS):
+            weekday, lesson = divmod(row_num // 2, len(_LESSON_TIMES))
+            is_even = row_num % 2 == 1
+
+            row = [
+                _WEEKDAYS[weekday] if row_num % (len(_LESSON_TIMES) * 2) == 0 else None,
+                None if is_even else lesson + 1,
+                None if is_even else _LESSON_TIMES[lesson][0],
+                None if is_even else _LESSON_TIMES[lesson][1],
+                "II" if is_even else "I",
+            ]
+            for _ in indexes:
+                if rng.random() < mix.empty:
+                    row.extend(["", "", "", "", ""])
+                else:
+                    row.extend([*cells.get_lesson(is_even), ""])
+
+            worksheet.append(row)
+
+    workbook.save(path)
+
+
+def generate_exam_workbook(
+    path: str,
+    groups: int = 20,
+    groups_per_sheet: int = 20,
+    exams: int = 4,
+    days: int = 24,
+    month: str = "январь",
+    mix: ContentMix | None = None,
+    seed: int = 0,
+) -> None:
+    """
+    Generate an exam session schedule document.
+
+    Each worksheet has a title row, a row with the group names and three rows for each day of the session. Each group
+    takes four columns: exam type, name and teacher (in the three rows of the day), start time, room and link. The
+    month and day columns are placed before the first group. Each exam has a consultation on the previous day.
+
+    Args:
+        path: Path of the xlsx file.
+        groups: Number of groups.
+        groups_per_sheet: Number of groups on one worksheet.
+        exams: Number of exams of each group. Each exam takes two days.
+        days: Number of days of the session starting with the 1st day of the month.
+        month: Name of the month of the session.
+        mix: Only `multiple_rooms` is used. By default, `ContentMix()` is used.
+        seed: Seed of the random generator. Documents with the same arguments are equal.
+    """
+    if exams * 2 > days:
+        raise ValueError("Not enough days for the exams")
+
+    rng = random.Random(seed)
+    cells = _CellGenerator(rng, mix or ContentMix())
+
+    workbook = Workbook(write_only=True)
+
+    for sheet_num, indexes in enumerate(_split(groups, groups_per_sheet)):
+        worksheet = workbook.create_sheet(f"Лист{sheet_num + 1}")
+
+        # Day of the session -> (type, name, teacher, time, room) for each group
+        group_days = []
+        for _ in indexes:
+            exam_days = {}
+            for pair in sorted(rng.sample(range(days // 2), exams)):
+                name, teacher = rng.choice(_SUBJECTS), rng.choice(_TEACHERS)
+                time, rooms = rng.choice(_EXAM_TIMES), cells.get_rooms()
+                exam_days[pair * 2] = ("Консультация", name, teacher, time, rooms)
+                exam_days[pair * 2 + 1] = ("Экзамен", name, teacher, time, rooms)
+            group_days.append(exam_days)
+
+        worksheet.append(["РАСПИСАНИЕ экзаменационной сессии"])
+
+        header = ["месяц", "число"]
+        for index in indexes:
+            header.extend([get_group_name(index), "время", "№ ауд", "Ссылка"])
+        worksheet.append(header)
+
+        for day in range(days):
+            for i in range(3):
+                row = [
+                    month if day == 0 and i == 0 else None,
+                    day + 1 if i == 0 else None,
+                ]
+                for exam_days in group_days:
+                    if day not in exam_days:
+                        row.extend([None, None, None, None])
+                    elif i == 0:
+                        exam_type, _, _, time, rooms = exam_days[day]
+                        row.extend([exam_type, time, rooms, None])
+                    else:
+                        row.extend([exam_days[day][i], None, None, None])
+
+                worksheet.append(row)
+
+    workbook.save(path)
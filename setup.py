@@ -19,6 +19,11 @@ requires = [
     "currency-symbols==1.0.0",
 ]
 
+extras_require = {
+    "arrow": ["pyarrow>=8.0.0"],
+    "msgpack": ["msgpack>=1.0.0"],
+}
+
 
 def setup_package():
     metadata = dict(
@@ -32,6 +37,10 @@ def setup_package():
         license="MIT License",
         packages=find_packages(exclude=("tests",)),
         install_requires=requires,
+        extras_require=extras_require,
+        entry_points={
+            "console_scripts": ["rtu-schedule = rtu_schedule_parser.cli:main"],
+        },
         classifiers=[
             "License :: OSI Approved :: MIT License",
             "Programming Language :: Python :: 3",
@@ -1,5 +1,8 @@
 from datetime import date, datetime
 
+import numpy as np
+import pytest
+
 import rtu_schedule_parser.utils.academic_calendar as academic_calendar
 from rtu_schedule_parser.utils.academic_calendar import Period, Weekday
 
@@ -71,3 +74,46 @@ def test_academic_calendar_3():
     assert academic_calendar.get_day_by_week(period, Weekday.SUNDAY, 17) == date(
         2022, 12, 25
     )
+
+
+def test_academic_calendar_4():
+    assert academic_calendar.get_week(date(2022, 9, 1)) == 1
+    assert academic_calendar.get_week(date(2022, 9, 4)) == 1
+    assert academic_calendar.get_week(date(2022, 9, 5)) == 2
+    assert academic_calendar.get_week(datetime(2022, 12, 19, 10, 30)) == 17
+    assert academic_calendar.get_week(date(2022, 8, 20)) == 1
+
+    period = Period(2022, 2023, 2)
+    day = academic_calendar.get_day_by_week(period, Weekday.FRIDAY, 5)
+    assert academic_calendar.get_week(day) == 5
+
+
+def test_academic_calendar_5():
+    period = Period(2022, 2023, 1)
+    weekdays = np.array([weekday.value[0] for weekday in Weekday] * 17)
+    weeks = np.repeat(np.arange(1, 18), len(Weekday))
+
+    days = academic_calendar.get_days_by_week(period, weekdays, weeks)
+    assert days.dtype == np.dtype("datetime64[D]")
+    assert days.tolist() == [
+        academic_calendar.get_day_by_week(
+            period, Weekday.get_weekday_by_number(weekday), week
+        )
+        for weekday, week in zip(weekdays.tolist(), weeks.tolist())
+    ]
+
+    dates = [date(2021, 1, 15), date(2022, 9, 1), date(2022, 12, 19), date(2023, 3, 1)]
+    assert academic_calendar.get_weeks(dates).tolist() == [
+        academic_calendar.get_week(day) for day in dates
+    ]
+
+
+def test_academic_calendar_6():
+    assert Weekday.get_weekday_by_name("среда") == Weekday.WEDNESDAY
+    assert Weekday.get_weekday_by_number(7) == Weekday.SUNDAY
+    assert academic_calendar.Month.from_str("Январь") == academic_calendar.Month.JANUARY
+
+    with pytest.raises(ValueError):
+        Weekday.get_weekday_by_name("вс")
+    with pytest.raises(ValueError):
+        Weekday.get_weekday_by_number(8)
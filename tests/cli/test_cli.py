@@ -0,0 +1,113 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from rtu_schedule_parser import cli
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
+from rtu_schedule_parser.downloader import ScheduleDocument, ScheduleDownloader
+from rtu_schedule_parser.utils import Period
+
+SCHEDULE_PATH = os.path.join(os.path.dirname(__file__), "..", "test_schedule.xlsx")
+
+PARSE_ARGS = [
+    "parse",
+    SCHEDULE_PATH,
+    "--institute",
+    "ИИИ",
+    "--period",
+    "2022-2023-1",
+    "--workers",
+    "1",
+]
+
+
+def test_cli_0(tmp_path, capsys):
+    assert cli.main(PARSE_ARGS + ["--format", "json", "--output", str(tmp_path)]) == 0
+
+    out, err = capsys.readouterr()
+    assert "semester\t22\tgroups" in out
+    assert "Parsed 1/1 documents, 22 groups" in err
+    assert "formatter" in err
+
+    with open(os.path.join(tmp_path, "semester.json"), encoding="utf-8") as file:
+        data = json.load(file)
+
+    assert len(data) == 22
+    assert data[0]["period"] == {"year_start": 2022, "year_end": 2023, "semester": 1}
+
+
+def test_cli_1(tmp_path):
+    metrics_path = str(tmp_path / "metrics.prom")
+
+    args = PARSE_ARGS + ["--format", "sqlite", "--output", str(tmp_path)]
+    assert cli.main(args + ["--metrics", metrics_path]) == 0
+
+    with open(metrics_path) as file:
+        assert 'rtu_schedule_parser_items_total{item="groups"} 22' in file.read()
+
+    with sqlite3.connect(os.path.join(tmp_path, "semester.sqlite")) as connection:
+        (groups,) = connection.execute("SELECT COUNT(*) FROM groups").fetchone()
+
+    assert groups == 22
+
+    assert cli.main(PARSE_ARGS + ["--format", "ics", "--output", str(tmp_path)]) == 0
+    assert len(os.listdir(os.path.join(tmp_path, "semester"))) == 22
+
+
+def test_cli_2(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    from rtu_schedule_parser import ScheduleData
+
+    args = ["parse", SCHEDULE_PATH, SCHEDULE_PATH, "--institute", "ИИИ"]
+    args += ["--workers", "2", "--format", "parquet", "--output", str(tmp_path)]
+    assert cli.main(args) == 0
+
+    schedule_data = ScheduleData.from_parquet(
+        os.path.join(tmp_path, "semester.parquet")
+    )
+    assert len(schedule_data.get_groups()) == 22
+
+
+def test_cli_3(capsys):
+    assert (
+        cli.main(["parse", "missing.xlsx", "--institute", "ИИИ", "--workers", "1"]) == 1
+    )
+
+    with pytest.raises(SystemExit):
+        cli.main(["parse", SCHEDULE_PATH, "--institute", "XXX"])
+
+    with pytest.raises(SystemExit):
+        cli.main(PARSE_ARGS + ["--format", "json"])
+
+    for workers in ("0", "-1", "x"):
+        with pytest.raises(SystemExit):
+            cli.main(["parse", SCHEDULE_PATH, "--workers", workers])
+
+
+def test_cli_4(monkeypatch, capsys):
+    document = ScheduleDocument(
+        Institute.IIT,
+        ScheduleType.SEMESTER,
+        Degree.BACHELOR,
+        Period(2022, 2023, 1),
+        "https://example.com/ИИТ_1 курс.xlsx",
+    )
+    calls = []
+
+    def get_documents(self, schedule_types=None, institutes=None, degrees=None):
+        calls.append((schedule_types, institutes, degrees))
+        return [
+            document,
+            document.__class__(*list(vars(document).values())[:4], "x.pdf"),
+        ]
+
+    monkeypatch.setattr(ScheduleDownloader, "get_documents", get_documents)
+
+    assert cli.main(["discover", "--type", "semester", "--institute", "ИИТ"]) == 0
+
+    out, _ = capsys.readouterr()
+    assert out == "semester\tbachelor\tИИТ\thttps://example.com/ИИТ_1 курс.xlsx\n"
+    assert calls == [({ScheduleType.SEMESTER}, {Institute.IIT}, None)]
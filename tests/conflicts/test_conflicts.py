@@ -0,0 +1,123 @@
+import datetime
+
+import pytest
+
+from rtu_schedule_parser import ExamsSchedule, Lesson, LessonsSchedule, ScheduleData
+from rtu_schedule_parser.conflicts import ConflictType, find_conflicts
+from rtu_schedule_parser.constants import Campus, Degree, Institute, ScheduleType
+from rtu_schedule_parser.schedule import Room
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+
+
+def _schedule(group, *lessons):
+    return LessonsSchedule(
+        group=group,
+        period=Period(2022, 2023, 1),
+        institute=Institute.IIT,
+        degree=Degree.BACHELOR,
+        lessons=list(lessons),
+    )
+
+
+def _lesson(name, weeks, teachers, room, num=1):
+    return Lesson(
+        num=num,
+        name=name,
+        weeks=weeks,
+        weekday=Weekday.MONDAY,
+        teachers=teachers,
+        time_start=datetime.time(9, 0),
+        time_end=datetime.time(10, 30),
+        room=room,
+    )
+
+
+def test_conflicts_0():
+    room = Room("А-101", Campus.V_78)
+
+    # Stream lecture of three groups
+    schedules = [
+        _schedule(group, _lesson("Физика", [1, 3, 5], ["Иванов И.И."], room))
+        for group in ("ИКБО-01-20", "ИКБО-02-20", "ИКБО-03-20")
+    ]
+    # Another lesson in the same room in other weeks
+    schedules.append(
+        _schedule("ИКБО-04-20", _lesson("Химия", [2, 4], ["Петров П.П."], room))
+    )
+
+    assert find_conflicts(schedules) == []
+
+
+def test_conflicts_1():
+    room = Room("А-101", Campus.V_78)
+    schedules = [
+        _schedule("ИКБО-01-20", _lesson("Физика", [1, 3, 5], ["Иванов И.И."], room)),
+        _schedule("ИКБО-02-20", _lesson("Физика", [1, 3, 5], ["Иванов И.И."], room)),
+        _schedule("ИКБО-03-20", _lesson("Химия", [5, 7], ["Петров П.П."], room)),
+        _schedule(
+            "ИКБО-04-20",
+            _lesson("Физика", [3], ["Иванов И. И."], Room("Б-202", Campus.V_78)),
+        ),
+    ]
+
+    conflicts = find_conflicts(schedules)
+
+    assert [conflict.conflict_type for conflict in conflicts] == [
+        ConflictType.TEACHER,
+        ConflictType.ROOM,
+    ]
+
+    teacher_conflict, room_conflict = conflicts
+
+    # Spelling variants of the teacher name are the same teacher
+    assert teacher_conflict.resource.name == "Иванов И.И."
+    assert teacher_conflict.weeks == [3]
+    assert [booking.groups for booking in teacher_conflict.bookings] == [
+        ["ИКБО-01-20", "ИКБО-02-20"],
+        ["ИКБО-04-20"],
+    ]
+
+    assert room_conflict.resource == room
+    assert (room_conflict.weekday, room_conflict.num) == (Weekday.MONDAY, 1)
+    assert room_conflict.weeks == [5]
+    assert [booking.name for booking in room_conflict.bookings] == ["Физика", "Химия"]
+    assert room_conflict.bookings[0].weeks == [1, 3, 5]
+
+
+def test_conflicts_2():
+    online = Room("СДО", Campus.ONLINE)
+    schedules = [
+        _schedule("ИКБО-01-20", _lesson("Физика", [1], ["Иванов И.И."], online)),
+        _schedule("ИКБО-02-20", _lesson("Химия", [1], ["Петров П.П."], online)),
+        # Different lesson numbers do not conflict
+        _schedule("ИКБО-03-20", _lesson("Химия", [1], ["Иванов И.И."], None, num=2)),
+    ]
+
+    assert find_conflicts(schedules) == []
+    assert len(find_conflicts(schedules, include_online=True)) == 1
+
+
+def test_conflicts_3(excel_parser):
+    schedule_data = excel_parser.parse()
+
+    for conflict in schedule_data.find_conflicts():
+        assert len(conflict.bookings) > 1
+        assert conflict.weeks
+        for booking in conflict.bookings:
+            assert set(booking.weeks) & set(conflict.weeks)
+
+
+def test_conflicts_4():
+    exams = ExamsSchedule(
+        group="ИКБО-01-20",
+        period=Period(2022, 2023, 1),
+        institute=Institute.IIT,
+        degree=Degree.BACHELOR,
+    )
+
+    with pytest.raises(TypeError):
+        find_conflicts([exams])
+
+    with pytest.raises(TypeError):
+        ScheduleData([exams], schedule_type=ScheduleType.EXAM_SESSION).find_conflicts()
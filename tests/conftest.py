@@ -2,7 +2,7 @@ import os
 
 import pytest
 
-from rtu_schedule_parser import ExcelScheduleParser
+from rtu_schedule_parser import ExcelScheduleParser, ScheduleData
 from rtu_schedule_parser.constants import Degree, Institute
 from rtu_schedule_parser.downloader.schedule_downloader import ScheduleDownloader
 from rtu_schedule_parser.formatter import Formatter
@@ -30,6 +30,11 @@ def excel_parser() -> ExcelScheduleParser:
     )
 
 
+@pytest.fixture()
+def schedule_data(excel_parser: ExcelScheduleParser) -> ScheduleData:
+    return excel_parser.parse()
+
+
 @pytest.fixture()
 def schedule_downloader() -> ScheduleDownloader:
     from rtu_schedule_parser.downloader import ScheduleDownloader
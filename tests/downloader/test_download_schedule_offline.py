@@ -0,0 +1,171 @@
+import os
+
+import pytest
+
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
+from rtu_schedule_parser.downloader import ScheduleDocument, ScheduleDownloader
+from rtu_schedule_parser.downloader import schedule_downloader as downloader_module
+from rtu_schedule_parser.utils import Period
+
+DOCUMENT = ScheduleDocument(
+    Institute.IIT,
+    ScheduleType.SEMESTER,
+    Degree.BACHELOR,
+    Period(2022, 2023, 1),
+    "https://example.com/schedule.xlsx",
+)
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content, headers, fail_after=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise ConnectionError("Connection reset")
+            yield self.content[i : i + chunk_size]
+
+
+class _FakeServer:
+    def __init__(self, content):
+        self.content = content
+        self.etag = '"1"'
+        self.fail_after = None
+        # If set, ranges are sent from this offset instead of the requested one
+        self.range_start = None
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+
+        fail_after, self.fail_after = self.fail_after, None
+        response_headers = {"ETag": self.etag}
+
+        if "Range" in headers and headers.get("If-Range") == self.etag:
+            offset = int(headers["Range"][len("bytes=") : -1])
+            if offset >= len(self.content):
+                return _FakeResponse(416, b"", response_headers)
+
+            if self.range_start is not None:
+                offset = self.range_start
+
+            response_headers["Content-Range"] = (
+                f"bytes {offset}-{len(self.content) - 1}/{len(self.content)}"
+            )
+            return _FakeResponse(
+                206, self.content[offset:], response_headers, fail_after
+            )
+
+        return _FakeResponse(200, self.content, response_headers, fail_after)
+
+
+@pytest.fixture()
+def server(monkeypatch):
+    server = _FakeServer(os.urandom(1024 * 1024))
+    monkeypatch.setattr(downloader_module.requests, "get", server.get)
+    return server
+
+
+def _read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def test_download_schedule_offline_0(server, tmp_path):
+    downloader = ScheduleDownloader(str(tmp_path))
+
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is True
+    assert _read(path) == server.content
+
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is False
+    assert _read(path) == server.content
+
+    server.content = os.urandom(1000)
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is True
+    assert _read(path) == server.content
+
+    assert os.listdir(os.path.dirname(path)) == ["schedule.xlsx"]
+
+
+def test_download_schedule_offline_1(server, tmp_path):
+    downloader = ScheduleDownloader(str(tmp_path))
+
+    # The download is interrupted, the existing file is not touched
+    server.fail_after = 256 * 1024
+    assert downloader.download(DOCUMENT) is None
+    assert not os.path.exists(os.path.join(tmp_path, "semester", "schedule.xlsx"))
+
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is True
+    assert _read(path) == server.content
+    assert server.requests[-1] == {"Range": "bytes=262144-", "If-Range": '"1"'}
+
+
+def test_download_schedule_offline_2(server, tmp_path):
+    downloader = ScheduleDownloader(str(tmp_path))
+
+    server.fail_after = 256 * 1024
+    assert downloader.download(DOCUMENT) is None
+
+    # The file has changed since the interrupted download, so it is downloaded again from the start
+    server.content = os.urandom(512 * 1024)
+    server.etag = '"2"'
+
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is True
+    assert _read(path) == server.content
+
+
+def test_download_schedule_offline_3(server, tmp_path):
+    downloader = ScheduleDownloader(str(tmp_path))
+
+    # The process died after the `.part` file was complete, but before the validator file was removed
+    part_path = os.path.join(tmp_path, "semester", "schedule.xlsx.part")
+    os.makedirs(os.path.dirname(part_path))
+    with open(part_path, "wb") as file:
+        file.write(server.content)
+    with open(f"{part_path}.validator", "w", encoding="utf-8") as file:
+        file.write(server.etag)
+
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is True
+    assert _read(path) == server.content
+    assert server.requests == [
+        {"Range": f"bytes={len(server.content)}-", "If-Range": '"1"'},
+        {},
+    ]
+    assert os.listdir(os.path.dirname(path)) == ["schedule.xlsx"]
+
+
+def test_download_schedule_offline_4(server, tmp_path):
+    downloader = ScheduleDownloader(str(tmp_path))
+
+    server.fail_after = 256 * 1024
+    assert downloader.download(DOCUMENT) is None
+
+    # The server sends another range than requested, so the file is downloaded from the start
+    server.range_start = 0
+    path, downloaded = downloader.download(DOCUMENT)
+    assert downloaded is True
+    assert _read(path) == server.content
+    assert server.requests[-2:] == [
+        {"Range": "bytes=262144-", "If-Range": '"1"'},
+        {},
+    ]
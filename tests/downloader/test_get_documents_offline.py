@@ -0,0 +1,130 @@
+import os
+
+import pytest
+
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
+from rtu_schedule_parser.downloader import ScheduleDownloader
+from rtu_schedule_parser.downloader import schedule_downloader as downloader_module
+
+with open(os.path.join(os.path.dirname(__file__), "schedule_page.html"), "rb") as f:
+    SCHEDULE_PAGE = f.read()
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@pytest.fixture()
+def requests_log(monkeypatch):
+    log = []
+
+    def get(url, headers=None, **kwargs):
+        log.append(headers or {})
+        if (headers or {}).get("If-None-Match") == '"1"':
+            return _FakeResponse(304)
+        return _FakeResponse(200, SCHEDULE_PAGE, {"ETag": '"1"'})
+
+    monkeypatch.setattr(downloader_module.requests, "get", get)
+    return log
+
+
+def _urls(documents):
+    return [
+        (document.schedule_type, document.degree, document.institute, document.url)
+        for document in documents
+    ]
+
+
+def test_get_documents_offline_0(requests_log):
+    documents = ScheduleDownloader().get_documents(
+        specific_schedule_types={ScheduleType.SEMESTER}
+    )
+
+    assert _urls(documents) == [
+        (
+            ScheduleType.SEMESTER,
+            Degree.BACHELOR,
+            Institute.IIT,
+            "https://example.com/ИИТ_1 курс_22-23_осень.xlsx",
+        ),
+        (
+            ScheduleType.SEMESTER,
+            Degree.BACHELOR,
+            Institute.IIT,
+            "https://example.com/ИИТ_2 курс_22-23_осень.xlsx",
+        ),
+        (
+            ScheduleType.SEMESTER,
+            Degree.BACHELOR,
+            Institute.III,
+            "https://example.com/ИИИ_3 курс_22-23_осень.xlsx",
+        ),
+        (
+            ScheduleType.SEMESTER,
+            Degree.MASTER,
+            Institute.IKB,
+            "https://example.com/ИКБ_маг_1 курс_22-23_осень.xlsx",
+        ),
+        (
+            ScheduleType.SEMESTER,
+            Degree.COLLEGE,
+            Institute.COLLEGE,
+            "https://example.com/КПК_22-23_осень.xlsx",
+        ),
+    ]
+
+
+def test_get_documents_offline_1(requests_log):
+    downloader = ScheduleDownloader()
+
+    documents = downloader.get_documents(
+        specific_schedule_types={ScheduleType.EXAM_SESSION},
+        specific_institutes={Institute.IIT},
+        specific_degrees={Degree.BACHELOR},
+    )
+    assert [document.url for document in documents] == [
+        "https://example.com/экз_ИИТ_1 курс_22-23_зима.xlsx",
+        "https://example.com/экз_ИИТ_2 курс_22-23_зима.pdf",
+    ]
+
+    documents = downloader.get_documents(
+        specific_schedule_types={ScheduleType.TEST_SESSION},
+        specific_institutes={Institute.IIT},
+    )
+    assert [document.url for document in documents] == [
+        "https://example.com/зач_ИИТ_1 курс_22-23_осень.xlsx",
+    ]
+
+    # The page is not downloaded and parsed again if it has not changed
+    assert requests_log == [{}, {"If-None-Match": '"1"'}]
+
+
+def test_get_documents_offline_2(monkeypatch):
+    responses = []
+
+    def get(url, headers=None, **kwargs):
+        responses.append(_FakeResponse(200, SCHEDULE_PAGE))
+        return responses[-1]
+
+    parsed = []
+    beautiful_soup = downloader_module.BeautifulSoup
+
+    def parse(*args, **kwargs):
+        parsed.append(args)
+        return beautiful_soup(*args, **kwargs)
+
+    monkeypatch.setattr(downloader_module.requests, "get", get)
+    monkeypatch.setattr(downloader_module, "BeautifulSoup", parse)
+
+    downloader = ScheduleDownloader()
+    first = downloader.get_documents()
+    second = downloader.get_documents()
+
+    # Without ETag the page is compared by hash
+    assert len(responses) == 2
+    assert len(parsed) == 1
+    assert first == second
+    assert len(first) == 11
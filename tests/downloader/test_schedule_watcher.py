@@ -0,0 +1,130 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from rtu_schedule_parser.constants import Degree, Institute, ScheduleType
+from rtu_schedule_parser.downloader import (
+    ScheduleDocument,
+    ScheduleWatcher,
+    schedule_watcher,
+)
+from rtu_schedule_parser.utils import Period
+
+DOCUMENT = ScheduleDocument(
+    Institute.III,
+    ScheduleType.SEMESTER,
+    Degree.BACHELOR,
+    Period(2022, 2023, 1),
+    "https://example.com/schedule.xlsx",
+)
+
+
+class _FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeDownloader:
+    def __init__(self, path):
+        self.path = path
+        self.documents = [DOCUMENT]
+        self.changed = True
+        self.downloads = 0
+
+    def get_documents(self, schedule_types=None, institutes=None, degrees=None):
+        return self.documents
+
+    def download(self, document):
+        self.downloads += 1
+        return self.path, self.changed
+
+
+@pytest.fixture()
+def downloader(tmp_path):
+    path = os.path.join(tmp_path, "schedule.xlsx")
+    shutil.copy(
+        os.path.join(os.path.dirname(__file__), "..", "test_schedule.xlsx"), path
+    )
+    return _FakeDownloader(path)
+
+
+@pytest.fixture()
+def headers(monkeypatch):
+    headers = {"ETag": '"1"'}
+    monkeypatch.setattr(
+        schedule_watcher.requests,
+        "head",
+        lambda *args, **kwargs: _FakeResponse(headers),
+    )
+    return headers
+
+
+def test_schedule_watcher_0(downloader, headers):
+    watcher = ScheduleWatcher(downloader)
+    events = []
+    watcher.add_listener(events.append)
+
+    changes = watcher.poll_once()
+    schedule_data = watcher.get_schedule_data(ScheduleType.SEMESTER)
+
+    assert len(changes) == 1
+    assert changes == events
+    assert changes[0].added == sorted(schedule_data.get_groups())
+    assert not changes[0].updated and not changes[0].removed
+    assert all(
+        schedule.document_url == DOCUMENT.url
+        for schedule in schedule_data.get_schedule()
+    )
+
+    # Validators are the same, the document is not downloaded
+    assert watcher.poll_once() == []
+    assert downloader.downloads == 1
+
+    # Validators have changed, but the content is the same
+    headers["ETag"] = '"2"'
+    downloader.changed = False
+    assert watcher.poll_once() == []
+    assert downloader.downloads == 2
+
+    # The content has changed, the document is parsed again and the data is updated in place
+    headers["ETag"] = '"3"'
+    downloader.changed = True
+    changes = watcher.poll_once()
+    assert len(changes) == 1
+    assert changes[0].updated == sorted(schedule_data.get_groups())
+    assert watcher.get_schedule_data(ScheduleType.SEMESTER) is schedule_data
+
+
+def test_schedule_watcher_1(downloader, headers):
+    watcher = ScheduleWatcher(downloader)
+    watcher.poll_once()
+    groups = watcher.get_schedule_data(ScheduleType.SEMESTER).get_groups()
+
+    downloader.documents = []
+    changes = watcher.poll_once()
+
+    assert len(changes) == 1
+    assert changes[0].removed == sorted(groups)
+    assert watcher.get_schedule_data(ScheduleType.SEMESTER).get_schedule() == []
+
+
+def test_schedule_watcher_2(downloader, headers):
+    watcher = ScheduleWatcher(downloader, interval=0)
+    queue = asyncio.Queue()
+
+    async def run():
+        task = asyncio.create_task(watcher.run_async(queue))
+        change = await asyncio.wait_for(queue.get(), timeout=30)
+        task.cancel()
+        return change
+
+    change = asyncio.run(run())
+
+    assert change.document == DOCUMENT
+    assert change.schedule_type == ScheduleType.SEMESTER
+    assert change.added
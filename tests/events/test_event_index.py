@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+
+from rtu_schedule_parser import LessonEmpty
+from rtu_schedule_parser.events import EventIndex
+from rtu_schedule_parser.utils import academic_calendar
+
+
+def test_event_index_0(schedule_data):
+    index = EventIndex(schedule_data)
+
+    expected = sum(
+        len(lesson.weeks)
+        for schedule in schedule_data.get_schedule()
+        for lesson in schedule.lessons
+        if type(lesson) is not LessonEmpty
+    )
+    assert len(index) == expected
+
+    starts = [event.start for event in index]
+    assert starts == sorted(starts)
+
+
+def test_event_index_1(schedule_data):
+    index = EventIndex(schedule_data)
+    date = datetime.date(2022, 9, 12)
+    week = academic_calendar.get_week(date)
+
+    events = index.get_group_events("КМБО-03-19", date)
+    assert len(events) > 0
+
+    expected = [
+        lesson
+        for lesson in schedule_data.get_group_schedule("КМБО-03-19").lessons
+        if type(lesson) is not LessonEmpty
+        and lesson.weekday == academic_calendar.Weekday.MONDAY
+        and week in lesson.weeks
+    ]
+    assert len(events) == len(expected)
+    for event in events:
+        assert event.group == "КМБО-03-19"
+        assert event.start.date() == date
+        assert event.lesson in expected
+
+
+def test_event_index_2(schedule_data):
+    index = EventIndex(schedule_data)
+
+    # Lessons in progress at 11:00 started at 10:40
+    at = datetime.datetime(2022, 9, 12, 11, 0)
+    events = index.get_events(at, at + datetime.timedelta(minutes=1))
+    assert len(events) > 0
+    assert all(event.start <= at < event.end for event in events)
+
+    day_events = index.get_day_events(at.date())
+    assert {id(event) for event in events} <= {id(event) for event in day_events}
+
+    with pytest.raises(ValueError):
+        index.get_group_events("КРБО-01-22", at.date())
+
+
+def test_event_index_3(schedule_data):
+    index = EventIndex(schedule_data)
+
+    assert len(index.get_events()) == len(index)
+
+    events = index.get_events(group="КМБО-03-19")
+    assert len(events) > 0
+    assert all(event.group == "КМБО-03-19" for event in events)
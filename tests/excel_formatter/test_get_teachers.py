@@ -161,8 +161,8 @@ def test_get_teacher_22(excel_formatter):
     result = excel_formatter.get_teachers("1 п/г\n2 п/г")
 
     assert result == [
-        ('Нет', 1),
-        ('Нет', 2),
+        ("Нет", 1),
+        ("Нет", 2),
     ]
 
 
@@ -170,6 +170,19 @@ def test_get_teacher_23(excel_formatter):
     result = excel_formatter.get_teachers("1 п/г\n\n2 п/г")
 
     assert result == [
-        ('Нет', 1),
-        ('Нет', 2),
-    ]
\ No newline at end of file
+        ("Нет", 1),
+        ("Нет", 2),
+    ]
+
+
+def test_get_teacher_24(excel_formatter):
+    cell = "Козлова Г.Г.,1 п/г\nИсаев Р.А.,2 п/г"
+
+    first = excel_formatter.get_teachers(cell)
+    first.append(("", None))
+    second = excel_formatter.get_teachers(cell)
+
+    # Changes of the result do not affect the cached value
+    assert second == [("Козлова Г.Г.", 1), ("Исаев Р.А.", 2)]
+    # Names of the same cell are shared between the results
+    assert first[0][0] is second[0][0]
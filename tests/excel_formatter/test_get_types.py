@@ -1,4 +1,8 @@
+import logging
+
+from rtu_schedule_parser import constants
 from rtu_schedule_parser.constants import LessonType
+from rtu_schedule_parser.excel_formatter import ExcelFormatter
 
 
 def test_formatter_1(excel_formatter):
@@ -23,3 +27,38 @@ def test_formatter_4(excel_formatter):
     result = excel_formatter.get_types("лк\nлк\nлк\nлк")
     correct_result = [LessonType.LECTURE] * 4
     assert result == correct_result
+
+
+def test_formatter_5(excel_formatter):
+    result = excel_formatter.get_types("кр\nзач\nзд")
+    correct_result = [
+        LessonType.PRACTICE,
+        constants.TestSessionLessonType.CREDIT,
+        constants.TestSessionLessonType.DIFFERENTIATED_CREDIT,
+    ]
+    assert result == correct_result
+
+
+def test_formatter_6(excel_formatter, monkeypatch):
+    monkeypatch.setattr(
+        ExcelFormatter, "_LESSON_TYPE_ALIASES", ExcelFormatter._LESSON_TYPE_ALIASES
+    )
+
+    assert excel_formatter.get_types("семинар") == [None]
+
+    ExcelFormatter.register_lesson_type("семинар", LessonType.PRACTICE)
+
+    assert excel_formatter.get_types("семинар") == [LessonType.PRACTICE]
+
+
+def test_formatter_7(excel_formatter, caplog):
+    with caplog.at_level(logging.WARNING):
+        result = excel_formatter.get_types("xx\nxx\nyy\nлк")
+
+    assert result == [None, None, None, LessonType.LECTURE]
+    assert excel_formatter.get_unknown_lesson_types() == {"xx": 2, "yy": 1}
+    # Each unknown type is logged once
+    assert [record.getMessage() for record in caplog.records] == [
+        "Unknown lesson type: xx",
+        "Unknown lesson type: yy",
+    ]
@@ -0,0 +1,63 @@
+import pytest
+from openpyxl import load_workbook
+
+from tests import conftest
+
+CELLS = [
+    "1-17 н. (кр. 3 н.) Архитектура утройств и систем вычислительной техники",
+    "кр. 3,5 н. Теория автоматического управления",
+    "2,6,10,14 н Экология\n4,8,12,16 Правоведение",
+    "Деньги, кредит, банки кр. 2,8,10 н.",
+    "1,5,9,13 н. Физика (1 п/г)\n1,5,9,13 н. Физика (2 п/г)",
+    "Ин.яз. 1,2 подгр",
+    "англ.яз. (2подгр.)",
+    "4,8,12,16 н. Электротехника\n2 п/г",
+    "2,4,6,8,10 (лк),12,14н (пр) Инструментарий информационно-аналитической деятельности",
+    "1гр.= 2н.; 2гр.=4н. Криптографические методы защиты информации;",
+    "6,12н-1гр 4,10н-2 гр Материалы и технологии трехмерной печати в машиностр",
+    "1,3,9,13 Конфиденциальное делопроизводство 5,7,11,15 н. кр 5 н. Деньги, кредит,банки",
+    "Военная\nподготовка",
+]
+
+
+def get_schedule_cells() -> list[str]:
+    """Get all strings of the test schedule document."""
+    workbook = load_workbook(
+        conftest.test_schedule_file_path(), read_only=True, data_only=True
+    )
+
+    cells = {
+        value
+        for worksheet in workbook.worksheets
+        for row in worksheet.iter_rows(values_only=True)
+        for value in row
+        if isinstance(value, str) and value.strip()
+    }
+    workbook.close()
+
+    return sorted(cells)
+
+
+@pytest.mark.parametrize("is_even", [None, True, False])
+def test_parse_subject_cell_0(excel_formatter, is_even):
+    for cell in CELLS + get_schedule_cells():
+        try:
+            expected = (
+                excel_formatter.get_lessons(cell),
+                excel_formatter.get_weeks(cell, is_even, 17),
+            )
+        except ValueError:
+            with pytest.raises(ValueError):
+                excel_formatter.parse_subject_cell(cell, is_even, 17)
+            continue
+
+        assert excel_formatter.parse_subject_cell(cell, is_even, 17) == expected, cell
+
+
+def test_parse_subject_cell_1(excel_formatter):
+    assert excel_formatter.parse_subject_cell(
+        "2,6,10,14 н Экология\n4,8,12,16 Правоведение", is_even=True
+    ) == (
+        [("Экология", None, None), ("Правоведение", None, None)],
+        [[2, 6, 10, 14], [4, 8, 12, 16]],
+    )
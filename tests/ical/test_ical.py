@@ -0,0 +1,91 @@
+import datetime
+
+import pytest
+
+from rtu_schedule_parser import ExamsSchedule, Lesson, LessonsSchedule
+from rtu_schedule_parser.constants import Campus, Degree, Institute, LessonType
+from rtu_schedule_parser.ical import _get_recurrence
+from rtu_schedule_parser.schedule import Room
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+
+DTSTAMP = datetime.datetime(2022, 9, 1, tzinfo=datetime.timezone.utc)
+
+
+def _schedule(weeks):
+    return LessonsSchedule(
+        group="ИКБО-01-20",
+        period=Period(2022, 2023, 1),
+        institute=Institute.IIT,
+        degree=Degree.BACHELOR,
+        lessons=[
+            Lesson(
+                num=1,
+                name="Математический анализ; часть 1",
+                weeks=weeks,
+                weekday=Weekday.MONDAY,
+                teachers=["Иванов И.И."],
+                time_start=datetime.time(9, 0),
+                time_end=datetime.time(10, 30),
+                type=LessonType.LECTURE,
+                room=Room("А-101", Campus.V_78),
+            )
+        ],
+    )
+
+
+def test_get_recurrence():
+    assert _get_recurrence([5]) == (1, 1, [], [])
+    assert _get_recurrence([1, 3, 5, 7, 9]) == (2, 5, [], [])
+    assert _get_recurrence([2, 6, 10, 14]) == (4, 4, [], [])
+    assert _get_recurrence([3, 5, 9, 11, 13]) == (2, 6, [7], [])
+    assert _get_recurrence([1, 2, 7]) == (1, 1, [], [2, 7])
+
+
+def test_to_ics_0():
+    ics = _schedule([1, 3, 5, 7, 9, 11, 13, 15, 17]).to_ics(dtstamp=DTSTAMP)
+    lines = ics.split("\r\n")
+
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2] == "END:VCALENDAR"
+    assert lines.count("BEGIN:VEVENT") == 1
+    assert "DTSTAMP:20220901T000000Z" in lines
+    # The first week starts on Monday, 29 August 2022
+    assert "DTSTART;TZID=Europe/Moscow:20220829T090000" in lines
+    assert "DTEND;TZID=Europe/Moscow:20220829T103000" in lines
+    assert "RRULE:FREQ=WEEKLY;COUNT=9;INTERVAL=2" in lines
+    assert r"SUMMARY:Математический анализ\; часть 1 (лек)" in lines
+    assert "LOCATION:А-101 (В-78)" in lines
+
+
+def test_to_ics_1():
+    ics = _schedule([3, 5, 9]).to_ics(dtstamp=DTSTAMP)
+    lines = ics.split("\r\n")
+
+    assert "RRULE:FREQ=WEEKLY;COUNT=4;INTERVAL=2" in lines
+    assert "EXDATE;TZID=Europe/Moscow:20221010T090000" in lines
+
+
+def test_to_ics_2(excel_parser, tmp_path):
+    schedule_data = excel_parser.parse()
+    path = str(tmp_path / "schedule.ics")
+    schedule_data.to_ics("КРБО-01-19", path, DTSTAMP)
+
+    with open(path, "rb") as file:
+        content = file.read()
+
+    assert content.startswith(b"BEGIN:VCALENDAR\r\n")
+    assert all(len(line) <= 75 for line in content.split(b"\r\n"))
+    assert content.decode() == schedule_data.to_ics("КРБО-01-19", dtstamp=DTSTAMP)
+
+
+def test_to_ics_3():
+    schedule = ExamsSchedule(
+        group="ИКБО-01-20",
+        period=Period(2022, 2023, 1),
+        institute=Institute.IIT,
+        degree=Degree.BACHELOR,
+    )
+
+    with pytest.raises(NotImplementedError):
+        schedule.to_ics()
@@ -0,0 +1,67 @@
+from rtu_schedule_parser import Lesson
+from rtu_schedule_parser.excel_formatter import ExcelFormatter
+from rtu_schedule_parser.metrics import ParserMetrics
+
+
+def test_metrics_0(excel_parser):
+    with excel_parser.collect_metrics() as metrics:
+        schedule_data = excel_parser.parse()
+
+    lessons = sum(
+        type(lesson) is Lesson
+        for schedule in schedule_data.get_schedule()
+        for lesson in schedule.lessons
+    )
+
+    assert metrics.counters["groups"] == 22
+    assert metrics.counters["lessons"] == lessons
+    assert "errors" not in metrics.counters
+
+    for stage in ("open_workbook", "find_groups", "parse_rows", "parse_groups"):
+        assert metrics.timings[stage] > 0
+
+    assert metrics.calls["parse"] == 1
+    assert metrics.calls["parse_groups"] == 22
+    assert metrics.calls["formatter.parse_subject_cell"] > 0
+    assert metrics.timings["parse"] >= metrics.timings["parse_groups"]
+
+    # The formatter is not wrapped outside of the context
+    assert type(excel_parser._formatter) is ExcelFormatter
+    assert excel_parser._metrics is None
+
+
+def test_metrics_1(excel_parser):
+    metrics = ParserMetrics()
+
+    with excel_parser.collect_metrics(metrics):
+        excel_parser.parse()
+    with excel_parser.collect_metrics(metrics):
+        excel_parser.parse()
+
+    assert metrics.calls["parse"] == 2
+    assert metrics.counters["groups"] == 44
+
+    other = ParserMetrics()
+    other.merge(metrics)
+    other.merge(metrics)
+
+    assert other.counters["groups"] == 88
+    assert other.timings["parse"] == metrics.timings["parse"] * 2
+
+
+def test_metrics_2():
+    metrics = ParserMetrics()
+    metrics.add_time("parse", 1.5)
+    metrics.increment("groups", 3)
+
+    assert metrics.to_prometheus(prefix="test").splitlines() == [
+        "# HELP test_stage_seconds_total Time spent in the parsing stages.",
+        "# TYPE test_stage_seconds_total counter",
+        'test_stage_seconds_total{stage="parse"} 1.500000',
+        "# HELP test_stage_calls_total Number of calls of the parsing stages.",
+        "# TYPE test_stage_calls_total counter",
+        'test_stage_calls_total{stage="parse"} 1',
+        "# HELP test_items_total Number of the processed items.",
+        "# TYPE test_items_total counter",
+        'test_items_total{item="groups"} 3',
+    ]
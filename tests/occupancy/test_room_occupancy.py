@@ -0,0 +1,64 @@
+import pytest
+
+from rtu_schedule_parser import LessonEmpty
+from rtu_schedule_parser.constants import Campus, ScheduleType
+from rtu_schedule_parser.occupancy import RoomOccupancyIndex, weeks_to_mask
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+
+
+def _lessons(schedule_data):
+    for schedule in schedule_data.get_schedule():
+        for lesson in schedule.lessons:
+            if type(lesson) is not LessonEmpty and lesson.room is not None:
+                yield lesson
+
+
+def test_weeks_to_mask():
+    assert weeks_to_mask([]) == 0
+    assert weeks_to_mask([1, 3, 5]) == 0b101010
+
+
+def test_room_occupancy_0(schedule_data):
+    index = RoomOccupancyIndex(schedule_data)
+
+    for lesson in _lessons(schedule_data):
+        for week in lesson.weeks:
+            assert not index.is_free(lesson.room, lesson.weekday, lesson.num, week)
+            assert lesson.room in index.get_occupied_rooms(
+                lesson.weekday, lesson.num, week
+            )
+            assert lesson.room not in index.get_free_rooms(
+                lesson.weekday, lesson.num, week, campus=lesson.room.campus
+            )
+
+
+def test_room_occupancy_1(schedule_data):
+    index = RoomOccupancyIndex(schedule_data)
+
+    rooms = index.get_rooms(campus=Campus.V_78)
+    assert len(rooms) > 0
+    assert all(room.campus == Campus.V_78 for room in rooms)
+
+    free = index.get_free_rooms(Weekday.MONDAY, 1, 3, campus=Campus.V_78)
+    occupied = index.get_occupied_rooms(Weekday.MONDAY, 1, 3, campus=Campus.V_78)
+    assert set(free) | set(occupied) == set(rooms)
+    assert not set(free) & set(occupied)
+
+
+def test_room_occupancy_2(schedule_data):
+    index = RoomOccupancyIndex(schedule_data)
+
+    heatmap = index.get_heatmap(week=3)
+    assert heatmap[(Weekday.MONDAY, 1)] == len(
+        index.get_occupied_rooms(Weekday.MONDAY, 1, 3)
+    )
+
+    room = next(_lessons(schedule_data)).room
+    utilization = index.get_utilization(room)
+    assert 0 < utilization <= 1
+
+
+def test_room_occupancy_3(schedule_data):
+    schedule_data._schedule_type = ScheduleType.EXAM_SESSION
+    with pytest.raises(TypeError):
+        RoomOccupancyIndex(schedule_data)
@@ -0,0 +1,77 @@
+from openpyxl import Workbook
+
+from rtu_schedule_parser.constants import Degree, ExamType, Institute
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+from rtu_schedule_parser.schedule import Exam, ExamEmpty
+from rtu_schedule_parser.utils import Period
+
+
+def _parse(path: str, rows: list[list]) -> list[Exam | ExamEmpty]:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["Расписание экзаменационной сессии"])
+    worksheet.append(["месяц", "число", "ИКБО-01-22", "время", "№ ауд", "Ссылка"])
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
+
+    schedule_data = ExcelExamScheduleParser(
+        path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+    ).parse()
+
+    return schedule_data.get_schedule()[0].exams
+
+
+def test_exams_0(tmp_path):
+    exams = _parse(
+        str(tmp_path / "exams.xlsx"),
+        [
+            # Consultation and exam of the same day: only the first one is used
+            ["январь", "1", "Консультация", "10-40", "А-101"],
+            [None, None, "Математический анализ"],
+            [None, None, "Иванов И.И."],
+            [None, None, "Экзамен", "12-40", "А-102"],
+            [None, None, "Физика"],
+            [None, None, "Петров П.П."],
+            # Empty day
+            [None, "2"],
+            [None, None],
+            [None, None],
+            # Exam without the start time is skipped, so the next row makes the day empty
+            [None, "3", "Экзамен"],
+            [None, None, "Физика"],
+            [None, None, "Петров П.П."],
+            [None, "4", " экзамен ", "9-00", "А-103"],
+            [None, None, " Физика "],
+            [None, None, "Петров П.П."],
+        ],
+    )
+
+    assert [(type(exam), exam.day) for exam in exams] == [
+        (Exam, 1),
+        (ExamEmpty, 2),
+        (ExamEmpty, 3),
+        (Exam, 4),
+    ]
+    assert exams[0].exam_type == ExamType.CONSULTATION
+    assert exams[0].name == "Математический анализ"
+    assert exams[0].teachers == ["Иванов И.И."]
+    assert exams[3].exam_type == ExamType.EXAMINATION
+    assert exams[3].name == "Физика"
+    assert exams[3].time_start.hour == 9
+
+
+def test_exams_1(tmp_path):
+    exams = _parse(
+        str(tmp_path / "exams.xlsx"),
+        [
+            ["январь", "1", "Экзамен", "10-40", "А-101"],
+            [None, None, "Физика"],
+            [None, None, "Петров П.П."],
+            # The exam is cut off by the end of the table
+            [None, "2", "Экзамен", "10-40", "А-101"],
+            [None, None, "Физика"],
+        ],
+    )
+
+    assert [(type(exam), exam.day) for exam in exams] == [(Exam, 1)]
@@ -0,0 +1,83 @@
+import datetime
+
+from openpyxl import load_workbook
+
+from rtu_schedule_parser import ExcelScheduleParser
+from rtu_schedule_parser.constants import RE_GROUP_NAME, Degree, Institute
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.workbook_generator import (
+    generate_exam_workbook,
+    generate_semester_workbook,
+    get_group_name,
+)
+from tests import conftest
+
+
+def test_group_row_0(tmp_path):
+    path = str(tmp_path / "semester.xlsx")
+    generate_semester_workbook(path, groups=6, groups_per_sheet=3)
+
+    workbook = load_workbook(path)
+    for worksheet in workbook.worksheets:
+        # Non-string values in the header
+        worksheet["A1"] = 2022
+        worksheet["B1"] = datetime.datetime(2022, 9, 1)
+        worksheet["C1"] = 1.5
+
+    workbook.create_sheet("Пустой лист")
+    workbook.create_sheet("Примечания")["A1"] = "Расписание ИКБО-01-20 изменено"
+    workbook.save(path)
+
+    schedule_data = ExcelScheduleParser(
+        path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+    ).parse()
+
+    assert schedule_data.get_groups() == [get_group_name(i) for i in range(6)]
+
+
+def _scan_group_columns(group_row_index, worksheet):
+    """Previous implementation: group names are searched in all rows starting from the group row."""
+    group_columns = []
+
+    for row in worksheet.iter_rows(group_row_index):
+        for cell in row:
+            if cell and cell.value:
+                cell_value = str(cell.value).replace(" ", "")
+                if group_name := RE_GROUP_NAME.search(cell_value):
+                    if group_name.group(1) not in [group[0] for group in group_columns]:
+                        group_columns.append((group_name.group(1), cell.column))
+
+    return group_columns
+
+
+def test_group_row_1(tmp_path):
+    semester_path = str(tmp_path / "semester.xlsx")
+    generate_semester_workbook(semester_path, groups=6, groups_per_sheet=3)
+    exam_path = str(tmp_path / "exams.xlsx")
+    generate_exam_workbook(exam_path, groups=6, groups_per_sheet=3)
+
+    parsers = [
+        ExcelScheduleParser(
+            conftest.test_schedule_file_path(),
+            Period(2022, 2023, 1),
+            Institute.III,
+            Degree.BACHELOR,
+        ),
+        ExcelScheduleParser(
+            semester_path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+        ),
+        ExcelExamScheduleParser(
+            exam_path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+        ),
+    ]
+
+    # Only the group row is read now, the group columns are the same as with the scan of all rows
+    for parser in parsers:
+        parser._open_worksheets()
+        for worksheet in parser._worksheets:
+            group_row = parser._find_group_row(worksheet)
+            if group_row is not None:
+                assert parser._get_group_columns(
+                    group_row, worksheet
+                ) == _scan_group_columns(group_row, worksheet)
@@ -0,0 +1,144 @@
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from rtu_schedule_parser import ExcelScheduleParser
+from rtu_schedule_parser.constants import Degree, Institute
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+from rtu_schedule_parser.schedule import Exam, ExamEmpty
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import Weekday
+from rtu_schedule_parser.utils.workbook_generator import (
+    generate_exam_workbook,
+    generate_semester_workbook,
+)
+
+
+def test_table_end_0(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+    # 3 rows for each of 40 days, longer than the old limit of 100 rows
+    generate_exam_workbook(path, groups=3, exams=20, days=40)
+
+    schedule_data = ExcelExamScheduleParser(
+        path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+    ).parse()
+
+    for schedule in schedule_data.get_schedule():
+        assert len(schedule.exams) == 40
+        assert [exam.day for exam in schedule.exams] == list(range(1, 41))
+        assert sum(type(exam) is Exam for exam in schedule.exams) == 40
+
+
+def test_table_end_1(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+    generate_exam_workbook(path, groups=3, exams=2, days=5)
+
+    # Notes under the table do not change the last day
+    workbook = load_workbook(path)
+    worksheet = workbook.worksheets[0]
+    worksheet.append([None, None, "Примечание"])
+    worksheet.append([None, None, "Экзамен"])
+    workbook.save(path)
+
+    parser = ExcelExamScheduleParser(
+        path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+    )
+
+    assert [len(item.exams) for item in parser.parse().get_schedule()] == [5] * 3
+    assert (
+        parser.parse().get_schedule()[0].get_grid()
+        == ExcelExamScheduleParser(
+            path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR, max_rows=15
+        )
+        .parse()
+        .get_schedule()[0]
+        .get_grid()
+    )
+
+
+def test_table_end_2(tmp_path):
+    path = str(tmp_path / "semester.xlsx")
+    generate_semester_workbook(path, groups=2)
+
+    schedule_data = ExcelScheduleParser(
+        path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR, max_rows=14
+    ).parse()
+
+    for schedule in schedule_data.get_schedule():
+        # Two rows for each of 7 lessons of Monday
+        assert {(lesson.weekday, lesson.num) for lesson in schedule.lessons} == {
+            (Weekday.MONDAY, num) for num in range(1, 8)
+        }
+
+
+def test_table_end_3(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["Расписание экзаменационной сессии"])
+    worksheet.append(["месяц", "число", "ИКБО-01-22", "время", "№ ауд", "Ссылка"])
+    # Two rows for each of the first days
+    worksheet.append(["январь", "1"])
+    worksheet.append([])
+    worksheet.append([None, "2"])
+    worksheet.append([])
+    # The last day is taller than the others
+    worksheet.append([None, "3", "Экзамен", "9-00", "А-101"])
+    worksheet.append([None, None, "Физика"])
+    worksheet.append([None, None, "Петров П.П."])
+    # Styled empty rows under the table
+    for row in range(10, 100):
+        worksheet.cell(row, 1).font = Font(bold=True)
+    workbook.save(path)
+
+    parser = ExcelExamScheduleParser(
+        path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+    )
+    exams = parser.parse().get_schedule()[0].exams
+
+    assert [(type(exam), exam.day) for exam in exams] == [
+        (ExamEmpty, 1),
+        (ExamEmpty, 2),
+        (Exam, 3),
+    ]
+    assert exams[2].name == "Физика"
+    assert exams[2].teachers == ["Петров П.П."]
+
+    with parser.collect_metrics() as metrics:
+        parser.parse()
+
+    # The styled empty rows are not a part of the table
+    assert metrics.counters["rows"] == 7
+
+
+def test_table_end_4(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["Расписание экзаменационной сессии"])
+    worksheet.append(["месяц", "число", "ИКБО-01-22", "время", "№ ауд", "Ссылка"])
+    # The first day of the session has no exams
+    worksheet.append(["январь", "9"])
+    worksheet.append([])
+    worksheet.append([])
+    for day in ("10", "11"):
+        worksheet.append([None, day, "Экзамен", "9-00", "А-101"])
+        worksheet.append([None, None, "Физика"])
+        worksheet.append([None, None, "Петров П.П."])
+    workbook.save(path)
+
+    exams = (
+        ExcelExamScheduleParser(
+            path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+        )
+        .parse()
+        .get_schedule()[0]
+        .exams
+    )
+
+    assert [(type(exam), exam.day) for exam in exams] == [
+        (ExamEmpty, 9),
+        (Exam, 10),
+        (Exam, 11),
+    ]
@@ -0,0 +1,66 @@
+import dataclasses
+
+import pytest
+
+from rtu_schedule_parser.constants import Campus, RoomType
+from rtu_schedule_parser.excel_formatter import ExcelFormatter
+from rtu_schedule_parser.rooms import RoomRegistry
+from rtu_schedule_parser.schedule import Room
+
+
+def test_rooms_0():
+    registry = RoomRegistry()
+
+    room = registry.get(Room("А-101", Campus.V_78, RoomType.AUDITORY))
+
+    assert registry.get(Room("А-101", Campus.V_78, RoomType.AUDITORY)) is room
+    assert registry.get(Room("А-101", Campus.V_78)) is not room
+    # The campus is not set without the default campus
+    assert registry.get(Room("А-101")).campus is None
+    assert len(registry) == 3
+
+
+def test_rooms_1():
+    registry = RoomRegistry(default_campus=Campus.V_78)
+
+    room = registry.get(Room("А-101"))
+
+    assert room == Room("А-101", Campus.V_78)
+    assert registry.get(Room("А-101", Campus.V_78)) is room
+    assert registry.get(Room("А-101")) is room
+    assert registry.get(Room("А-101", Campus.S_20)).campus == Campus.S_20
+    assert registry.get_rooms() == [room, Room("А-101", Campus.S_20)]
+
+
+def test_rooms_2():
+    calls = []
+
+    class CountingFormatter(ExcelFormatter):
+        def get_rooms(self, rooms_cell_value):
+            calls.append(rooms_cell_value)
+            return super().get_rooms(rooms_cell_value)
+
+    registry = RoomRegistry(default_campus=Campus.V_78)
+    formatter = CountingFormatter()
+
+    first = registry.get_cell_rooms("А-101\nБ-202", formatter)
+    first.clear()
+    second = registry.get_cell_rooms("А-101\nБ-202", formatter)
+
+    assert calls == ["А-101\nБ-202"]
+    assert second == [Room("А-101", Campus.V_78), Room("Б-202", Campus.V_78)]
+    assert registry.get_cell_rooms("А-101", formatter)[0] is second[0]
+
+
+def test_rooms_3():
+    registry = RoomRegistry()
+    room = registry.get(Room("А-101", Campus.V_78))
+
+    # Shared rooms cannot be changed in place
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        room.name = "Б-202"
+
+    other = dataclasses.replace(room, name="Б-202")
+    assert registry.get(Room("А-101", Campus.V_78)) is room
+    assert registry.get(other) == other
+    assert registry.get(other) is not room
@@ -0,0 +1,143 @@
+import datetime
+
+import pytest
+
+from rtu_schedule_parser import (
+    Exam,
+    ExamEmpty,
+    ExamsSchedule,
+    LessonEmpty,
+    ScheduleData,
+)
+from rtu_schedule_parser.constants import (
+    Campus,
+    Degree,
+    ExamType,
+    Institute,
+    RoomType,
+    ScheduleType,
+)
+from rtu_schedule_parser.schedule import Room
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import Month
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_to_arrow_0(excel_parser):
+    schedule_data = excel_parser.parse()
+    table = schedule_data.to_arrow()
+
+    lessons_count = sum(
+        type(lesson) is not LessonEmpty
+        for schedule in schedule_data.get_schedule()
+        for lesson in schedule.lessons
+    )
+    assert table.num_rows == lessons_count
+    assert pa.types.is_dictionary(table.schema.field("group").type)
+    assert pa.types.is_dictionary(table.schema.field("name").type)
+    assert table.schema.field("weeks").type == pa.list_(pa.int8())
+    assert set(table.column("group").to_pylist()) == set(schedule_data.get_groups())
+
+
+def test_parquet_roundtrip_0(excel_parser, tmp_path):
+    schedule_data = excel_parser.parse()
+    path = str(tmp_path / "schedule.parquet")
+    schedule_data.to_parquet(path)
+
+    restored = ScheduleData.from_parquet(path)
+    assert restored.schedule_type == ScheduleType.SEMESTER
+    assert restored.get_groups() == [
+        schedule.group
+        for schedule in schedule_data.get_schedule()
+        if any(type(lesson) is not LessonEmpty for lesson in schedule.lessons)
+    ]
+
+    original = schedule_data.get_group_schedule("КРБО-01-19")
+    restored_schedule = restored.get_group_schedule("КРБО-01-19")
+    assert restored_schedule.period == original.period
+    assert restored_schedule.institute == original.institute
+    assert restored_schedule.lessons == [
+        lesson for lesson in original.lessons if type(lesson) is not LessonEmpty
+    ]
+
+
+def test_parquet_roundtrip_1(tmp_path):
+    exams = [
+        Exam(
+            month=Month.JANUARY,
+            day=10,
+            name="Математический анализ",
+            time_start=datetime.time(9, 0),
+            teachers=["Иванов И.И."],
+            rooms=[Room("А-101", Campus.V_78, RoomType.AUDITORY), Room("Б-1")],
+            exam_type=ExamType.EXAMINATION,
+        ),
+        ExamEmpty(month=Month.JANUARY, day=11),
+    ]
+    schedule_data = ScheduleData(
+        [
+            ExamsSchedule(
+                group="ИКБО-01-20",
+                period=Period(2022, 2023, 1),
+                institute=Institute.IIT,
+                degree=Degree.BACHELOR,
+                exams=exams,
+            )
+        ],
+        schedule_type=ScheduleType.EXAM_SESSION,
+    )
+    path = str(tmp_path / "exams.parquet")
+    schedule_data.to_parquet(path)
+
+    restored = ScheduleData.from_parquet(path)
+    assert restored.schedule_type == ScheduleType.EXAM_SESSION
+    assert restored.get_group_schedule("ИКБО-01-20").exams == exams[:1]
+
+
+def test_parquet_roundtrip_2(tmp_path):
+    exams = [
+        Exam(
+            month=Month.JANUARY,
+            day=10,
+            name="Иностранный язык",
+            time_start=datetime.time(9, 0),
+            teachers=[("Иванова И.С.", 1), ("Петрова П.П.", None)],
+            rooms=[Room("А-101")],
+            exam_type=ExamType.EXAMINATION,
+        ),
+        Exam(
+            month=Month.JANUARY,
+            day=12,
+            name="Физика",
+            time_start=datetime.time(10, 40),
+            teachers=["Иванов И.И."],
+            rooms=[],
+            exam_type=ExamType.EXAMINATION,
+        ),
+    ]
+    schedule_data = ScheduleData(
+        [
+            ExamsSchedule(
+                group="ИКБО-01-20",
+                period=Period(2022, 2023, 1),
+                institute=Institute.IIT,
+                degree=Degree.BACHELOR,
+                exams=exams,
+            )
+        ],
+        schedule_type=ScheduleType.EXAM_SESSION,
+    )
+
+    table = schedule_data.to_arrow()
+    assert table.column("teachers").to_pylist() == [
+        ["Иванова И.С.", "Петрова П.П."],
+        ["Иванов И.И."],
+    ]
+    assert table.column("teacher_subgroups").to_pylist() == [[1, None], None]
+
+    path = str(tmp_path / "exams.parquet")
+    schedule_data.to_parquet(path)
+
+    restored = ScheduleData.from_parquet(path)
+    assert restored.get_group_schedule("ИКБО-01-20").exams == exams
@@ -1,6 +1,24 @@
 import contextlib
+import datetime
 
-from rtu_schedule_parser.constants import Campus
+import pytest
+
+from rtu_schedule_parser import ExamEmpty, ExamsSchedule, LessonEmpty, ScheduleData
+from rtu_schedule_parser.constants import (
+    Campus,
+    Degree,
+    ExamType,
+    Institute,
+    ScheduleType,
+)
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+from rtu_schedule_parser.schedule import Exam
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import Month
+from rtu_schedule_parser.utils.workbook_generator import (
+    ContentMix,
+    generate_exam_workbook,
+)
 
 
 def test_schedule_data_0(excel_parser):
@@ -42,3 +60,203 @@ def test_schedule_data_0(excel_parser):
     assert len(campuses) > 2
     assert Campus.V_78 in campuses
     assert Campus.SG_22 in campuses
+
+
+def test_schedule_data_1(excel_parser):
+    schedule_data = excel_parser.parse(generate_dataframe=True)
+    groups = schedule_data.get_groups()
+
+    new_data = excel_parser.parse()
+    new_schedule = new_data.get_group_schedule(groups[0])
+    new_schedule.lessons = [
+        lesson for lesson in new_schedule.lessons if type(lesson) is not LessonEmpty
+    ][:1]
+
+    other_schedule = new_data.get_group_schedule(groups[1])
+    other_schedule.group = "КРБО-01-22"
+
+    schedule_data.update([new_schedule, other_schedule])
+
+    assert schedule_data.get_groups() == groups + ["КРБО-01-22"]
+    assert schedule_data.get_group_schedule(groups[0]) is new_schedule
+    assert set(schedule_data.get_dataframe()["group"]) == set(groups + ["КРБО-01-22"])
+
+    schedule_data.remove([groups[0], "КРБО-01-22", "unknown"])
+
+    assert schedule_data.get_groups() == groups[1:]
+    assert groups[0] not in set(schedule_data.get_dataframe()["group"])
+
+
+def test_schedule_data_2(excel_parser):
+    schedule_data = excel_parser.parse()
+
+    teachers = schedule_data.get_teachers()
+    registry = schedule_data.get_teacher_registry()
+
+    names = {
+        name
+        for schedule in schedule_data.get_schedule()
+        for lesson in schedule.lessons
+        if type(lesson) is not LessonEmpty
+        for name in lesson.teachers
+        if name
+    }
+
+    assert len(teachers) == len({teacher.id for teacher in teachers})
+    assert {teacher.name for teacher in teachers} <= names
+    assert all(registry.get(name) in teachers for name in names)
+
+
+def test_schedule_data_3(excel_parser):
+    schedule_data = excel_parser.parse()
+
+    rooms = schedule_data.get_rooms()
+    lessons_rooms = [
+        lesson.room
+        for schedule in schedule_data.get_schedule()
+        for lesson in schedule.lessons
+        if type(lesson) is not LessonEmpty and lesson.room is not None
+    ]
+
+    assert len(rooms) == len(set(rooms)) == len(set(lessons_rooms))
+    # Lessons of the same room share one instance of the room
+    assert len({id(room) for room in lessons_rooms}) == len(rooms)
+
+
+def test_schedule_data_4(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+    generate_exam_workbook(path, groups=5, mix=ContentMix(multiple_rooms=1.0))
+
+    schedule_data = ExcelExamScheduleParser(
+        path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+    ).parse()
+
+    rooms = schedule_data.get_rooms()
+    exams_rooms = {
+        room
+        for schedule in schedule_data.get_schedule()
+        for exam in schedule.exams
+        if type(exam) is not ExamEmpty
+        for room in exam.rooms
+    }
+
+    assert len(rooms) == len(set(rooms))
+    assert set(rooms) == exams_rooms
+
+
+def test_schedule_data_5(excel_parser):
+    schedule_data = excel_parser.parse()
+    lessons = {
+        schedule.group: [
+            (lesson.num, lesson.name, lesson.weeks, lesson.teachers, lesson.room)
+            for lesson in schedule.lessons
+            if type(lesson) is not LessonEmpty
+        ]
+        for schedule in schedule_data.get_schedule()
+    }
+    unique_lessons = schedule_data.get_unique_lessons()
+
+    deduplicated = excel_parser.parse(deduplicate_lessons=True)
+
+    # Schedules of the groups contain the same lessons
+    assert {
+        schedule.group: [
+            (lesson.num, lesson.name, lesson.weeks, lesson.teachers, lesson.room)
+            for lesson in schedule.lessons
+            if type(lesson) is not LessonEmpty
+        ]
+        for schedule in deduplicated.get_schedule()
+    } == lessons
+
+    shared = {
+        id(lesson): lesson
+        for schedule in deduplicated.get_schedule()
+        for lesson in schedule.lessons
+        if type(lesson) is not LessonEmpty
+    }
+
+    assert len(shared) == len(unique_lessons) < sum(map(len, lessons.values()))
+    assert deduplicated.deduplicate_lessons() == 0
+    # Stream lectures are shared by several groups
+    assert any(len(groups) > 1 for _, groups in unique_lessons)
+
+
+def test_schedule_data_6(excel_parser):
+    schedule_data = excel_parser.parse()
+    skipped = excel_parser.parse(skip_empty=True)
+
+    for schedule, skipped_schedule in zip(
+        schedule_data.get_schedule(), skipped.get_schedule()
+    ):
+        assert all(
+            type(lesson) is not LessonEmpty for lesson in skipped_schedule.lessons
+        )
+        assert skipped_schedule.get_grid() == schedule.get_grid() == schedule.lessons
+
+    assert skipped.get_rooms() == schedule_data.get_rooms()
+
+    # Empty lessons of the same row are shared by all groups
+    first, second = schedule_data.get_schedule()[:2]
+    assert type(first.lessons[-1]) is type(second.lessons[-1]) is LessonEmpty
+    assert first.lessons[-1] is second.lessons[-1]
+
+    skipped_schedule = skipped.get_schedule()[0]
+    skipped_schedule.lessons.pop()
+    with pytest.raises(ValueError):
+        skipped_schedule.get_grid()
+
+
+def test_schedule_data_7(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+    generate_exam_workbook(path, groups=5, exams=3)
+
+    parser = ExcelExamScheduleParser(
+        path, Period(2022, 2023, 1), Institute.IIT, Degree.BACHELOR
+    )
+    schedule_data = parser.parse()
+    skipped = parser.parse(skip_empty=True)
+
+    for schedule, skipped_schedule in zip(
+        schedule_data.get_schedule(), skipped.get_schedule()
+    ):
+        assert [type(exam) for exam in skipped_schedule.exams] == [Exam] * 6
+        assert skipped_schedule.get_grid() == schedule.exams
+
+
+def test_schedule_data_8():
+    schedule_data = ScheduleData(
+        [
+            ExamsSchedule(
+                group="ИКБО-01-20",
+                period=Period(2022, 2023, 1),
+                institute=Institute.IIT,
+                degree=Degree.BACHELOR,
+                exams=[
+                    Exam(
+                        month=Month.JANUARY,
+                        day=10,
+                        name="Иностранный язык",
+                        time_start=datetime.time(9, 0),
+                        teachers=[("Иванова И.С.", 1), ("Петрова П.П.", None)],
+                        rooms=[],
+                        exam_type=ExamType.EXAMINATION,
+                    ),
+                    Exam(
+                        month=Month.JANUARY,
+                        day=12,
+                        name="Иностранный язык",
+                        time_start=datetime.time(9, 0),
+                        teachers=["Иванова И. С."],
+                        rooms=[],
+                        exam_type=ExamType.EXAMINATION,
+                    ),
+                ],
+            )
+        ],
+        schedule_type=ScheduleType.EXAM_SESSION,
+    )
+
+    assert [teacher.name for teacher in schedule_data.get_teachers()] == [
+        "Иванова И.С.",
+        "Петрова П.П.",
+    ]
@@ -0,0 +1,70 @@
+import dataclasses
+import json
+
+import pytest
+
+from rtu_schedule_parser import LessonEmpty
+from rtu_schedule_parser.serialization import lesson_to_dict
+
+
+def test_serialization_0(schedule_data):
+    schedule = schedule_data.get_group_schedule("КРБО-01-19")
+    data = json.loads(schedule_data.get_group_json("КРБО-01-19"))
+
+    lessons = [lesson for lesson in schedule.lessons if type(lesson) is not LessonEmpty]
+
+    assert data["group"] == "КРБО-01-19"
+    assert data["institute"] == "ИИИ"
+    assert len(data["lessons"]) == len(lessons)
+
+    for lesson, lesson_data in zip(lessons, data["lessons"]):
+        expected = dataclasses.asdict(lesson)
+        assert lesson_data["name"] == expected["name"]
+        assert lesson_data["weeks"] == expected["weeks"]
+        assert lesson_data["weekday"] == lesson.weekday.value[0]
+        assert lesson_data["time_start"] == lesson.time_start.strftime("%H:%M")
+        assert lesson_data["type"] == (lesson.type.value if lesson.type else None)
+        if lesson.room is not None:
+            assert lesson_data["room"]["name"] == lesson.room.name
+
+
+def test_serialization_1(schedule_data):
+    msgpack = pytest.importorskip("msgpack")
+
+    data = msgpack.unpackb(schedule_data.get_group_msgpack("КРБО-01-19"))
+
+    assert data == json.loads(schedule_data.get_group_json("КРБО-01-19"))
+
+
+def test_serialization_2(schedule_data):
+    first = schedule_data.get_group_json("КРБО-01-19")
+    assert schedule_data.get_group_json("КРБО-01-19") is first
+
+    schedule = schedule_data.get_group_schedule("КРБО-01-19")
+    schedule.lessons = [
+        lesson for lesson in schedule.lessons if type(lesson) is LessonEmpty
+    ]
+
+    # The cache is invalidated only when the schedule data is changed
+    assert schedule_data.get_group_json("КРБО-01-19") is first
+    schedule_data.extend([])
+    assert json.loads(schedule_data.get_group_json("КРБО-01-19"))["lessons"] == []
+
+    with pytest.raises(ValueError):
+        schedule_data.get_group_json("unknown")
+
+
+def test_serialization_3(schedule_data):
+    lessons = [
+        lesson
+        for schedule in schedule_data.get_schedule()
+        for lesson in schedule.lessons
+        if type(lesson) is not LessonEmpty and lesson.room is not None
+    ]
+
+    # Equal rooms are encoded once
+    first, *other = [lesson for lesson in lessons if lesson.room == lessons[0].room]
+    assert all(
+        lesson_to_dict(lesson)["room"] is lesson_to_dict(first)["room"]
+        for lesson in other
+    )
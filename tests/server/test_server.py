@@ -0,0 +1,176 @@
+import asyncio
+import datetime
+import json
+
+import pytest
+
+from rtu_schedule_parser import ExamsSchedule, ScheduleData
+from rtu_schedule_parser.constants import Degree, ExamType, Institute, ScheduleType
+from rtu_schedule_parser.schedule import Exam
+from rtu_schedule_parser.server import ScheduleServer
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import Month
+
+
+def _request(server, path, method="GET", headers=None, query_string=b""):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": headers or [],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(server(scope, receive, send))
+
+    start, body = messages
+    return start["status"], dict(start["headers"]), body["body"]
+
+
+@pytest.fixture()
+def server(schedule_data):
+    return ScheduleServer(schedule_data)
+
+
+def test_server_0(server, schedule_data):
+    status, headers, body = _request(server, "/groups")
+
+    assert status == 200
+    assert headers[b"content-type"] == b"application/json; charset=utf-8"
+    assert headers[b"etag"] == server.snapshot.etag.encode()
+    assert json.loads(body)["groups"] == sorted(schedule_data.get_groups())
+
+
+def test_server_1(server):
+    status, _, body = _request(server, "/groups/КРБО-01-19")
+    data = json.loads(body)
+
+    assert status == 200
+    assert data["group"] == "КРБО-01-19"
+    assert data["period"] == {"year_start": 2022, "year_end": 2023, "semester": 1}
+    assert data["lessons"]
+    assert all(lesson["name"] for lesson in data["lessons"])
+
+
+def test_server_2(server):
+    _, _, body = _request(server, "/teachers")
+    teacher = json.loads(body)["teachers"][0]
+
+    status, _, body = _request(server, f"/teachers/{teacher}")
+    data = json.loads(body)
+
+    assert status == 200
+    assert data["teacher"] == teacher
+    assert all(teacher in lesson["teachers"] for lesson in data["lessons"])
+
+    _, _, body = _request(server, "/rooms")
+    room = json.loads(body)["rooms"][0]
+
+    status, _, body = _request(server, f"/rooms/{room}")
+    assert status == 200
+    assert all(lesson["room"]["name"] == room for lesson in json.loads(body)["lessons"])
+
+
+def test_server_3(server):
+    status, _, body = _request(
+        server, "/dates/2022-09-06", query_string="group=КРБО-01-19".encode()
+    )
+    data = json.loads(body)
+
+    assert status == 200
+    assert data["events"]
+    assert all(event["start"].startswith("2022-09-06") for event in data["events"])
+    assert all(event["group"] == "КРБО-01-19" for event in data["events"])
+
+    assert _request(server, "/dates/05.09.2022")[0] == 400
+    assert _request(server, "/dates/2022-09-06", query_string=b"group=x")[0] == 404
+
+
+def test_server_4(server):
+    etag = server.snapshot.etag.encode()
+
+    status, headers, body = _request(
+        server, "/groups", headers=[(b"if-none-match", etag)]
+    )
+    assert status == 304
+    assert headers[b"etag"] == etag
+    assert body == b""
+
+    status, _, _ = _request(server, "/groups", headers=[(b"if-none-match", b'"1"')])
+    assert status == 200
+
+    # The route is resolved before the ETag is compared
+    headers = [(b"if-none-match", etag)]
+    assert _request(server, "/groups/unknown", headers=headers)[0] == 404
+    assert _request(server, "/dates/05.09.2022", headers=headers)[0] == 400
+
+
+def test_server_5(server):
+    assert _request(server, "/groups/unknown")[0] == 404
+    assert _request(server, "/unknown")[0] == 404
+    assert _request(server, "/groups", method="POST")[0] == 405
+
+    status, headers, body = _request(server, "/groups", method="HEAD")
+    assert status == 200
+    assert int(headers[b"content-length"]) > 0
+    assert body == b""
+
+    assert _request(ScheduleServer(), "/groups")[0] == 503
+
+
+def test_server_6(schedule_data):
+    server = ScheduleServer()
+    assert server.update(schedule_data)
+
+    snapshot = server.snapshot
+    assert not server.update(schedule_data)
+    assert server.snapshot is snapshot
+
+    schedule = schedule_data.get_schedule()[0]
+    other_data = type(schedule_data)([schedule])
+    assert asyncio.run(server.update_async(other_data))
+    assert server.snapshot.etag != snapshot.etag
+    assert json.loads(_request(server, "/groups")[2])["groups"] == [schedule.group]
+
+
+def test_server_7():
+    exam = Exam(
+        month=Month.JANUARY,
+        day=10,
+        name="Иностранный язык",
+        time_start=datetime.time(9, 0),
+        teachers=[("Иванова И.С.", 1), ("Петрова П.П.", None)],
+        rooms=[],
+        exam_type=ExamType.EXAMINATION,
+    )
+    schedule_data = ScheduleData(
+        [
+            ExamsSchedule(
+                group="ИКБО-01-20",
+                period=Period(2022, 2023, 1),
+                institute=Institute.IIT,
+                degree=Degree.BACHELOR,
+                exams=[exam],
+            )
+        ],
+        schedule_type=ScheduleType.EXAM_SESSION,
+    )
+    server = ScheduleServer(schedule_data)
+
+    status, _, body = _request(server, "/teachers")
+    assert status == 200
+    assert json.loads(body)["teachers"] == ["Иванова И.С.", "Петрова П.П."]
+
+    status, _, body = _request(server, "/teachers/Иванова И.С.")
+    data = json.loads(body)
+
+    assert status == 200
+    assert [exam["name"] for exam in data["exams"]] == ["Иностранный язык"]
+    assert data["lessons"] == []
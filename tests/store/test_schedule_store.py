@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+
+from rtu_schedule_parser import LessonEmpty
+from rtu_schedule_parser.constants import Campus, ScheduleType
+from rtu_schedule_parser.store import ScheduleStore
+from rtu_schedule_parser.utils import academic_calendar
+
+
+@pytest.fixture()
+def store(schedule_data):
+    with ScheduleStore() as store:
+        store.load(schedule_data)
+        yield store
+
+
+def test_schedule_store_0(store, schedule_data):
+    assert store.get_groups() == sorted(schedule_data.get_groups())
+
+    original = [
+        lesson
+        for lesson in schedule_data.get_group_schedule("КРБО-01-19").lessons
+        if type(lesson) is not LessonEmpty
+    ]
+    lessons = store.get_group_lessons("КРБО-01-19")
+    assert len(lessons) == len(original)
+    key = lambda lesson: (lesson.weekday.value[0], lesson.num, lesson.name)  # noqa
+    for restored, lesson in zip(sorted(lessons, key=key), sorted(original, key=key)):
+        assert restored.name == lesson.name
+        assert restored.weeks == sorted(set(lesson.weeks))
+        assert restored.teachers == lesson.teachers
+        assert restored.room == lesson.room
+        assert restored.type == lesson.type
+
+
+def test_schedule_store_1(store):
+    lessons = store.get_teacher_lessons("Шатина А.В.")
+    assert len(lessons) > 0
+    assert all("Шатина А.В." in lesson.teachers for _, lesson in lessons)
+
+    lessons = store.get_room_lessons("А-216", Campus.V_78)
+    assert len(lessons) > 0
+    assert all(lesson.room.name == "А-216" for _, lesson in lessons)
+
+
+def test_schedule_store_2(store):
+    date = datetime.date(2022, 9, 12)  # Monday, week 3
+    lessons = store.get_lessons_by_date(date, "КМБО-03-19")
+    assert len(lessons) > 0
+    week = academic_calendar.get_week(date)
+    for group, lesson in lessons:
+        assert group == "КМБО-03-19"
+        assert lesson.weekday == academic_calendar.Weekday.MONDAY
+        assert week in lesson.weeks
+
+
+def test_schedule_store_3(store):
+    at = datetime.datetime(2022, 9, 12, 11, 0)
+    busy = {
+        lesson.room
+        for _, lesson in store.get_lessons_by_date(at.date())
+        if lesson.room is not None and lesson.time_start <= at.time() < lesson.time_end
+    }
+    assert len(busy) > 0
+
+    free = store.get_free_rooms(at, Campus.V_78)
+    assert len(free) > 0
+    assert all(room.campus == Campus.V_78 for room in free)
+    assert not busy.intersection(free)
+
+
+def test_schedule_store_4(store, schedule_data):
+    # Loading the same groups again replaces them
+    store.load(schedule_data)
+    assert store.get_groups() == sorted(schedule_data.get_groups())
+    assert len(store.get_teachers()) == len(set(store.get_teachers()))
+
+
+def test_schedule_store_5(schedule_data):
+    schedule_data._schedule_type = ScheduleType.EXAM_SESSION
+    with ScheduleStore() as store:
+        with pytest.raises(TypeError):
+            store.load(schedule_data)
@@ -0,0 +1,58 @@
+import pytest
+
+from rtu_schedule_parser.teachers import (
+    Teacher,
+    TeacherRegistry,
+    get_teacher_id,
+    get_teacher_key,
+)
+
+
+def test_teachers_0():
+    assert get_teacher_key("Иванов И.И.") == "иванов ии"
+    assert get_teacher_key("Иванов И. И.") == "иванов ии"
+    assert get_teacher_key("иванов и и") == "иванов ии"
+    assert get_teacher_key("И.И. Иванов") == "иванов ии"
+    assert get_teacher_key("Иванов Иван Иванович") == "иванов ии"
+    assert get_teacher_key("Новосёлова Е.В.") == "новоселова ев"
+    assert get_teacher_key("Эйстрих-Геллер В.Ю.") == "эйстрих-геллер вю"
+    assert get_teacher_key("Рогачев") == "рогачев"
+    assert get_teacher_key("Иванов И.П.") != "иванов ии"
+
+
+def test_teachers_1():
+    # IDs do not depend on the process (e.g. on the hash seed)
+    assert get_teacher_id("иванов ии") == get_teacher_id("иванов ии")
+    assert get_teacher_id("иванов ии") != get_teacher_id("иванов ип")
+    assert 0 <= get_teacher_id("иванов ии") < 2**63
+
+
+def test_teachers_2():
+    registry = TeacherRegistry()
+    registry.add_all(
+        ["Новосёлова Е.В.", "Иванов И.И.", "", "Новоселова Е. В.", "Иванов И.П."]
+    )
+
+    teachers = registry.get_teachers()
+
+    assert [teacher.name for teacher in teachers] == [
+        "Новосёлова Е.В.",
+        "Иванов И.И.",
+        "Иванов И.П.",
+    ]
+    assert len(registry) == 3
+    assert registry.get("Новоселова Е. В.") is teachers[0]
+    assert registry.get_by_id(teachers[1].id) is teachers[1]
+    assert registry.get_variants(teachers[0]) == ["Новосёлова Е.В.", "Новоселова Е. В."]
+
+
+def test_teachers_3():
+    first, second = TeacherRegistry(), TeacherRegistry()
+
+    # Teachers are compared by the IDs, so the records of different registries are equal
+    assert first.get("Иванов И.И.") == second.get("иванов и. и.")
+    assert first.get("Иванов И.И.") == Teacher(first.get("Иванов И.И.").id, "")
+    assert len({first.get("Иванов И.И."), second.get("Иванов Иван Иванович")}) == 1
+
+    with pytest.raises(ValueError):
+        first.get(" . ")
@@ -0,0 +1,103 @@
+import pytest
+
+from rtu_schedule_parser import ExcelScheduleParser, Lesson
+from rtu_schedule_parser.constants import Degree, ExamType, Institute, ScheduleType
+from rtu_schedule_parser.exams_excel_parser import ExcelExamScheduleParser
+from rtu_schedule_parser.schedule import Exam
+from rtu_schedule_parser.utils import Period
+from rtu_schedule_parser.utils.academic_calendar import MAX_WEEKS
+from rtu_schedule_parser.utils.workbook_generator import (
+    ContentMix,
+    generate_exam_workbook,
+    generate_semester_workbook,
+    get_group_name,
+)
+
+
+def parse(path, schedule_type=ScheduleType.SEMESTER):
+    if schedule_type == ScheduleType.EXAM_SESSION:
+        parser = ExcelExamScheduleParser(
+            path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+        )
+    else:
+        parser = ExcelScheduleParser(
+            path, Period(2022, 2023, 1), Institute.III, Degree.BACHELOR
+        )
+
+    return parser.parse()
+
+
+def test_workbook_generator_0(tmp_path):
+    path = str(tmp_path / "semester.xlsx")
+    generate_semester_workbook(path, groups=25, groups_per_sheet=10)
+
+    schedule_data = parse(path)
+
+    assert schedule_data.get_groups() == [get_group_name(i) for i in range(25)]
+
+    for schedule in schedule_data.get_schedule():
+        # Two rows (I and II weeks) for 7 lessons of 6 weekdays
+        assert len({(item.weekday, item.num) for item in schedule.lessons}) == 42
+
+        for lesson in schedule.lessons:
+            if type(lesson) is Lesson:
+                assert lesson.weeks
+                assert all(1 <= week <= MAX_WEEKS for week in lesson.weeks)
+                # All weeks of the lesson have the same parity
+                assert len({week % 2 for week in lesson.weeks}) == 1
+                assert lesson.teachers
+                assert lesson.room is not None
+
+
+def test_workbook_generator_1(tmp_path):
+    path = str(tmp_path / "semester.xlsx")
+    generate_semester_workbook(
+        path,
+        groups=10,
+        mix=ContentMix(
+            empty=0.0,
+            weeks=0.0,
+            excluded_weeks=0.0,
+            subgroups=1.0,
+            multiple_lessons=0.0,
+        ),
+    )
+
+    schedule_data = parse(path)
+
+    for schedule in schedule_data.get_schedule():
+        assert all(type(lesson) is Lesson for lesson in schedule.lessons)
+        assert {lesson.subgroup for lesson in schedule.lessons} == {1, 2}
+
+
+def test_workbook_generator_2(tmp_path):
+    first, second = str(tmp_path / "first.xlsx"), str(tmp_path / "second.xlsx")
+    generate_semester_workbook(first, groups=5, seed=1)
+    generate_semester_workbook(second, groups=5, seed=1)
+
+    assert parse(first).get_schedule() == parse(second).get_schedule()
+
+
+def test_workbook_generator_3(tmp_path):
+    path = str(tmp_path / "exams.xlsx")
+    generate_exam_workbook(
+        path, groups=30, groups_per_sheet=8, exams=3, mix=ContentMix(multiple_rooms=1.0)
+    )
+
+    schedule_data = parse(path, ScheduleType.EXAM_SESSION)
+
+    assert schedule_data.get_groups() == [get_group_name(i) for i in range(30)]
+
+    for schedule in schedule_data.get_schedule():
+        exams = [exam for exam in schedule.exams if type(exam) is Exam]
+
+        assert [exam.exam_type for exam in exams] == [
+            ExamType.CONSULTATION,
+            ExamType.EXAMINATION,
+        ] * 3
+        assert all(len(exam.rooms) == 2 and exam.teachers for exam in exams)
+
+
+def test_workbook_generator_4(tmp_path):
+    with pytest.raises(ValueError):
+        generate_exam_workbook(str(tmp_path / "exams.xlsx"), exams=10, days=10)